@@ -40,6 +40,7 @@ from openhands.agent_server.tool_router import tool_router
 from openhands.agent_server.vscode_router import vscode_router
 from openhands.agent_server.vscode_service import get_vscode_service
 from openhands.sdk.logger import DEBUG, get_logger
+from openhands.sdk.utils.http_pool import configure_http_pools
 
 
 logger = get_logger(__name__)
@@ -355,6 +356,7 @@ def create_app(config: Config | None = None) -> FastAPI:
     """
     if config is None:
         config = get_default_config()
+    configure_http_pools(config.http_pool)
     app = _create_fastapi_instance(config)
     app.state.config = config
 
@@ -7,6 +7,7 @@ from pydantic import BaseModel, ConfigDict, Field, SecretStr
 
 from openhands.agent_server.env_parser import from_env
 from openhands.sdk.utils.cipher import Cipher
+from openhands.sdk.utils.http_pool import HTTPPoolConfig
 
 
 # Environment variable constants
@@ -112,6 +113,54 @@ class Config(BaseModel):
             "The location of the directory where conversations and events are stored."
         ),
     )
+    enable_body_index: bool = Field(
+        default=False,
+        description=(
+            "Whether to maintain a persistent full-text index of each conversation's "
+            "message text to speed up event searches filtered by body."
+        ),
+    )
+    enable_conversation_catalog: bool = Field(
+        default=False,
+        description=(
+            "Whether to keep a catalog of conversation metadata (status, timestamps, "
+            "title and agent kind) in the conversations directory, so conversations "
+            "can be listed, filtered, sorted and counted without loading them."
+        ),
+    )
+    lazy_load_conversations: bool = Field(
+        default=False,
+        description=(
+            "Whether to only index stored conversations at startup and start each "
+            "one on first access, instead of starting all of them at startup."
+        ),
+    )
+    conversation_idle_ttl: float | None = Field(
+        default=None,
+        gt=0,
+        description=(
+            "With lazy_load_conversations, the number of seconds after which a "
+            "loaded conversation that is not running and has no connected clients "
+            "is unloaded. Unset to keep conversations loaded."
+        ),
+    )
+    max_loaded_conversations: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "With lazy_load_conversations, the maximum number of conversations to "
+            "keep loaded. Least recently used idle conversations are unloaded first."
+        ),
+    )
+    max_loaded_conversations_memory_mb: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "With lazy_load_conversations, the maximum memory in MB used by the "
+            "cached events of loaded conversations before least recently used idle "
+            "conversations are unloaded."
+        ),
+    )
     bash_events_dir: Path = Field(
         default=Path("workspace/bash_events"),
         description=(
@@ -131,6 +180,13 @@ class Config(BaseModel):
         default_factory=list,
         description="Webhooks to invoke in response to events",
     )
+    http_pool: HTTPPoolConfig = Field(
+        default_factory=HTTPPoolConfig,
+        description=(
+            "Limits for the connection pools shared by all LLM, critic and "
+            "security analyzer HTTP clients in this process."
+        ),
+    )
     enable_vscode: bool = Field(
         default=True,
         description="Whether to enable VSCode server functionality",
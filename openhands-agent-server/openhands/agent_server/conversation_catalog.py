@@ -0,0 +1,251 @@
+"""On-disk catalog of conversation metadata.
+
+Used by ConversationService to list, filter, sort and count conversations
+without loading them or composing a ConversationInfo for each one.
+"""
+
+import sqlite3
+import threading
+from collections.abc import Collection, Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from uuid import UUID
+
+from openhands.agent_server.models import ConversationSortOrder, StoredConversation
+from openhands.sdk import Agent
+from openhands.sdk.conversation.state import ConversationExecutionStatus
+
+
+CATALOG_FILE = "catalog.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversations (
+    id TEXT PRIMARY KEY,
+    execution_status TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    title TEXT,
+    agent_kind TEXT NOT NULL,
+    is_v1 INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS conversations_created_at
+    ON conversations (created_at);
+CREATE INDEX IF NOT EXISTS conversations_updated_at
+    ON conversations (updated_at);
+CREATE INDEX IF NOT EXISTS conversations_execution_status
+    ON conversations (execution_status);
+"""
+
+# Sort column and whether it is descending, for each sort order
+_SORT_COLUMNS: dict[ConversationSortOrder, tuple[str, bool]] = {
+    ConversationSortOrder.CREATED_AT: ("created_at", False),
+    ConversationSortOrder.CREATED_AT_DESC: ("created_at", True),
+    ConversationSortOrder.UPDATED_AT: ("updated_at", False),
+    ConversationSortOrder.UPDATED_AT_DESC: ("updated_at", True),
+}
+
+# (execution_status, created_at, updated_at, title, agent_kind, is_v1)
+_Row = tuple[str | None, float, float, str | None, str, int]
+
+
+def _row(
+    stored: StoredConversation, execution_status: ConversationExecutionStatus | None
+) -> _Row:
+    return (
+        execution_status.value if execution_status is not None else None,
+        stored.created_at.timestamp(),
+        stored.updated_at.timestamp(),
+        stored.title,
+        stored.agent.kind,
+        int(isinstance(stored.agent, Agent)),
+    )
+
+
+class ConversationCatalog:
+    """SQLite table of conversation id, status, timestamps, title and agent kind.
+
+    Rows are written through only when they change; the last written values are
+    mirrored in memory for that check. A status of None means "unchanged" on
+    upsert. Ties in the sort column keep the order in which conversations were
+    first cataloged, in both directions, like a stable sort would.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._rows: dict[UUID, _Row] = {
+            UUID(hex=id): tuple(row)  # type: ignore[misc]
+            for id, *row in self._conn.execute(
+                "SELECT id, execution_status, created_at, updated_at, title, "
+                "agent_kind, is_v1 FROM conversations"
+            )
+        }
+
+    def statuses(self) -> dict[UUID, ConversationExecutionStatus | None]:
+        """The cataloged execution status of every conversation."""
+        with self._lock:
+            return {
+                id: ConversationExecutionStatus(row[0]) if row[0] else None
+                for id, row in self._rows.items()
+            }
+
+    def upsert(
+        self,
+        stored: StoredConversation,
+        execution_status: ConversationExecutionStatus | None = None,
+    ) -> None:
+        self.upsert_many([(stored, execution_status)])
+
+    def upsert_many(
+        self,
+        entries: Iterable[
+            tuple[StoredConversation, ConversationExecutionStatus | None]
+        ],
+    ) -> None:
+        """Write the entries that differ from the catalog in a single transaction."""
+        with self._lock:
+            changed: list[tuple[UUID, _Row]] = []
+            for stored, execution_status in entries:
+                row = _row(stored, execution_status)
+                previous = self._rows.get(stored.id)
+                if previous is not None and row[0] is None:
+                    row = (previous[0],) + row[1:]
+                if row != previous:
+                    changed.append((stored.id, row))
+            if not changed:
+                return
+            with self._transaction():
+                self._conn.executemany(
+                    "INSERT INTO conversations (id, execution_status, created_at, "
+                    "updated_at, title, agent_kind, is_v1) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (id) DO UPDATE SET "
+                    "execution_status = excluded.execution_status, "
+                    "created_at = excluded.created_at, "
+                    "updated_at = excluded.updated_at, "
+                    "title = excluded.title, "
+                    "agent_kind = excluded.agent_kind, "
+                    "is_v1 = excluded.is_v1",
+                    [(id.hex, *row) for id, row in changed],
+                )
+            self._rows.update(changed)
+
+    def set_status(
+        self, conversation_id: UUID, execution_status: ConversationExecutionStatus
+    ) -> None:
+        with self._lock:
+            row = self._rows.get(conversation_id)
+            if row is None or row[0] == execution_status.value:
+                return
+            self._conn.execute(
+                "UPDATE conversations SET execution_status = ? WHERE id = ?",
+                (execution_status.value, conversation_id.hex),
+            )
+            self._rows[conversation_id] = (execution_status.value,) + row[1:]
+
+    def remove(self, conversation_id: UUID) -> None:
+        with self._lock:
+            if self._rows.pop(conversation_id, None) is not None:
+                self._conn.execute(
+                    "DELETE FROM conversations WHERE id = ?", (conversation_id.hex,)
+                )
+
+    def retain(self, conversation_ids: Collection[UUID]) -> None:
+        """Remove every conversation that is not in conversation_ids."""
+        with self._lock:
+            stale = [id for id in self._rows if id not in conversation_ids]
+            if not stale:
+                return
+            with self._transaction():
+                self._conn.executemany(
+                    "DELETE FROM conversations WHERE id = ?",
+                    [(id.hex,) for id in stale],
+                )
+            for id in stale:
+                del self._rows[id]
+
+    def search(
+        self,
+        page_id: str | None,
+        limit: int,
+        execution_status: ConversationExecutionStatus | None,
+        sort_order: ConversationSortOrder,
+        *,
+        include_acp: bool,
+    ) -> tuple[list[UUID], str | None]:
+        """Return the ids on the requested page and the next page id, if any.
+
+        Pages start at page_id if it matches the filters, and at the first
+        matching conversation otherwise.
+        """
+        column, descending = _SORT_COLUMNS[sort_order]
+        where, params = self._filters(execution_status, include_acp)
+        with self._lock:
+            start = None
+            if page_id:
+                start = self._conn.execute(
+                    f"SELECT {column}, rowid FROM conversations "
+                    f"WHERE id = ? AND {where}",
+                    (page_id, *params),
+                ).fetchone()
+            if start is not None:
+                where += (
+                    f" AND ({column} {'<' if descending else '>'} ?"
+                    f" OR ({column} = ? AND rowid >= ?))"
+                )
+                params.extend((start[0], start[0], start[1]))
+            rows = self._conn.execute(
+                f"SELECT id FROM conversations WHERE {where} "
+                f"ORDER BY {column} {'DESC' if descending else 'ASC'}, rowid ASC "
+                "LIMIT ?",
+                (*params, limit + 1),
+            ).fetchall()
+        ids = [UUID(hex=id) for id, in rows]
+        next_page_id = ids[limit].hex if len(ids) > limit else None
+        return ids[:limit], next_page_id
+
+    def count(
+        self,
+        execution_status: ConversationExecutionStatus | None,
+        *,
+        include_acp: bool,
+    ) -> int:
+        where, params = self._filters(execution_status, include_acp)
+        with self._lock:
+            (count,) = self._conn.execute(
+                f"SELECT COUNT(*) FROM conversations WHERE {where}", params
+            ).fetchone()
+        return count
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _filters(
+        self,
+        execution_status: ConversationExecutionStatus | None,
+        include_acp: bool,
+    ) -> tuple[str, list]:
+        clauses = ["1"]
+        params: list = []
+        if not include_acp:
+            clauses.append("is_v1 = 1")
+        if execution_status is not None:
+            clauses.append("execution_status = ?")
+            params.append(execution_status.value)
+        return " AND ".join(clauses), params
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        self._conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
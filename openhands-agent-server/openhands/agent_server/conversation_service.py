@@ -1,6 +1,8 @@
 import asyncio
 import importlib
 import logging
+import time
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
@@ -10,6 +12,10 @@ import httpx
 from pydantic import BaseModel
 
 from openhands.agent_server.config import Config, WebhookSpec
+from openhands.agent_server.conversation_catalog import (
+    CATALOG_FILE,
+    ConversationCatalog,
+)
 from openhands.agent_server.event_service import EventService
 from openhands.agent_server.models import (
     ACPConversationInfo,
@@ -26,12 +32,16 @@ from openhands.agent_server.pub_sub import Subscriber
 from openhands.agent_server.server_details_router import update_last_execution_time
 from openhands.agent_server.utils import safe_rmtree, utc_now
 from openhands.sdk import LLM, Agent, Event, Message
+from openhands.sdk.conversation.persistence_const import BASE_STATE
 from openhands.sdk.conversation.state import (
     ConversationExecutionStatus,
     ConversationState,
 )
-from openhands.sdk.event import MessageEvent
-from openhands.sdk.event.conversation_state import ConversationStateUpdateEvent
+from openhands.sdk.event import MessageEvent, ToolOutputEvent
+from openhands.sdk.event.conversation_state import (
+    FULL_STATE_KEY,
+    ConversationStateUpdateEvent,
+)
 from openhands.sdk.utils.cipher import Cipher
 
 
@@ -134,13 +144,38 @@ class ConversationService:
     """
     Conversation service which stores to a local file store. When the context starts
     all event_services are loaded into memory, and stored when it stops.
+
+    With lazy_loading, only each conversation's meta.json is read at startup and
+    its event_service is started on first access. Loaded conversations that are
+    not running and have no client subscribed are evicted after idle_ttl seconds,
+    or least recently used first when more than max_loaded_conversations are
+    loaded or their cached events exceed max_loaded_memory_bytes.
+
+    With enable_catalog, conversation metadata is kept in a ConversationCatalog
+    so that searches and counts only compose info for the conversations on the
+    requested page.
     """
 
     conversations_dir: Path = field()
     webhook_specs: list[WebhookSpec] = field(default_factory=list)
     session_api_key: str | None = field(default=None)
     cipher: Cipher | None = None
+    enable_body_index: bool = False
+    lazy_loading: bool = False
+    idle_ttl: float | None = None
+    max_loaded_conversations: int | None = None
+    max_loaded_memory_bytes: int | None = None
+    enable_catalog: bool = False
     _event_services: dict[UUID, EventService] | None = field(default=None, init=False)
+    # Persisted conversations whose event_service has not been started (lazy mode)
+    _unloaded: dict[UUID, StoredConversation] = field(default_factory=dict, init=False)
+    _state_snapshots: dict[UUID, ConversationState] = field(
+        default_factory=dict, init=False
+    )
+    _last_access: dict[UUID, float] = field(default_factory=dict, init=False)
+    _load_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+    _eviction_task: asyncio.Task | None = field(default=None, init=False)
+    _catalog: ConversationCatalog | None = field(default=None, init=False)
     _conversation_webhook_subscribers: list["ConversationWebhookSubscriber"] = field(
         default_factory=list, init=False
     )
@@ -148,7 +183,7 @@ class ConversationService:
     async def get_conversation(self, conversation_id: UUID) -> ConversationInfo | None:
         if self._event_services is None:
             raise ValueError("inactive_service")
-        event_service = self._event_services.get(conversation_id)
+        event_service = await self._get_event_service(conversation_id)
         if event_service is None:
             return None
         if not _is_v1_conversation(event_service.stored):
@@ -161,7 +196,7 @@ class ConversationService:
     ) -> ACPConversationInfo | None:
         if self._event_services is None:
             raise ValueError("inactive_service")
-        event_service = self._event_services.get(conversation_id)
+        event_service = await self._get_event_service(conversation_id)
         if event_service is None:
             return None
         state = await event_service.get_state()
@@ -216,17 +251,24 @@ class ConversationService:
     ) -> tuple[list[ConversationInfo | ACPConversationInfo], str | None]:
         if self._event_services is None:
             raise ValueError("inactive_service")
+        if self._catalog is not None:
+            return await self._search_catalog(
+                page_id=page_id,
+                limit=limit,
+                execution_status=execution_status,
+                sort_order=sort_order,
+                include_acp=include_acp,
+            )
 
         # Collect all conversations with their info
         all_conversations = []
-        for id, event_service in self._event_services.items():
-            if not include_acp and not _is_v1_conversation(event_service.stored):
+        async for id, stored, state in self._iter_conversation_states():
+            if not include_acp and not _is_v1_conversation(stored):
                 continue
-            state = await event_service.get_state()
             conversation_info = (
-                _compose_acp_conversation_info(event_service.stored, state)
+                _compose_acp_conversation_info(stored, state)
                 if include_acp
-                else _compose_conversation_info_v1(event_service.stored, state)
+                else _compose_conversation_info_v1(stored, state)
             )
             # Apply status filter if provided
             if (
@@ -297,12 +339,14 @@ class ConversationService:
         """Count conversations matching the given filters."""
         if self._event_services is None:
             raise ValueError("inactive_service")
+        if self._catalog is not None:
+            self._sync_catalog()
+            return self._catalog.count(execution_status, include_acp=include_acp)
 
         count = 0
-        for event_service in self._event_services.values():
-            if not include_acp and not _is_v1_conversation(event_service.stored):
+        async for _, stored, state in self._iter_conversation_states():
+            if not include_acp and not _is_v1_conversation(stored):
                 continue
-            state = await event_service.get_state()
 
             # Apply status filter if provided
             if (
@@ -394,7 +438,7 @@ class ConversationService:
         conversation_id = request.conversation_id or uuid4()
         use_acp_contract = isinstance(request, StartACPConversationRequest)
 
-        existing_event_service = self._event_services.get(conversation_id)
+        existing_event_service = await self._get_event_service(conversation_id)
         if (
             existing_event_service is not None
             and not use_acp_contract
@@ -461,6 +505,8 @@ class ConversationService:
             **request.model_dump(mode="json", context={"expose_secrets": True}),
         )
         event_service = await self._start_event_service(stored)
+        self._last_access[conversation_id] = time.monotonic()
+        await self._enforce_limits(keep=conversation_id)
         initial_message = request.initial_message
         if initial_message:
             message = Message(
@@ -485,7 +531,7 @@ class ConversationService:
     async def pause_conversation(self, conversation_id: UUID) -> bool:
         if self._event_services is None:
             raise ValueError("inactive_service")
-        event_service = self._event_services.get(conversation_id)
+        event_service = await self._get_event_service(conversation_id)
         if event_service:
             await event_service.pause()
             # Notify conversation webhooks about the paused conversation
@@ -499,7 +545,7 @@ class ConversationService:
     async def resume_conversation(self, conversation_id: UUID) -> bool:
         if self._event_services is None:
             raise ValueError("inactive_service")
-        event_service = self._event_services.get(conversation_id)
+        event_service = await self._get_event_service(conversation_id)
         if event_service:
             await event_service.start()
         return bool(event_service)
@@ -507,7 +553,11 @@ class ConversationService:
     async def delete_conversation(self, conversation_id: UUID) -> bool:
         if self._event_services is None:
             raise ValueError("inactive_service")
-        event_service = self._event_services.pop(conversation_id, None)
+        event_service = await self._get_event_service(conversation_id)
+        self._event_services.pop(conversation_id, None)
+        self._last_access.pop(conversation_id, None)
+        if self._catalog is not None:
+            self._catalog.remove(conversation_id)
         if event_service:
             # Notify conversation webhooks about the stopped conversation before closing
             try:
@@ -559,7 +609,7 @@ class ConversationService:
         """
         if self._event_services is None:
             raise ValueError("inactive_service")
-        event_service = self._event_services.get(conversation_id)
+        event_service = await self._get_event_service(conversation_id)
         if event_service is None:
             return False
 
@@ -583,9 +633,7 @@ class ConversationService:
         return True
 
     async def get_event_service(self, conversation_id: UUID) -> EventService | None:
-        if self._event_services is None:
-            raise ValueError("inactive_service")
-        return self._event_services.get(conversation_id)
+        return await self._get_event_service(conversation_id)
 
     async def generate_conversation_title(
         self, conversation_id: UUID, max_length: int = 50, llm: LLM | None = None
@@ -593,7 +641,7 @@ class ConversationService:
         """Generate a title for the conversation using LLM."""
         if self._event_services is None:
             raise ValueError("inactive_service")
-        event_service = self._event_services.get(conversation_id)
+        event_service = await self._get_event_service(conversation_id)
         if event_service is None:
             return None
 
@@ -605,7 +653,7 @@ class ConversationService:
         """Ask the agent a simple question without affecting conversation state."""
         if self._event_services is None:
             raise ValueError("inactive_service")
-        event_service = self._event_services.get(conversation_id)
+        event_service = await self._get_event_service(conversation_id)
         if event_service is None:
             return None
 
@@ -617,7 +665,7 @@ class ConversationService:
         """Force condensation of the conversation history."""
         if self._event_services is None:
             raise ValueError("inactive_service")
-        event_service = self._event_services.get(conversation_id)
+        event_service = await self._get_event_service(conversation_id)
         if event_service is None:
             return False
 
@@ -625,9 +673,255 @@ class ConversationService:
         await event_service.condense()
         return True
 
+    async def _get_event_service(self, conversation_id: UUID) -> EventService | None:
+        """Return the conversation's event_service, starting it if it is not loaded."""
+        event_services = self._event_services
+        if event_services is None:
+            raise ValueError("inactive_service")
+        event_service = event_services.get(conversation_id)
+        if event_service is None and conversation_id in self._unloaded:
+            async with self._load_lock:
+                event_service = event_services.get(conversation_id)
+                stored = self._unloaded.pop(conversation_id, None)
+                if event_service is None and stored is not None:
+                    self._state_snapshots.pop(conversation_id, None)
+                    try:
+                        event_service = await self._resume_event_service(stored)
+                    except Exception:
+                        logger.exception(
+                            f"error_loading_event_service:{conversation_id}",
+                            stack_info=True,
+                        )
+                        return None
+        if event_service is not None:
+            self._last_access[conversation_id] = time.monotonic()
+            await self._enforce_limits(keep=conversation_id)
+        return event_service
+
+    async def _iter_conversation_states(
+        self,
+    ) -> AsyncIterator[tuple[UUID, StoredConversation, ConversationState]]:
+        """Yield (id, stored, state) for every conversation.
+
+        Conversations that are not loaded are reported from their persisted state
+        rather than being started.
+        """
+        if self._event_services is None:
+            raise ValueError("inactive_service")
+        for id, event_service in list(self._event_services.items()):
+            yield id, event_service.stored, await event_service.get_state()
+        for id, stored in list(self._unloaded.items()):
+            state = self._get_state_snapshot(stored)
+            if state is not None:
+                yield id, stored, state
+
+    async def _search_catalog(
+        self,
+        page_id: str | None,
+        limit: int,
+        execution_status: ConversationExecutionStatus | None,
+        sort_order: ConversationSortOrder,
+        *,
+        include_acp: bool,
+    ) -> tuple[list[ConversationInfo | ACPConversationInfo], str | None]:
+        """Page through the catalog, composing info only for the page's items."""
+        event_services = self._event_services
+        assert self._catalog is not None and event_services is not None
+        self._sync_catalog()
+        ids, next_page_id = self._catalog.search(
+            page_id, limit, execution_status, sort_order, include_acp=include_acp
+        )
+        items: list[ConversationInfo | ACPConversationInfo] = []
+        for id in ids:
+            event_service = event_services.get(id)
+            if event_service is not None:
+                stored = event_service.stored
+                state = await event_service.get_state()
+            elif (stored := self._unloaded.get(id)) is not None:
+                state = self._get_state_snapshot(stored)
+                if state is None:
+                    continue
+            else:
+                continue
+            items.append(
+                _compose_acp_conversation_info(stored, state)
+                if include_acp
+                else _compose_conversation_info_v1(stored, state)
+            )
+        return items, next_page_id
+
+    def _sync_catalog(self) -> None:
+        """Write the in-memory status and metadata of loaded conversations (e.g.
+        updated_at, which changes with every event) to the catalog."""
+        if self._catalog is None or not self._event_services:
+            return
+        self._catalog.upsert_many(
+            (event_service.stored, event_service.get_execution_status())
+            for event_service in self._event_services.values()
+        )
+
+    def _get_state_snapshot(
+        self, stored: StoredConversation
+    ) -> ConversationState | None:
+        state = self._state_snapshots.get(stored.id)
+        if state is None:
+            state = self._read_state(stored)
+        if state is not None:
+            self._state_snapshots[stored.id] = state
+        return state
+
+    def _read_state(self, stored: StoredConversation) -> ConversationState | None:
+        try:
+            base_state = self.conversations_dir / stored.id.hex / BASE_STATE
+            state = ConversationState.model_validate_json(
+                base_state.read_text(),
+                context={"cipher": self.cipher} if self.cipher else None,
+            )
+        except Exception:
+            logger.exception(f"error_reading_conversation_state:{stored.id}")
+            return None
+        # Mirrors EventService.start: a conversation that is not loaded cannot be
+        # running, and will be flagged as errored once it is.
+        if state.execution_status == ConversationExecutionStatus.RUNNING:
+            state.execution_status = ConversationExecutionStatus.ERROR
+        return state
+
+    def _get_unloaded_status(
+        self,
+        stored: StoredConversation,
+        cataloged_status: ConversationExecutionStatus | None,
+    ) -> ConversationExecutionStatus | None:
+        """Status of a conversation that is not loaded, reading its persisted state
+        only if the catalog does not already know it."""
+        if cataloged_status is None:
+            state = self._read_state(stored)
+            return state.execution_status if state else None
+        if cataloged_status == ConversationExecutionStatus.RUNNING:
+            # As in _read_state, it cannot still be running
+            return ConversationExecutionStatus.ERROR
+        return cataloged_status
+
+    def _is_evictable(self, event_service: EventService) -> bool:
+        """Idle conversations have nothing running and only internal subscribers."""
+        return not event_service.is_running() and all(
+            isinstance(subscriber, _INTERNAL_SUBSCRIBER_TYPES)
+            for subscriber in event_service.get_subscribers()
+        )
+
+    async def _evict(self, conversation_id: UUID) -> None:
+        event_services = self._event_services
+        if event_services is None:
+            return
+        event_service = event_services.pop(conversation_id, None)
+        self._last_access.pop(conversation_id, None)
+        if event_service is None:
+            return
+        self._unloaded[conversation_id] = event_service.stored
+        logger.info(f"Unloading idle conversation {conversation_id}")
+        # This stops the conversation and saves meta
+        await event_service.__aexit__(None, None, None)
+
+    async def _enforce_limits(self, keep: UUID | None = None) -> None:
+        """Evict least recently used idle conversations while over the limits."""
+        event_services = self._event_services
+        if not self.lazy_loading or event_services is None:
+            return
+
+        def over_limits() -> bool:
+            if (
+                self.max_loaded_conversations is not None
+                and len(event_services) > self.max_loaded_conversations
+            ):
+                return True
+            return self.max_loaded_memory_bytes is not None and (
+                sum(s.get_cached_event_bytes() for s in event_services.values())
+                > self.max_loaded_memory_bytes
+            )
+
+        if not over_limits():
+            return
+        candidates = sorted(
+            (
+                id
+                for id, event_service in event_services.items()
+                if id != keep and self._is_evictable(event_service)
+            ),
+            key=lambda id: self._last_access.get(id, 0.0),
+        )
+        for id in candidates:
+            if not over_limits():
+                break
+            await self._evict(id)
+
+    async def _evict_idle(self) -> None:
+        """Evict conversations that have not been accessed for idle_ttl seconds."""
+        event_services = self._event_services
+        if self.idle_ttl is None or event_services is None:
+            return
+        now = time.monotonic()
+        for id, event_service in list(event_services.items()):
+            if not self._is_evictable(event_service):
+                # Busy conversations count as accessed until they go idle
+                self._last_access[id] = now
+            elif now - self._last_access.get(id, 0.0) >= self.idle_ttl:
+                await self._evict(id)
+
+    async def _run_idle_eviction(self) -> None:
+        assert self.idle_ttl is not None
+        while True:
+            await asyncio.sleep(min(self.idle_ttl, 60.0))
+            try:
+                await self._evict_idle()
+            except Exception:
+                logger.exception("error_evicting_idle_conversations")
+
+    async def _resume_event_service(self, stored: StoredConversation) -> EventService:
+        """Register the tools and agents of a persisted conversation and start it."""
+        # Dynamically register tools when resuming persisted conversations
+        if stored.tool_module_qualnames:
+            for (
+                tool_name,
+                module_qualname,
+            ) in stored.tool_module_qualnames.items():
+                try:
+                    # Import the module to trigger tool auto-registration
+                    importlib.import_module(module_qualname)
+                    logger.debug(
+                        f"Tool '{tool_name}' registered via module "
+                        f"'{module_qualname}' when resuming conversation "
+                        f"{stored.id}"
+                    )
+                except ImportError as e:
+                    logger.warning(
+                        f"Failed to import module '{module_qualname}' for "
+                        f"tool '{tool_name}' when resuming conversation "
+                        f"{stored.id}: {e}. Tool will not be available."
+                    )
+                    # Continue even if some tools fail to register
+            if stored.tool_module_qualnames:
+                logger.info(
+                    f"Dynamically registered "
+                    f"{len(stored.tool_module_qualnames)} tools when "
+                    f"resuming conversation {stored.id}: "
+                    f"{list(stored.tool_module_qualnames.keys())}"
+                )
+        # Register agent definitions when resuming
+        if stored.agent_definitions:
+            _register_agent_definitions(
+                stored.agent_definitions,
+                context=f"resuming conversation {stored.id}",
+            )
+        return await self._start_event_service(stored)
+
     async def __aenter__(self):
         self.conversations_dir.mkdir(parents=True, exist_ok=True)
         self._event_services = {}
+        self._unloaded = {}
+        catalog_statuses = {}
+        unloaded_entries = []
+        if self.enable_catalog:
+            self._catalog = ConversationCatalog(self.conversations_dir / CATALOG_FILE)
+            catalog_statuses = self._catalog.statuses()
         for conversation_dir in self.conversations_dir.iterdir():
             try:
                 meta_file = conversation_dir / "meta.json"
@@ -640,45 +934,29 @@ class ConversationService:
                         "cipher": self.cipher,
                     },
                 )
-                # Dynamically register tools when resuming persisted conversations
-                if stored.tool_module_qualnames:
-                    for (
-                        tool_name,
-                        module_qualname,
-                    ) in stored.tool_module_qualnames.items():
-                        try:
-                            # Import the module to trigger tool auto-registration
-                            importlib.import_module(module_qualname)
-                            logger.debug(
-                                f"Tool '{tool_name}' registered via module "
-                                f"'{module_qualname}' when resuming conversation "
-                                f"{stored.id}"
+                if self.lazy_loading:
+                    self._unloaded[stored.id] = stored
+                    if self._catalog is not None:
+                        unloaded_entries.append(
+                            (
+                                stored,
+                                self._get_unloaded_status(
+                                    stored, catalog_statuses.get(stored.id)
+                                ),
                             )
-                        except ImportError as e:
-                            logger.warning(
-                                f"Failed to import module '{module_qualname}' for "
-                                f"tool '{tool_name}' when resuming conversation "
-                                f"{stored.id}: {e}. Tool will not be available."
-                            )
-                            # Continue even if some tools fail to register
-                    if stored.tool_module_qualnames:
-                        logger.info(
-                            f"Dynamically registered "
-                            f"{len(stored.tool_module_qualnames)} tools when "
-                            f"resuming conversation {stored.id}: "
-                            f"{list(stored.tool_module_qualnames.keys())}"
                         )
-                # Register agent definitions when resuming
-                if stored.agent_definitions:
-                    _register_agent_definitions(
-                        stored.agent_definitions,
-                        context=f"resuming conversation {stored.id}",
-                    )
-                await self._start_event_service(stored)
+                else:
+                    await self._resume_event_service(stored)
             except Exception:
                 logger.exception(
                     f"error_loading_event_service:{conversation_dir}", stack_info=True
                 )
+        if self._catalog is not None:
+            self._catalog.upsert_many(unloaded_entries)
+            # Drop conversations that were deleted or could not be loaded
+            self._catalog.retain(self._event_services.keys() | self._unloaded.keys())
+        if self.lazy_loading and self.idle_ttl is not None:
+            self._eviction_task = asyncio.create_task(self._run_idle_eviction())
 
         # Initialize conversation webhook subscribers
         self._conversation_webhook_subscribers = [
@@ -696,6 +974,9 @@ class ConversationService:
         if event_services is None:
             return
         self._event_services = None
+        if self._eviction_task is not None:
+            self._eviction_task.cancel()
+            self._eviction_task = None
         # This stops conversations and saves meta
         await asyncio.gather(
             *[
@@ -703,6 +984,9 @@ class ConversationService:
                 for event_service in event_services.values()
             ]
         )
+        if self._catalog is not None:
+            self._catalog.close()
+            self._catalog = None
 
     @classmethod
     def get_instance(cls, config: Config) -> "ConversationService":
@@ -713,6 +997,16 @@ class ConversationService:
                 config.session_api_keys[0] if config.session_api_keys else None
             ),
             cipher=config.cipher,
+            enable_body_index=config.enable_body_index,
+            enable_catalog=config.enable_conversation_catalog,
+            lazy_loading=config.lazy_load_conversations,
+            idle_ttl=config.conversation_idle_ttl,
+            max_loaded_conversations=config.max_loaded_conversations,
+            max_loaded_memory_bytes=(
+                config.max_loaded_conversations_memory_mb * 1024 * 1024
+                if config.max_loaded_conversations_memory_mb is not None
+                else None
+            ),
         )
 
     async def _start_event_service(self, stored: StoredConversation) -> EventService:
@@ -724,6 +1018,8 @@ class ConversationService:
             stored=stored,
             conversations_dir=self.conversations_dir,
             cipher=self.cipher,
+            enable_body_index=self.enable_body_index,
+            catalog=self._catalog,
         )
         # Create subscribers...
         await event_service.subscribe_to_events(_EventSubscriber(service=event_service))
@@ -769,6 +1065,14 @@ class _EventSubscriber(Subscriber):
         # conversation activity. This prevents updated_at from being reset
         # on every server restart.
         if isinstance(_event, ConversationStateUpdateEvent):
+            catalog = self.service.catalog
+            if catalog is not None and _event.key in (
+                "execution_status",
+                FULL_STATE_KEY,
+            ):
+                execution_status = self.service.get_execution_status()
+                if execution_status is not None:
+                    catalog.set_status(self.service.stored.id, execution_status)
             return
         self.service.stored.updated_at = utc_now()
         update_last_execution_time()
@@ -814,6 +1118,10 @@ class WebhookSubscriber(Subscriber):
 
     async def __call__(self, event: Event):
         """Add event to queue and post to webhook when buffer size is reached."""
+        # Live tool output is only streamed to connected clients, like it is
+        # only published and not persisted by the conversation
+        if isinstance(event, ToolOutputEvent):
+            return
         self.queue.append(event)
 
         if len(self.queue) >= self.spec.event_buffer_size:
@@ -975,3 +1283,8 @@ def get_default_conversation_service() -> ConversationService:
     config = get_default_config()
     _conversation_service = ConversationService.get_instance(config)
     return _conversation_service
+
+
+# Subscribers the service attaches to every conversation; any other subscriber
+# (e.g. a websocket client) keeps a conversation from being unloaded.
+_INTERNAL_SUBSCRIBER_TYPES = (_EventSubscriber, AutoTitleSubscriber, WebhookSubscriber)
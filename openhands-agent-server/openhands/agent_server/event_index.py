@@ -0,0 +1,357 @@
+"""Secondary indexes over a conversation's events.
+
+Used by EventService to serve paged search and count requests without
+deserializing and sorting every event of the conversation on each request.
+"""
+
+import json
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Callable, Collection, Iterator, Sequence
+from pathlib import Path
+
+from openhands.sdk import Event, get_logger
+from openhands.sdk.event import EventID, MessageEvent
+from openhands.sdk.llm.message import content_to_str
+
+
+logger = get_logger(__name__)
+
+BODY_INDEX_FILE = "body_index.jsonl"
+
+
+def _event_kind(event: Event) -> str:
+    """The fully qualified class name used by the `kind` search filter."""
+    return f"{event.__class__.__module__}.{event.__class__.__name__}"
+
+
+def event_body_text(event: Event) -> str | None:
+    """Lower-cased text matched by the `body` search filter, or None if the event
+    has no body (only message events do)."""
+    if not isinstance(event, MessageEvent):
+        return None
+    text_parts = content_to_str(event.llm_message.content)
+    if event.extended_content:
+        text_parts.extend(content_to_str(event.extended_content))
+    if event.reasoning_content:
+        text_parts.append(event.reasoning_content)
+    return " ".join(text_parts).lower()
+
+
+# Sorted (timestamp, position) entries. Timestamps are ISO strings, which compare
+# chronologically, and the position breaks ties in append order.
+_TimestampIndex = list[tuple[str, int]]
+
+
+class EventIndex:
+    """Indexes events by kind, source and timestamp, plus an id -> position map.
+
+    The index is brought up to date lazily by `sync`, which only reads events
+    appended since the previous call. If the event sequence is replaced or
+    shrinks, the index is rebuilt.
+
+    Results follow the semantics of a full scan: filter, stable sort by
+    timestamp (ties keep append order in both directions), then paginate from
+    `page_id` if it is part of the result set and from the start otherwise.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._reset(None)
+
+    def _reset(self, events: Sequence[Event] | None) -> None:
+        self._events: Sequence[Event] | None = events
+        self._ids: list[EventID] = []
+        self._positions: dict[EventID, int] = {}
+        self._kinds: list[str] = []
+        self._sources: list[str] = []
+        self._timestamps: list[str] = []
+        self._by_timestamp: _TimestampIndex = []
+        self._by_kind: dict[str, _TimestampIndex] = {}
+        self._by_source: dict[str, _TimestampIndex] = {}
+
+    def sync(self, events: Sequence[Event]) -> None:
+        """Fold in events appended since the last call."""
+        with self._lock:
+            if events is not self._events or len(events) < len(self._ids):
+                self._reset(events)
+            start = len(self._ids)
+            if len(events) > start:
+                for position, event in enumerate(events[start:], start):
+                    self._add(position, event)
+
+    def _add(self, position: int, event: Event) -> None:
+        kind = _event_kind(event)
+        entry = (event.timestamp, position)
+        self._ids.append(event.id)
+        self._positions.setdefault(event.id, position)
+        self._kinds.append(kind)
+        self._sources.append(event.source)
+        self._timestamps.append(event.timestamp)
+        # Events normally arrive in timestamp order, so these insert at the end
+        insort(self._by_timestamp, entry)
+        insort(self._by_kind.setdefault(kind, []), entry)
+        insort(self._by_source.setdefault(event.source, []), entry)
+
+    def search(
+        self,
+        events: Sequence[Event],
+        *,
+        page_id: str | None = None,
+        limit: int = 100,
+        kind: str | None = None,
+        source: str | None = None,
+        descending: bool = False,
+        timestamp_gte: str | None = None,
+        timestamp_lt: str | None = None,
+        predicate: Callable[[Event], bool] | None = None,
+        positions: Collection[int] | None = None,
+    ) -> tuple[list[Event], str | None]:
+        """Return one page of matching events and the id of the next one.
+
+        Only events that pass the indexed filters are loaded from `events`, and
+        only when `predicate` needs to inspect them or they are on the page.
+        If `positions` is given, only events at those positions are considered.
+        """
+        with self._lock:
+            self.sync(events)
+            base, check_kind, check_source = self._plan(kind, source, positions)
+            lo, hi = self._range(base, timestamp_gte, timestamp_lt)
+
+            start: tuple[str, int] | None = None
+            if page_id is not None:
+                position = self._positions.get(page_id)
+                if position is not None:
+                    entry = (self._timestamps[position], position)
+                    start_index = bisect_left(base, entry, lo, hi)
+                    if (
+                        start_index < hi
+                        and base[start_index] == entry
+                        and self._matches(position, check_kind, check_source)
+                        and (predicate is None or predicate(events[position]))
+                    ):
+                        start = entry
+
+            items: list[Event] = []
+            next_page_id: str | None = None
+            for position in self._iter(base, lo, hi, descending, start):
+                if not self._matches(position, check_kind, check_source):
+                    continue
+                event = None
+                if predicate is not None:
+                    event = events[position]
+                    if not predicate(event):
+                        continue
+                if len(items) >= limit:
+                    next_page_id = self._ids[position]
+                    break
+                items.append(event if event is not None else events[position])
+            return items, next_page_id
+
+    def count(
+        self,
+        events: Sequence[Event],
+        *,
+        kind: str | None = None,
+        source: str | None = None,
+        timestamp_gte: str | None = None,
+        timestamp_lt: str | None = None,
+        predicate: Callable[[Event], bool] | None = None,
+        positions: Collection[int] | None = None,
+    ) -> int:
+        """Count matching events; O(log n) unless both kind and source (or a
+        predicate) are given."""
+        with self._lock:
+            self.sync(events)
+            base, check_kind, check_source = self._plan(kind, source, positions)
+            lo, hi = self._range(base, timestamp_gte, timestamp_lt)
+            if not (check_kind or check_source or predicate):
+                return hi - lo
+            return sum(
+                1
+                for _, position in base[lo:hi]
+                if self._matches(position, check_kind, check_source)
+                and (predicate is None or predicate(events[position]))
+            )
+
+    def _plan(
+        self,
+        kind: str | None,
+        source: str | None,
+        positions: Collection[int] | None = None,
+    ) -> tuple[_TimestampIndex, str | None, str | None]:
+        """Pick the smallest index to scan; return it with the filters that still
+        have to be checked per event."""
+        if positions is not None:
+            base = sorted(
+                (self._timestamps[p], p) for p in positions if p < len(self._ids)
+            )
+            return base, kind, source
+        base = self._by_timestamp
+        check_kind, check_source = kind, source
+        if kind is not None:
+            base, check_kind = self._by_kind.get(kind, []), None
+        if source is not None:
+            by_source = self._by_source.get(source, [])
+            if len(by_source) < len(base):
+                base, check_kind, check_source = by_source, kind, None
+        return base, check_kind, check_source
+
+    @staticmethod
+    def _range(
+        base: _TimestampIndex, timestamp_gte: str | None, timestamp_lt: str | None
+    ) -> tuple[int, int]:
+        # (ts,) sorts before every (ts, position) entry with the same timestamp
+        lo = bisect_left(base, (timestamp_gte,)) if timestamp_gte is not None else 0
+        hi = (
+            bisect_left(base, (timestamp_lt,))
+            if timestamp_lt is not None
+            else len(base)
+        )
+        return lo, max(lo, hi)
+
+    def _matches(
+        self, position: int, check_kind: str | None, check_source: str | None
+    ) -> bool:
+        if check_kind is not None and self._kinds[position] != check_kind:
+            return False
+        if check_source is not None and self._sources[position] != check_source:
+            return False
+        return True
+
+    @staticmethod
+    def _iter(
+        base: _TimestampIndex,
+        lo: int,
+        hi: int,
+        descending: bool,
+        start: tuple[str, int] | None,
+    ) -> Iterator[int]:
+        """Yield positions in sort order, beginning at `start` if given."""
+        if not descending:
+            first = bisect_left(base, start, lo, hi) if start is not None else lo
+            for i in range(first, hi):
+                yield base[i][1]
+            return
+
+        # Descending by timestamp, but a stable sort keeps equal timestamps in
+        # append order, so walk timestamp groups backwards and each group forwards.
+        end = hi
+        group_first = None
+        if start is not None:
+            end = bisect_right(base, (start[0], float("inf")), lo, hi)
+            group_first = bisect_left(base, start, lo, end)
+        while end > lo:
+            timestamp = base[end - 1][0]
+            group_start = bisect_left(base, (timestamp,), lo, end)
+            first = group_start if group_first is None else group_first
+            group_first = None
+            for i in range(first, end):
+                yield base[i][1]
+            end = group_start
+
+
+class BodyIndex:
+    """Trigram index over event body text, narrowing the `body` search filter.
+
+    Maps every three-character substring of an event's lower-cased body to the
+    positions of the events containing it. Any event matching a query of three or
+    more characters contains all of the query's trigrams, so intersecting their
+    posting sets yields a superset of the matches; callers verify candidates with
+    the exact substring check.
+
+    Like EventIndex, it catches up lazily with appended events. If `path` is
+    given, entries are appended to that JSONL file as they are indexed and
+    replayed on startup, so only events appended since the last run are read.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._lock = threading.Lock()
+        self._path = path
+        self._loaded = path is None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._consumed = 0
+        self._last_entry: tuple[int, EventID] | None = None
+        self._grams: dict[str, set[int]] = {}
+
+    def candidates(self, events: Sequence[Event], body: str) -> set[int] | None:
+        """Positions of events that may match `body`, or None if the query is too
+        short for the index to narrow it down."""
+        query = body.lower()
+        if len(query) < 3:
+            return None
+        with self._lock:
+            self._sync(events)
+            postings = sorted(
+                (self._grams.get(gram, set()) for gram in _trigrams(query)), key=len
+            )
+        return set.intersection(*postings)
+
+    def _sync(self, events: Sequence[Event]) -> None:
+        if not self._loaded:
+            self._load(events)
+            self._loaded = True
+        if self._consumed > len(events):
+            # The event sequence was replaced or truncated
+            self._rebuild()
+        if len(events) == self._consumed:
+            return
+
+        lines = []
+        for position, event in enumerate(events[self._consumed :], self._consumed):
+            text = event_body_text(event)
+            if not text:
+                continue
+            grams = _trigrams(text)
+            self._add(position, event.id, grams)
+            lines.append(
+                json.dumps({"position": position, "id": event.id, "grams": grams})
+            )
+        self._consumed = len(events)
+        lines.append(json.dumps({"consumed": self._consumed}))
+        if self._path is not None:
+            with self._path.open("a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+
+    def _add(self, position: int, event_id: EventID, grams: list[str]) -> None:
+        for gram in grams:
+            self._grams.setdefault(gram, set()).add(position)
+        self._last_entry = (position, event_id)
+
+    def _load(self, events: Sequence[Event]) -> None:
+        assert self._path is not None
+        if not self._path.exists():
+            return
+        try:
+            with self._path.open(encoding="utf-8") as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        break  # Torn write; re-index from the last checkpoint
+                    entry = json.loads(line)
+                    if "consumed" in entry:
+                        self._consumed = entry["consumed"]
+                    else:
+                        self._add(entry["position"], entry["id"], entry["grams"])
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.warning(f"Unreadable body index {self._path}; rebuilding")
+            self._rebuild()
+            return
+        # Make sure the file still describes this event log
+        last = self._last_entry
+        if self._consumed > len(events) or (
+            last is not None
+            and (last[0] >= len(events) or events[last[0]].id != last[1])
+        ):
+            logger.warning(f"Stale body index {self._path}; rebuilding")
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._reset()
+        if self._path is not None:
+            self._path.unlink(missing_ok=True)
+
+
+def _trigrams(text: str) -> list[str]:
+    return list({text[i : i + 3] for i in range(len(text) - 2)})
@@ -1,9 +1,17 @@
 import asyncio
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from uuid import UUID
 
+from openhands.agent_server.conversation_catalog import ConversationCatalog
+from openhands.agent_server.event_index import (
+    BODY_INDEX_FILE,
+    BodyIndex,
+    EventIndex,
+    event_body_text,
+)
 from openhands.agent_server.models import (
     ConfirmationResponseRequest,
     EventPage,
@@ -41,11 +49,15 @@ class EventService:
     stored: StoredConversation
     conversations_dir: Path
     cipher: Cipher | None = None
+    enable_body_index: bool = False
+    catalog: ConversationCatalog | None = None
     _conversation: LocalConversation | None = field(default=None, init=False)
     _pub_sub: PubSub[Event] = field(default_factory=lambda: PubSub[Event](), init=False)
     _run_task: asyncio.Task | None = field(default=None, init=False)
     _run_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
     _callback_wrapper: AsyncCallbackWrapper | None = field(default=None, init=False)
+    _event_index: EventIndex = field(default_factory=EventIndex, init=False)
+    _body_index: BodyIndex | None = field(default=None, init=False)
 
     @property
     def conversation_dir(self):
@@ -69,6 +81,8 @@ class EventService:
                 }
             )
         )
+        if self.catalog is not None:
+            self.catalog.upsert(self.stored, self.get_execution_status())
 
     def get_conversation(self):
         if not self._conversation:
@@ -118,60 +132,18 @@ class EventService:
         timestamp_gte_str = timestamp__gte.isoformat() if timestamp__gte else None
         timestamp_lt_str = timestamp__lt.isoformat() if timestamp__lt else None
 
-        # Collect all events
-        all_events = []
-        for event in self._conversation._state.events:
-            # Apply kind filter if provided
-            if (
-                kind is not None
-                and f"{event.__class__.__module__}.{event.__class__.__name__}" != kind
-            ):
-                continue
-
-            # Apply source filter if provided
-            if source is not None and event.source != source:
-                continue
-
-            # Apply body filter if provided (case-insensitive substring match)
-            if body is not None:
-                if not self._event_matches_body(event, body):
-                    continue
-
-            # Apply timestamp filters if provided (ISO string comparison)
-            if timestamp_gte_str is not None and event.timestamp < timestamp_gte_str:
-                continue
-            if timestamp_lt_str is not None and event.timestamp >= timestamp_lt_str:
-                continue
-
-            all_events.append(event)
-
-        # Sort events based on sort_order
-        if sort_order == EventSortOrder.TIMESTAMP:
-            all_events.sort(key=lambda x: x.timestamp)
-        elif sort_order == EventSortOrder.TIMESTAMP_DESC:
-            all_events.sort(key=lambda x: x.timestamp, reverse=True)
-
-        # Handle pagination
-        items = []
-        start_index = 0
-
-        # Find the starting point if page_id is provided
-        if page_id:
-            for i, event in enumerate(all_events):
-                if event.id == page_id:
-                    start_index = i
-                    break
-
-        # Collect items for this page
-        next_page_id = None
-        for i in range(start_index, len(all_events)):
-            if len(items) >= limit:
-                # We have more items, set next_page_id
-                if i < len(all_events):
-                    next_page_id = all_events[i].id
-                break
-            items.append(all_events[i])
-
+        items, next_page_id = self._event_index.search(
+            self._conversation._state.events,
+            page_id=page_id or None,
+            limit=limit,
+            kind=kind,
+            source=source,
+            descending=sort_order == EventSortOrder.TIMESTAMP_DESC,
+            timestamp_gte=timestamp_gte_str,
+            timestamp_lt=timestamp_lt_str,
+            predicate=self._body_predicate(body),
+            positions=self._body_candidates(body),
+        )
         return EventPage(items=items, next_page_id=next_page_id)
 
     async def search_events(
@@ -222,33 +194,15 @@ class EventService:
         timestamp_gte_str = timestamp__gte.isoformat() if timestamp__gte else None
         timestamp_lt_str = timestamp__lt.isoformat() if timestamp__lt else None
 
-        count = 0
-        for event in self._conversation._state.events:
-            # Apply kind filter if provided
-            if (
-                kind is not None
-                and f"{event.__class__.__module__}.{event.__class__.__name__}" != kind
-            ):
-                continue
-
-            # Apply source filter if provided
-            if source is not None and event.source != source:
-                continue
-
-            # Apply body filter if provided (case-insensitive substring match)
-            if body is not None:
-                if not self._event_matches_body(event, body):
-                    continue
-
-            # Apply timestamp filters if provided (ISO string comparison)
-            if timestamp_gte_str is not None and event.timestamp < timestamp_gte_str:
-                continue
-            if timestamp_lt_str is not None and event.timestamp >= timestamp_lt_str:
-                continue
-
-            count += 1
-
-        return count
+        return self._event_index.count(
+            self._conversation._state.events,
+            kind=kind,
+            source=source,
+            timestamp_gte=timestamp_gte_str,
+            timestamp_lt=timestamp_lt_str,
+            predicate=self._body_predicate(body),
+            positions=self._body_candidates(body),
+        )
 
     async def count_events(
         self,
@@ -272,31 +226,21 @@ class EventService:
             timestamp__lt,
         )
 
-    def _event_matches_body(self, event: Event, body: str) -> bool:
-        """Check if event's message content matches body filter (case-insensitive)."""
-        # Import here to avoid circular imports
-        from openhands.sdk.event.llm_convertible.message import MessageEvent
-        from openhands.sdk.llm.message import content_to_str
-
-        # Only check MessageEvent instances for body content
-        if not isinstance(event, MessageEvent):
-            return False
-
-        # Extract text content from the message
-        text_parts = content_to_str(event.llm_message.content)
-
-        # Also check extended content if present
-        if event.extended_content:
-            extended_text_parts = content_to_str(event.extended_content)
-            text_parts.extend(extended_text_parts)
+    def _body_candidates(self, body: str | None) -> set[int] | None:
+        if body is None or self._body_index is None:
+            return None
+        assert self._conversation is not None
+        return self._body_index.candidates(self._conversation._state.events, body)
 
-        # Also check reasoning content if present
-        if event.reasoning_content:
-            text_parts.append(event.reasoning_content)
+    def _body_predicate(self, body: str | None) -> Callable[[Event], bool] | None:
+        if body is None:
+            return None
+        return lambda event: self._event_matches_body(event, body)
 
-        # Combine all text content and perform case-insensitive substring match
-        full_text = " ".join(text_parts).lower()
-        return body.lower() in full_text
+    def _event_matches_body(self, event: Event, body: str) -> bool:
+        """Check if event's message content matches body filter (case-insensitive)."""
+        text = event_body_text(event)
+        return text is not None and body.lower() in text
 
     async def batch_get_events(self, event_ids: list[str]) -> list[Event | None]:
         """Given a list of ids, get events (Or none for any which were not found)"""
@@ -462,6 +406,8 @@ class EventService:
         # Set confirmation mode if enabled
         conversation.set_confirmation_policy(self.stored.confirmation_policy)
         self._conversation = conversation
+        if self.enable_body_index:
+            self._body_index = BodyIndex(self.conversation_dir / BODY_INDEX_FILE)
 
         # Register state change callback to automatically publish updates
         self._conversation._state.set_on_state_change(self._conversation._on_event)
@@ -694,3 +640,20 @@ class EventService:
 
     def is_open(self) -> bool:
         return bool(self._conversation)
+
+    def is_running(self) -> bool:
+        return self._run_task is not None and not self._run_task.done()
+
+    def get_execution_status(self) -> ConversationExecutionStatus | None:
+        if not self._conversation:
+            return None
+        return self._conversation._state.execution_status
+
+    def get_subscribers(self) -> list[Subscriber[Event]]:
+        return self._pub_sub.get_subscribers()
+
+    def get_cached_event_bytes(self) -> int:
+        """Approximate memory held by the conversation's cache of parsed events."""
+        if not self._conversation:
+            return 0
+        return self._conversation._state.events.cache_info()["memory"]
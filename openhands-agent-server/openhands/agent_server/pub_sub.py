@@ -60,6 +60,10 @@ class PubSub[T]:
             )
             return False
 
+    def get_subscribers(self) -> list[Subscriber[T]]:
+        """Return the currently registered subscribers."""
+        return list(self._subscribers.values())
+
     async def __call__(self, event: T) -> None:
         """Invoke all registered callbacks with the given event.
         Each callback is invoked in its own try/catch block to prevent
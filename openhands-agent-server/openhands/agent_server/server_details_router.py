@@ -7,6 +7,8 @@ from importlib.metadata import version
 from fastapi import APIRouter, Response
 from pydantic import BaseModel, Field
 
+from openhands.sdk.utils.http_pool import HTTPPoolStats, get_http_pool_registry
+
 
 server_details_router = APIRouter(prefix="", tags=["Server Details"])
 _start_time = time.time()
@@ -97,3 +99,9 @@ async def get_server_info() -> ServerInfo:
         uptime=int(now - _start_time),
         idle_time=int(now - _last_event_time),
     )
+
+
+@server_details_router.get("/server_info/http_pools")
+async def get_http_pool_stats() -> list[HTTPPoolStats]:
+    """Request and connection counts of the shared outbound HTTP pools."""
+    return get_http_pool_registry().stats()
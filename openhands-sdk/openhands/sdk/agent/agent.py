@@ -1,3 +1,4 @@
+import asyncio
 import json
 from collections.abc import Callable
 from dataclasses import dataclass, field
@@ -10,6 +11,8 @@ from openhands.sdk.agent.base import AgentBase
 from openhands.sdk.agent.critic_mixin import CriticMixin
 from openhands.sdk.agent.parallel_executor import ParallelToolExecutor
 from openhands.sdk.agent.utils import (
+    amake_llm_completion,
+    apply_observation_token_budget,
     fix_malformed_tool_arguments,
     make_llm_completion,
     prepare_llm_messages,
@@ -30,6 +33,7 @@ from openhands.sdk.event import (
     ObservationEvent,
     SystemPromptEvent,
     TokenEvent,
+    ToolOutputEvent,
     UserRejectObservation,
 )
 from openhands.sdk.event.condenser import (
@@ -60,6 +64,8 @@ from openhands.sdk.security.llm_analyzer import LLMSecurityAnalyzer
 from openhands.sdk.tool import (
     Action,
     Observation,
+    ToolOutputStream,
+    streaming_tool_output,
 )
 from openhands.sdk.tool.builtins import (
     FinishAction,
@@ -428,6 +434,63 @@ class Agent(CriticMixin, AgentBase):
         on_event: ConversationCallbackType,
         on_token: ConversationTokenCallbackType | None = None,
     ) -> None:
+        _messages = self._begin_step(conversation, on_event)
+        if _messages is None:
+            return
+
+        try:
+            llm_response = make_llm_completion(
+                self.llm,
+                _messages,
+                tools=list(self.tools_map.values()),
+                on_token=on_token,
+            )
+        except (FunctionCallValidationError, LLMContextWindowExceedError) as e:
+            self._handle_completion_error(e, on_event)
+            return
+
+        self._handle_llm_response(conversation, llm_response, on_event)
+
+    @observe(name="agent.astep", ignore_inputs=["state", "on_event"])
+    async def astep(
+        self,
+        conversation: LocalConversation,
+        on_event: ConversationCallbackType,
+        on_token: ConversationTokenCallbackType | None = None,
+    ) -> None:
+        """Async version of `step` that awaits the LLM request.
+
+        Preparing the messages (which may condense the history) and handling
+        the response (which runs tools) block, so they run in a worker thread.
+        """
+        _messages = await asyncio.to_thread(self._begin_step, conversation, on_event)
+        if _messages is None:
+            return
+
+        try:
+            llm_response = await amake_llm_completion(
+                self.llm,
+                _messages,
+                tools=list(self.tools_map.values()),
+                on_token=on_token,
+            )
+        except (FunctionCallValidationError, LLMContextWindowExceedError) as e:
+            self._handle_completion_error(e, on_event)
+            return
+
+        await asyncio.to_thread(
+            self._handle_llm_response, conversation, llm_response, on_event
+        )
+
+    def _begin_step(
+        self,
+        conversation: LocalConversation,
+        on_event: ConversationCallbackType,
+    ) -> list[Message] | None:
+        """Handle what a step does before sampling the LLM.
+
+        Returns the messages to send, or None if the step is already complete.
+        """
         state = conversation.state
         # Check for pending actions (implicit confirmation)
         # and execute them before sampling new actions.
@@ -438,7 +501,7 @@ class Agent(CriticMixin, AgentBase):
                 len(pending_actions),
             )
             self._execute_actions(conversation, pending_actions, on_event)
-            return
+            return None
 
         # Check if the last user message was blocked by a UserPromptSubmit hook
         # If so, skip processing and mark conversation as finished
@@ -447,7 +510,7 @@ class Agent(CriticMixin, AgentBase):
             if reason is not None:
                 logger.info(f"User message blocked by hook: {reason}")
                 state.execution_status = ConversationExecutionStatus.FINISHED
-                return
+                return None
         elif state.blocked_messages:
             logger.debug(
                 "Blocked messages exist but last_user_message_id is None; "
@@ -456,13 +519,13 @@ class Agent(CriticMixin, AgentBase):
 
         # Prepare LLM messages using the utility function
         _messages_or_condensation = prepare_llm_messages(
-            state.events, condenser=self.condenser, llm=self.llm
+            state.events, condenser=self.condenser, llm=self.llm, view=state.view
         )
 
         # Process condensation event before agent sampels another action
         if isinstance(_messages_or_condensation, Condensation):
             on_event(_messages_or_condensation)
-            return
+            return None
 
         _messages = _messages_or_condensation
 
@@ -470,15 +533,14 @@ class Agent(CriticMixin, AgentBase):
             "Sending messages to LLM: "
             f"{json.dumps([m.model_dump() for m in _messages[1:]], indent=2)}"
         )
+        return _messages
 
-        try:
-            llm_response = make_llm_completion(
-                self.llm,
-                _messages,
-                tools=list(self.tools_map.values()),
-                on_token=on_token,
-            )
-        except FunctionCallValidationError as e:
+    def _handle_completion_error(
+        self,
+        e: FunctionCallValidationError | LLMContextWindowExceedError,
+        on_event: ConversationCallbackType,
+    ) -> None:
+        if isinstance(e, FunctionCallValidationError):
             logger.warning(f"LLM generated malformed function call: {e}")
             error_message = MessageEvent(
                 source="user",
@@ -489,21 +551,28 @@ class Agent(CriticMixin, AgentBase):
             )
             on_event(error_message)
             return
-        except LLMContextWindowExceedError as e:
-            # If condenser is available and handles requests, trigger condensation
-            if (
-                self.condenser is not None
-                and self.condenser.handles_condensation_requests()
-            ):
-                logger.warning(
-                    "LLM raised context window exceeded error, triggering condensation"
-                )
-                on_event(CondensationRequest())
-                return
-            # No condenser available or doesn't handle requests; log helpful warning
-            self._log_context_window_exceeded_warning()
-            raise e
 
+        # If condenser is available and handles requests, trigger condensation
+        if (
+            self.condenser is not None
+            and self.condenser.handles_condensation_requests()
+        ):
+            logger.warning(
+                "LLM raised context window exceeded error, triggering condensation"
+            )
+            on_event(CondensationRequest())
+            return
+        # No condenser available or doesn't handle requests; log helpful warning
+        self._log_context_window_exceeded_warning()
+        raise e
+
+    def _handle_llm_response(
+        self,
+        conversation: LocalConversation,
+        llm_response: LLMResponse,
+        on_event: ConversationCallbackType,
+    ) -> None:
+        state = conversation.state
         # LLMResponse already contains the converted message and metrics snapshot
         message: Message = llm_response.message
 
@@ -881,13 +950,16 @@ class Agent(CriticMixin, AgentBase):
 
         # Execute actions!
         try:
-            if should_enable_observability():
-                tool_name = extract_action_name(action_event)
-                observation: Observation = observe(name=tool_name, span_type="TOOL")(
-                    tool
-                )(action_event.action, conversation)
-            else:
-                observation = tool(action_event.action, conversation)
+            with streaming_tool_output(
+                self._tool_output_stream(conversation, action_event)
+            ):
+                if should_enable_observability():
+                    tool_name = extract_action_name(action_event)
+                    observation: Observation = observe(
+                        name=tool_name, span_type="TOOL"
+                    )(tool)(action_event.action, conversation)
+                else:
+                    observation = tool(action_event.action, conversation)
             assert isinstance(observation, Observation), (
                 f"Tool '{tool.name}' executor must return an Observation"
             )
@@ -903,6 +975,15 @@ class Agent(CriticMixin, AgentBase):
             )
             return [error_event]
 
+        if self.observation_token_budget is not None:
+            observation = apply_observation_token_budget(
+                observation,
+                self.llm,
+                self.observation_token_budget,
+                save_dir=conversation.state.env_observation_persistence_dir,
+                tool_prefix=tool.name,
+            )
+
         obs_event = ObservationEvent(
             observation=observation,
             action_id=action_event.id,
@@ -911,6 +992,31 @@ class Agent(CriticMixin, AgentBase):
         )
         return [obs_event]
 
+    def _tool_output_stream(
+        self, conversation: LocalConversation, action_event: ActionEvent
+    ) -> ToolOutputStream:
+        """Create the stream that publishes live output of ``action_event``."""
+
+        def on_chunk(output: str, sequence: int, dropped_chars: int) -> None:
+            event = ToolOutputEvent(
+                tool_name=action_event.tool_name,
+                tool_call_id=action_event.tool_call_id,
+                action_id=action_event.id,
+                output=output,
+                sequence=sequence,
+                dropped_chars=dropped_chars,
+            )
+            try:
+                conversation.publish_live_event(event)
+            except Exception as e:
+                # Live output is best effort; the observation carries the result
+                logger.debug(f"Failed to publish live tool output: {e}")
+
+        def mask(output: str) -> str:
+            return conversation.state.secret_registry.mask_secrets_in_output(output)
+
+        return ToolOutputStream(on_chunk, mask=mask)
+
     def _maybe_emit_vllm_tokens(
         self, llm_response: LLMResponse, on_event: ConversationCallbackType
     ) -> None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import re
 import sys
@@ -198,6 +199,17 @@ class AgentBase(DiscriminatedUnionMixin, ABC):
         ),
     )
 
+    observation_token_budget: int | None = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Maximum number of tokens, measured with the agent LLM's tokenizer, for "
+            "the text of each tool observation. Larger observations are stored as a "
+            "head/tail preview, with the full output saved to the conversation's "
+            "observations directory. None disables the limit."
+        ),
+    )
+
     # Runtime materialized tools; private and non-serializable
     _tools: dict[str, ToolDefinition] = PrivateAttr(default_factory=dict)
     _initialized: bool = PrivateAttr(default=False)
@@ -418,6 +430,19 @@ class AgentBase(DiscriminatedUnionMixin, ABC):
         NOTE: state will be mutated in-place.
         """
 
+    async def astep(
+        self,
+        conversation: LocalConversation,
+        on_event: ConversationCallbackType,
+        on_token: ConversationTokenCallbackType | None = None,
+    ) -> None:
+        """Async version of `step`.
+
+        The default runs `step` in a worker thread; agents that can await their
+        LLM calls override it.
+        """
+        await asyncio.to_thread(self.step, conversation, on_event, on_token)
+
     def verify(
         self,
         persisted: AgentBase,
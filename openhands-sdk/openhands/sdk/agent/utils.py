@@ -16,8 +16,9 @@ from openhands.sdk.context.view import View
 from openhands.sdk.conversation.types import ConversationTokenCallbackType
 from openhands.sdk.event.base import Event, LLMConvertibleEvent
 from openhands.sdk.event.condenser import Condensation
-from openhands.sdk.llm import LLM, LLMResponse, Message
-from openhands.sdk.tool import Action, ToolDefinition
+from openhands.sdk.llm import LLM, LLMResponse, Message, TextContent
+from openhands.sdk.tool import Action, Observation, ToolDefinition
+from openhands.sdk.utils import maybe_truncate
 
 
 # Regex matching raw ASCII control characters (U+0000–U+001F) that are
@@ -157,6 +158,7 @@ def prepare_llm_messages(
     condenser: None = None,
     additional_messages: list[Message] | None = None,
     llm: LLM | None = None,
+    view: View | None = None,
 ) -> list[Message]: ...
 
 
@@ -166,6 +168,7 @@ def prepare_llm_messages(
     condenser: CondenserBase,
     additional_messages: list[Message] | None = None,
     llm: LLM | None = None,
+    view: View | None = None,
 ) -> list[Message] | Condensation: ...
 
 
@@ -174,6 +177,7 @@ def prepare_llm_messages(
     condenser: CondenserBase | None = None,
     additional_messages: list[Message] | None = None,
     llm: LLM | None = None,
+    view: View | None = None,
 ) -> list[Message] | Condensation:
     """Prepare LLM messages from conversation context.
 
@@ -187,6 +191,8 @@ def prepare_llm_messages(
         additional_messages: Optional additional messages to append
         llm: Optional LLM instance from the agent, passed to condenser for
             token counting or other LLM features
+        view: Optional precomputed view of `events` (e.g. `ConversationState.view`).
+            If omitted, the view is built with `View.from_events(events)`.
 
     Returns:
         List of messages ready for LLM completion, or a Condensation event
@@ -196,7 +202,8 @@ def prepare_llm_messages(
         RuntimeError: If condensation is needed but no callback is provided
     """
 
-    view = View.from_events(events)
+    if view is None:
+        view = View.from_events(events)
     llm_convertible_events: list[LLMConvertibleEvent] = view.events
 
     # If a condenser is registered, we need to give it an
@@ -268,3 +275,76 @@ def make_llm_completion(
             add_security_risk_prediction=True,
             on_token=on_token,
         )
+
+
+async def amake_llm_completion(
+    llm: LLM,
+    messages: list[Message],
+    tools: list[ToolDefinition] | None = None,
+    on_token: ConversationTokenCallbackType | None = None,
+) -> LLMResponse:
+    """Async version of `make_llm_completion`, using `LLM.aresponses` or
+    `LLM.acompletion`."""
+    if llm.uses_responses_api():
+        return await llm.aresponses(
+            messages=messages,
+            tools=tools or [],
+            include=None,
+            store=False,
+            add_security_risk_prediction=True,
+            on_token=on_token,
+        )
+    else:
+        return await llm.acompletion(
+            messages=messages,
+            tools=tools or [],
+            add_security_risk_prediction=True,
+            on_token=on_token,
+        )
+
+
+def apply_observation_token_budget(
+    observation: Observation,
+    llm: LLM,
+    token_budget: int,
+    save_dir: str | None = None,
+    tool_prefix: str = "output",
+) -> Observation:
+    """Fit the text content of an observation into a token budget.
+
+    The text is measured once with `llm`'s tokenizer. If it exceeds
+    `token_budget`, each text item is replaced by a head/tail preview sized with
+    the measured characters-per-token ratio, and the full text is saved under
+    `save_dir` (when given) so the agent can read it with other tools. Images are
+    left untouched.
+
+    Returns:
+        The original observation if it fits, otherwise a copy with the previews.
+    """
+    texts = [c.text for c in observation.content if isinstance(c, TextContent)]
+    total_chars = sum(len(text) for text in texts)
+    if total_chars == 0:
+        return observation
+
+    tokens = llm.get_token_count(
+        [Message(role="user", content=[TextContent(text="".join(texts))])]
+    )
+    if tokens <= token_budget:
+        return observation
+
+    char_budget = token_budget * total_chars // tokens
+    content = []
+    for item in observation.content:
+        if isinstance(item, TextContent):
+            # Share the budget between text items in proportion to their length
+            limit = max(char_budget * len(item.text) // total_chars, 1)
+            preview = maybe_truncate(
+                item.text,
+                truncate_after=limit,
+                save_dir=save_dir,
+                tool_prefix=tool_prefix,
+            )
+            item = item.model_copy(update={"text": preview})
+        content.append(item)
+    return observation.model_copy(update={"content": content})
+
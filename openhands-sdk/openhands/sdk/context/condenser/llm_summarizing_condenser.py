@@ -1,8 +1,10 @@
 import os
 from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
 
-from pydantic import Field, model_validator
+from pydantic import Field, PrivateAttr, model_validator
 
 from openhands.sdk.context.condenser.base import (
     CondensationRequirement,
@@ -16,7 +18,8 @@ from openhands.sdk.context.condenser.utils import (
 from openhands.sdk.context.prompts import render_template
 from openhands.sdk.context.view import View
 from openhands.sdk.event.base import LLMConvertibleEvent
-from openhands.sdk.event.condenser import Condensation
+from openhands.sdk.event.condenser import Condensation, CondensationSummaryEvent
+from openhands.sdk.event.types import EventID
 from openhands.sdk.llm import LLM, Message, TextContent
 from openhands.sdk.logger import get_logger
 from openhands.sdk.observability.laminar import observe
@@ -34,6 +37,34 @@ class Reason(Enum):
     EVENTS = "events"
 
 
+# Events are never truncated below this many characters, however small the budget
+_MIN_EVENT_CHARS = 200
+
+
+def _fair_share(lengths: Sequence[int], budget: int) -> int:
+    """Largest per-item length cap such that the capped lengths fit `budget`.
+
+    Items shorter than the cap are kept whole, leaving their unused share to the
+    longer ones.
+    """
+    remaining = budget
+    for i, length in enumerate(sorted(lengths)):
+        share = remaining // (len(lengths) - i)
+        if length > share:
+            return max(share, _MIN_EVENT_CHARS)
+        remaining -= length
+    return max(lengths, default=_MIN_EVENT_CHARS)
+
+
+@dataclass(frozen=True)
+class _Speculation:
+    """A summary being generated ahead of the condensation that will need it."""
+
+    future: Future[Condensation]
+    forgotten_event_ids: tuple[EventID, ...]
+    summary_offset: int
+
+
 class LLMSummarizingCondenser(RollingCondenser):
     """LLM-based condenser that summarizes forgotten events.
 
@@ -69,6 +100,28 @@ class LLMSummarizingCondenser(RollingCondenser):
     size of each event string by this factor and retry.
     """
 
+    speculative_threshold: float | None = Field(default=None, gt=0.0, lt=1.0)
+    """Fraction of `max_size` / `max_tokens` at which to start summarizing in a
+    background thread. When the limit is then exceeded, the precomputed summary is
+    used if its forgotten range is still valid and brings the view back under the
+    limits; otherwise the summary is generated synchronously. A speculative summary
+    costs an extra LLM call if it ends up unused. Disabled when None.
+    """
+
+    incremental: bool = False
+    """Summarize only the newly forgotten events, passing the previous summary to
+    the LLM verbatim instead of as one more event, and truncate the new events so the
+    prompt stays within `incremental_prompt_max_chars`. Token savings against the
+    full prompt are recorded in `Condensation.metadata`.
+    """
+
+    incremental_prompt_max_chars: int = Field(default=100_000, gt=0)
+    """In incremental mode, the character budget for the previous summary and the
+    newly forgotten events combined. Longer events are truncated first."""
+
+    _speculation: _Speculation | None = PrivateAttr(default=None)
+    _executor: ThreadPoolExecutor | None = PrivateAttr(default=None)
+
     @model_validator(mode="after")
     def validate_keep_first_vs_max_size(self):
         events_from_tail = self.max_size // 2 - self.keep_first - 1
@@ -161,17 +214,29 @@ class LLMSummarizingCondenser(RollingCondenser):
         """
         assert len(forgotten_events) > 0, "No events to condense."
 
-        # Convert events to strings for the template
-        event_strings = [
-            maybe_truncate(str(forgotten_event), truncate_after=max_event_str_length)
-            for forgotten_event in forgotten_events
-        ]
-
-        prompt = render_template(
-            os.path.join(os.path.dirname(__file__), "prompts"),
-            "summarizing_prompt.j2",
-            events=event_strings,
-        )
+        metadata: dict[str, int] = {}
+        if self.incremental:
+            prompt = self._incremental_prompt(forgotten_events, max_event_str_length)
+            full_prompt = self._render_prompt(
+                [str(forgotten_event) for forgotten_event in forgotten_events]
+            )
+            prompt_tokens = self._prompt_token_count(prompt)
+            full_prompt_tokens = self._prompt_token_count(full_prompt)
+            metadata = {
+                "prompt_tokens": prompt_tokens,
+                "full_prompt_tokens": full_prompt_tokens,
+                "tokens_saved": max(full_prompt_tokens - prompt_tokens, 0),
+            }
+        else:
+            # Convert events to strings for the template
+            prompt = self._render_prompt(
+                [
+                    maybe_truncate(
+                        str(forgotten_event), truncate_after=max_event_str_length
+                    )
+                    for forgotten_event in forgotten_events
+                ]
+            )
 
         messages = [Message(role="user", content=[TextContent(text=prompt)])]
 
@@ -192,6 +257,47 @@ class LLMSummarizingCondenser(RollingCondenser):
             summary=summary,
             summary_offset=summary_offset,
             llm_response_id=llm_response.id,
+            metadata=metadata,
+        )
+
+    def _render_prompt(
+        self, event_strings: list[str], previous_summary: str | None = None
+    ) -> str:
+        return render_template(
+            os.path.join(os.path.dirname(__file__), "prompts"),
+            "summarizing_prompt.j2",
+            events=event_strings,
+            previous_summary=previous_summary,
+        )
+
+    def _incremental_prompt(
+        self,
+        forgotten_events: Sequence[LLMConvertibleEvent],
+        max_event_str_length: int | None = None,
+    ) -> str:
+        """Render the prompt from the previous summary and the new events only."""
+        summaries = [
+            event.summary
+            for event in forgotten_events
+            if isinstance(event, CondensationSummaryEvent)
+        ]
+        previous_summary = "\n\n".join(summaries) or None
+        event_strings = [
+            str(event)
+            for event in forgotten_events
+            if not isinstance(event, CondensationSummaryEvent)
+        ]
+
+        budget = self.incremental_prompt_max_chars - len(previous_summary or "")
+        limit = _fair_share([len(e) for e in event_strings], budget)
+        if max_event_str_length is not None:
+            limit = min(limit, max_event_str_length)
+        event_strings = [maybe_truncate(e, truncate_after=limit) for e in event_strings]
+        return self._render_prompt(event_strings, previous_summary=previous_summary)
+
+    def _prompt_token_count(self, prompt: str) -> int:
+        return self.llm.get_token_count(
+            [Message(role="user", content=[TextContent(text=prompt)])]
         )
 
     def _get_forgotten_events(
@@ -211,6 +317,12 @@ class LLMSummarizingCondenser(RollingCondenser):
             A tuple of (events to forget, summary_offset).
         """
         reasons = self.get_condensation_reasons(view, agent_llm=agent_llm)
+        return self._forgotten_events_for(view, reasons, agent_llm)
+
+    def _forgotten_events_for(
+        self, view: View, reasons: set[Reason], agent_llm: LLM | None = None
+    ) -> tuple[Sequence[LLMConvertibleEvent], int]:
+        """Identify events to forget to satisfy the given condensation reasons."""
         assert reasons != set(), "No condensation reasons found."
 
         suffix_events_to_keep: set[int] = set()
@@ -305,10 +417,118 @@ class LLMSummarizingCondenser(RollingCondenser):
         logger.error("Hard context reset summarization failed after multiple attempts.")
         return None
 
+    def condense(self, view: View, agent_llm: LLM | None = None) -> View | Condensation:
+        result = super().condense(view, agent_llm=agent_llm)
+        if isinstance(result, View) and self.speculative_threshold is not None:
+            self._maybe_speculate(view, agent_llm)
+        return result
+
+    def _speculative_reasons(
+        self, view: View, agent_llm: LLM | None = None
+    ) -> set[Reason]:
+        """Resource reasons whose limit is within `speculative_threshold`."""
+        assert self.speculative_threshold is not None
+        reasons = set()
+        if len(view) >= self.max_size * self.speculative_threshold:
+            reasons.add(Reason.EVENTS)
+        if self.max_tokens and agent_llm:
+            total_tokens = get_total_token_count(view.events, agent_llm)
+            if total_tokens >= self.max_tokens * self.speculative_threshold:
+                reasons.add(Reason.TOKENS)
+        return reasons
+
+    def _maybe_speculate(self, view: View, agent_llm: LLM | None = None) -> None:
+        """Start summarizing in the background once the view nears its limits."""
+        if self._speculation is not None:
+            return
+        reasons = self._speculative_reasons(view, agent_llm)
+        if not reasons:
+            return
+        try:
+            forgotten_events, summary_offset = self._forgotten_events_for(
+                view, reasons, agent_llm
+            )
+        except ValueError:
+            return
+        if len(forgotten_events) < len(view) * self.minimum_progress:
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="speculative-condenser"
+            )
+        logger.debug(
+            f"Speculatively summarizing {len(forgotten_events)} events "
+            f"at offset {summary_offset}"
+        )
+        self._speculation = _Speculation(
+            future=self._executor.submit(
+                self._generate_condensation,
+                forgotten_events=list(forgotten_events),
+                summary_offset=summary_offset,
+            ),
+            forgotten_event_ids=tuple(event.id for event in forgotten_events),
+            summary_offset=summary_offset,
+        )
+
+    def _speculation_fits(
+        self, speculation: _Speculation, view: View, agent_llm: LLM | None = None
+    ) -> bool:
+        """Whether a speculative condensation still applies to `view` and brings it
+        back under the resource limits."""
+        start = speculation.summary_offset
+        end = start + len(speculation.forgotten_event_ids)
+        forgotten = view[start:end]
+        if tuple(event.id for event in forgotten) != speculation.forgotten_event_ids:
+            return False
+        indices = view.manipulation_indices
+        if start not in indices or end not in indices:
+            return False
+
+        # The summary takes the place of the forgotten events
+        if len(view) - len(forgotten) + 1 > self.max_size:
+            return False
+        if self.max_tokens and agent_llm:
+            forgotten_ids = set(speculation.forgotten_event_ids)
+            remaining = [e for e in view.events if e.id not in forgotten_ids]
+            if get_total_token_count(remaining, agent_llm) > self.max_tokens:
+                return False
+        return True
+
+    def _take_speculation(
+        self, view: View, agent_llm: LLM | None = None
+    ) -> Condensation | None:
+        """Return the speculative condensation if it can be used for `view`.
+
+        The speculation is consumed either way, so a stale one never outlives the
+        condensation it was meant for.
+        """
+        speculation, self._speculation = self._speculation, None
+        if speculation is None:
+            return None
+        reasons = self.get_condensation_reasons(view, agent_llm)
+        if not reasons.issubset({Reason.TOKENS, Reason.EVENTS}):
+            return None
+        if not self._speculation_fits(speculation, view, agent_llm):
+            logger.debug("Discarding speculative condensation: view has changed")
+            return None
+        try:
+            # Usually done already; otherwise it finishes sooner than a new call
+            return speculation.future.result()
+        except Exception as e:
+            logger.warning(
+                f"Speculative condensation failed, summarizing synchronously: {e}"
+            )
+            return None
+
     @observe(ignore_inputs=["view", "agent_llm"])
     def get_condensation(
         self, view: View, agent_llm: LLM | None = None
     ) -> Condensation:
+        speculative = self._take_speculation(view, agent_llm)
+        if speculative is not None:
+            return speculative
+
         # The condensation is dependent on the events we want to drop and the previous
         # summary. If we fail to find an appropriate set of events to forget raise an
         # exception so the conversation can keep going until conditions change.
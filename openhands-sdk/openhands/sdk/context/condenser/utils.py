@@ -1,7 +1,107 @@
+import threading
+from bisect import bisect_right
 from collections.abc import Sequence
 
+from cachetools import LRUCache
+
 from openhands.sdk.event.base import LLMConvertibleEvent
-from openhands.sdk.llm import LLM
+from openhands.sdk.event.types import EventID
+from openhands.sdk.llm import LLM, Message, TextContent
+
+
+class TokenAccounting:
+    """Cached per-event token counts for one model/tokenizer, with prefix sums.
+
+    Events are immutable, so each event is tokenized once per tokenizer and its
+    count is reused for every later view. The count of a sequence of events is
+    the sum of its events' counts plus the tokenizer's fixed per-request
+    overhead (e.g. reply priming), measured once.
+
+    The result equals tokenizing the whole sequence at once with
+    `LLM.get_token_count` when every event becomes its own message. Events that
+    `events_to_messages` merges into a previous message (parallel tool calls of
+    one LLM response) are over-counted by their own message framing, a few
+    tokens each (3 for OpenAI chat models).
+    """
+
+    def __init__(self, max_events: int = 100_000) -> None:
+        self._lock = threading.Lock()
+        self._counts: LRUCache[EventID, int] = LRUCache(maxsize=max_events)
+        self._overhead: int | None = None
+        # Prefix sums of the most recently counted sequence, extended in place
+        # when the next sequence appends to it
+        self._ids: list[EventID] = []
+        self._sums: list[int] = [0]
+
+    def overhead(self, llm: LLM) -> int:
+        """Tokens counted once per request regardless of the messages."""
+        if self._overhead is None:
+            probe = Message(role="user", content=[TextContent(text="a")])
+            one = llm.get_token_count([probe])
+            two = llm.get_token_count([probe, probe])
+            self._overhead = max(0, 2 * one - two)
+        return self._overhead
+
+    def event_count(self, event: LLMConvertibleEvent, llm: LLM) -> int:
+        count = self._counts.get(event.id)
+        if count is None:
+            messages = LLMConvertibleEvent.events_to_messages([event])
+            count = max(0, llm.get_token_count(messages) - self.overhead(llm))
+            self._counts[event.id] = count
+        return count
+
+    def prefix_sums(
+        self, events: Sequence[LLMConvertibleEvent], llm: LLM
+    ) -> list[int]:
+        """`sums[i]` is the token count of `events[:i]` without the overhead."""
+        with self._lock:
+            n = len(self._ids)
+            if not (
+                n <= len(events)
+                and (
+                    n == 0
+                    or (
+                        events[0].id == self._ids[0]
+                        and events[n - 1].id == self._ids[-1]
+                    )
+                )
+            ):
+                self._ids = []
+                self._sums = [0]
+            for event in events[len(self._ids) :]:
+                self._ids.append(event.id)
+                self._sums.append(self._sums[-1] + self.event_count(event, llm))
+            return self._sums[: len(events) + 1]
+
+    def total(self, events: Sequence[LLMConvertibleEvent], llm: LLM) -> int:
+        if not events:
+            return 0
+        return self.prefix_sums(events, llm)[-1] + self.overhead(llm)
+
+    def shortest_prefix_above(
+        self, events: Sequence[LLMConvertibleEvent], llm: LLM, token_count: int
+    ) -> int:
+        """Length of the shortest prefix whose total exceeds token_count, or
+        len(events) if none does."""
+        if not events:
+            return 0
+        sums = self.prefix_sums(events, llm)
+        length = bisect_right(sums, token_count - self.overhead(llm))
+        return max(1, min(length, len(events)))
+
+
+_accounts: dict[tuple[str, str | None], TokenAccounting] = {}
+_accounts_lock = threading.Lock()
+
+
+def get_token_accounting(llm: LLM) -> TokenAccounting:
+    """The shared TokenAccounting for the LLM's model and tokenizer."""
+    key = (llm.model, getattr(llm, "custom_tokenizer", None))
+    with _accounts_lock:
+        account = _accounts.get(key)
+        if account is None:
+            account = _accounts[key] = TokenAccounting()
+        return account
 
 
 def get_total_token_count(
@@ -14,6 +114,10 @@ def get_total_token_count(
     to count the total number of tokens. This is useful for understanding how many
     tokens a sequence of events will consume in the context window.
 
+    Per-event counts are cached (see `TokenAccounting` for how the result may
+    differ from tokenizing all messages at once), so only events that have not
+    been counted before are tokenized.
+
     Args:
         events: List of LLM convertible events to count tokens for
         llm: The LLM instance to use for token counting (uses the litellm's token
@@ -34,8 +138,7 @@ def get_total_token_count(
         >>> token_count = get_total_token_count(events, llm)
         >>> print(f"Total tokens: {token_count}")
     """
-    messages = LLMConvertibleEvent.events_to_messages(list(events))
-    return llm.get_token_count(messages)
+    return get_token_accounting(llm).total(events, llm)
 
 
 def get_shortest_prefix_above_token_count(
@@ -45,9 +148,10 @@ def get_shortest_prefix_above_token_count(
 ) -> int:
     """Find the length of the shortest prefix whose token count exceeds the target.
 
-    This function performs a binary search to efficiently find the shortest prefix
-    of events that, when converted to messages, has a total token count greater than
-    the specified target token count.
+    This function performs a binary search over the cached prefix sums of the
+    events' token counts to find the shortest prefix of events that, when
+    converted to messages, has a total token count greater than the specified
+    target token count.
 
     Args:
         events: List of LLM convertible events to search through
@@ -73,29 +177,7 @@ def get_shortest_prefix_above_token_count(
         >>> prefix_len = get_shortest_prefix_above_token_count(events, llm, 20)
         >>> # prefix_len might be 2 if first 2 events exceed 20 tokens
     """
-    if not events:
-        return 0
-
-    # Check if all events combined don't exceed the token count
-    total_tokens = get_total_token_count(events, llm)
-    if total_tokens <= token_count:
-        return len(events)
-
-    # Binary search for the shortest prefix
-    left, right = 1, len(events)
-
-    while left < right:
-        mid = (left + right) // 2
-        prefix_tokens = get_total_token_count(events[:mid], llm)
-
-        if prefix_tokens > token_count:
-            # This prefix exceeds the count, try to find a shorter one
-            right = mid
-        else:
-            # This prefix doesn't exceed, we need a longer one
-            left = mid + 1
-
-    return left
+    return get_token_accounting(llm).shortest_prefix_above(events, llm, token_count)
 
 
 def get_suffix_length_for_token_reduction(
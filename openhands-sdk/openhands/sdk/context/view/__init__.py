@@ -1,5 +1,6 @@
+from openhands.sdk.context.view.incremental import IncrementalView
 from openhands.sdk.context.view.manipulation_indices import ManipulationIndices
 from openhands.sdk.context.view.view import View
 
 
-__all__ = ["View", "ManipulationIndices"]
+__all__ = ["View", "IncrementalView", "ManipulationIndices"]
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Sequence
+from logging import getLogger
+
+from openhands.sdk.context.view.properties import (
+    ALL_PROPERTIES,
+    BatchAtomicityProperty,
+    ToolLoopAtomicityProperty,
+)
+from openhands.sdk.context.view.view import View
+from openhands.sdk.event import (
+    ActionEvent,
+    Condensation,
+    CondensationRequest,
+    EventID,
+    LLMConvertibleEvent,
+    ObservationBaseEvent,
+)
+from openhands.sdk.event.base import Event
+
+
+logger = getLogger(__name__)
+
+
+class IncrementalView:
+    """Maintains `View.from_events(events)` for an append-only event sequence.
+
+    `View.from_events` re-reads every event, re-applies every condensation and
+    re-derives the conversation-wide batches and tool loops that property enforcement
+    depends on. This class instead consumes only the events appended since the last
+    call: new events are appended to the (pre-enforcement) view, condensations are
+    applied to it as they arrive, and the batch/tool-loop summaries are extended in
+    place. Property enforcement still runs on every change, but only over the events
+    in the view.
+
+    The result is always identical to `View.from_events` over the same events. If the
+    sequence is replaced or shrinks, the view is rebuilt from scratch.
+    """
+
+    _source: Sequence[Event] | None
+    _consumed: int
+    _output: list[LLMConvertibleEvent]
+    _condensations: list[Condensation]
+    _unhandled_condensation_request: bool
+    # Conversation-wide summaries used by property enforcement
+    _batches: defaultdict[EventID, set[EventID]]
+    _tool_loop_of: dict[EventID, set[EventID]]
+    _current_tool_loop: set[EventID] | None
+    _view: View | None
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all consumed events; the next `get` rebuilds from scratch."""
+        self._source = None
+        self._consumed = 0
+        self._output = []
+        self._condensations = []
+        self._unhandled_condensation_request = False
+        self._batches = defaultdict(set)
+        self._tool_loop_of = {}
+        self._current_tool_loop = None
+        self._view = None
+
+    def get(self, events: Sequence[Event]) -> View:
+        """Return the view of `events`, consuming only newly appended events."""
+        if events is not self._source or len(events) < self._consumed:
+            self.reset()
+            self._source = events
+
+        if len(events) > self._consumed:
+            for event in events[self._consumed :]:
+                self._add(event)
+            self._consumed = len(events)
+            self._view = None
+
+        if self._view is None:
+            self._view = View(
+                events=self._enforce_properties(list(self._output)),
+                unhandled_condensation_request=self._unhandled_condensation_request,
+                condensations=list(self._condensations),
+            )
+        return self._view
+
+    def _add(self, event: Event) -> None:
+        # Mirrors the loop in View.from_events.
+        if isinstance(event, Condensation):
+            self._condensations.append(event)
+            self._output = event.apply(self._output)
+        elif isinstance(event, LLMConvertibleEvent):
+            self._output.append(event)
+
+        if isinstance(event, Condensation):
+            self._unhandled_condensation_request = False
+        elif isinstance(event, CondensationRequest):
+            self._unhandled_condensation_request = True
+
+        # Mirrors BatchAtomicityProperty._build_batches.
+        if isinstance(event, ActionEvent):
+            self._batches[event.llm_response_id].add(event.id)
+
+        # Mirrors ToolLoopAtomicityProperty._tool_loops.
+        match event:
+            case ActionEvent() if event.thinking_blocks:
+                self._current_tool_loop = {event.id}
+                self._tool_loop_of.setdefault(event.id, self._current_tool_loop)
+            case ActionEvent() | ObservationBaseEvent():
+                if self._current_tool_loop is not None:
+                    self._current_tool_loop.add(event.id)
+                    self._tool_loop_of.setdefault(event.id, self._current_tool_loop)
+            case _:
+                self._current_tool_loop = None
+
+    def _enforce_properties(
+        self, current_view_events: list[LLMConvertibleEvent]
+    ) -> list[LLMConvertibleEvent]:
+        """Equivalent of `View.enforce_properties` using the maintained summaries."""
+        while True:
+            for property in ALL_PROPERTIES:
+                match property:
+                    case BatchAtomicityProperty():
+                        events_to_forget = property.enforce_batches(
+                            current_view_events, self._batches
+                        )
+                    case ToolLoopAtomicityProperty():
+                        events_to_forget = property.enforce_tool_loops(
+                            current_view_events, self._tool_loop_of
+                        )
+                    case _:
+                        assert self._source is not None
+                        events_to_forget = property.enforce(
+                            current_view_events, self._source
+                        )
+                if events_to_forget:
+                    logger.warning(
+                        f"Property {property.__class__} enforced, "
+                        f"{len(events_to_forget)} events dropped."
+                    )
+                    current_view_events = [
+                        event
+                        for event in current_view_events
+                        if event.id not in events_to_forget
+                    ]
+                    break
+            else:
+                return current_view_events
@@ -1,5 +1,5 @@
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from itertools import pairwise
 
 from openhands.sdk.context.view.manipulation_indices import ManipulationIndices
@@ -30,7 +30,22 @@ class BatchAtomicityProperty(ViewPropertyBase):
         ActionEvent objects from that batch for removal. Relies on all_events to detect
         and identify batches.
         """
-        all_batches = self._build_batches(all_events)
+        return self.enforce_batches(
+            current_view_events, self._build_batches(all_events)
+        )
+
+    def enforce_batches(
+        self,
+        current_view_events: list[LLMConvertibleEvent],
+        all_batches: Mapping[EventID, set[EventID]],
+    ) -> set[EventID]:
+        """Enforce batch atomicity against precomputed batches.
+
+        Args:
+            current_view_events: The sequence of events currently in the view.
+            all_batches: Map from LLM response IDs to the IDs of every action in that
+                batch across the whole conversation, as built by `_build_batches`.
+        """
         events_to_remove: set[EventID] = set()
 
         for llm_response_id, view_batch_ids in self._build_batches(
@@ -41,7 +56,7 @@ class BatchAtomicityProperty(ViewPropertyBase):
             # one-to-one with the batch ids generated by the all_events sequence, that
             # can only mean something has been forgotten and we need to drop the entire
             # batch.
-            if view_batch_ids != all_batches[llm_response_id]:
+            if view_batch_ids != all_batches.get(llm_response_id, set()):
                 events_to_remove.update(view_batch_ids)
 
         return events_to_remove
@@ -1,4 +1,4 @@
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 
 from openhands.sdk.context.view.manipulation_indices import ManipulationIndices
 from openhands.sdk.context.view.properties.base import ViewPropertyBase
@@ -71,7 +71,24 @@ class ToolLoopAtomicityProperty(ViewPropertyBase):
 
         Requires we iterate over all events to determine the full extent of tool loops.
         """
-        all_tool_loops: list[set[EventID]] = self._tool_loops(all_events)
+        tool_loop_of: dict[EventID, set[EventID]] = {}
+        for tool_loop in self._tool_loops(all_events):
+            for event_id in tool_loop:
+                tool_loop_of.setdefault(event_id, tool_loop)
+        return self.enforce_tool_loops(current_view_events, tool_loop_of)
+
+    def enforce_tool_loops(
+        self,
+        current_view_events: list[LLMConvertibleEvent],
+        tool_loop_of: Mapping[EventID, set[EventID]],
+    ) -> set[EventID]:
+        """Enforce tool loop atomicity against precomputed tool loops.
+
+        Args:
+            current_view_events: The sequence of events currently in the view.
+            tool_loop_of: Map from event ID to the (complete) tool loop containing
+                that event, for every event that is part of a tool loop.
+        """
         view_event_ids: set[EventID] = {event.id for event in current_view_events}
         events_to_remove: set[EventID] = set()
 
@@ -84,11 +101,9 @@ class ToolLoopAtomicityProperty(ViewPropertyBase):
             # Check if the event is part of a tool loop. If it is, all events in that
             # tool loop must be part of the view or we have to remove the remaining
             # events.
-            for tool_loop in all_tool_loops:
-                if event.id in tool_loop:
-                    if not tool_loop.issubset(view_event_ids):
-                        events_to_remove.update(view_event_ids & tool_loop)
-                    break
+            tool_loop = tool_loop_of.get(event.id)
+            if tool_loop is not None and not tool_loop.issubset(view_event_ids):
+                events_to_remove.update(view_event_ids & tool_loop)
 
         return events_to_remove
 
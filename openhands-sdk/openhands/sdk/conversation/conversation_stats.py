@@ -1,14 +1,26 @@
+import json
 from typing import Any
 
 from pydantic import BaseModel, Field, PrivateAttr, model_serializer
 
+from openhands.sdk.conversation.persistence_const import METRICS_JOURNAL
+from openhands.sdk.io import FileStore
+from openhands.sdk.llm.llm import LLM
 from openhands.sdk.llm.llm_registry import RegistryEvent
-from openhands.sdk.llm.utils.metrics import Metrics
+from openhands.sdk.llm.utils.metrics import Cost, Metrics, ResponseLatency, TokenUsage
+from openhands.sdk.llm.utils.prompt_cache import PromptCacheStats
 from openhands.sdk.logger import get_logger
 
 
 logger = get_logger(__name__)
 
+# Per-call Metrics lists that are persisted in the metrics journal
+_JOURNALED_LISTS: dict[str, type[BaseModel]] = {
+    "costs": Cost,
+    "response_latencies": ResponseLatency,
+    "token_usages": TokenUsage,
+}
+
 
 class ConversationStats(BaseModel):
     """Track per-LLM usage metrics observed during conversations."""
@@ -19,6 +31,14 @@ class ConversationStats(BaseModel):
     )
 
     _restored_usage_ids: set[str] = PrivateAttr(default_factory=set)
+    # usage_id -> registered LLM, for runtime-only telemetry such as prompt caching
+    _llms: dict[str, LLM] = PrivateAttr(default_factory=dict)
+    _journal_fs: FileStore | None = PrivateAttr(default=None)
+    _journal_loaded: bool = PrivateAttr(default=True)
+    # usage_id -> (metrics object, number of records of each list in the journal)
+    _journaled: dict[str, tuple[Metrics, dict[str, int]]] = PrivateAttr(
+        default_factory=dict
+    )
 
     @model_serializer(mode="wrap")
     def _serialize_with_context(self, serializer: Any, info: Any) -> dict[str, Any]:
@@ -30,6 +50,10 @@ class ConversationStats(BaseModel):
         When context={'use_snapshot': True} is passed, converts Metrics to
         MetricsSnapshot format to minimize payload size for network transmission.
 
+        When context={'metrics_journal': True} is passed and a journal is
+        attached, the per-call lists are left out because they are persisted in
+        the journal.
+
         Args:
             serializer: Pydantic's default serializer
             info: Serialization info containing context
@@ -37,12 +61,22 @@ class ConversationStats(BaseModel):
         Returns:
             Dictionary with metrics serialized based on context
         """
+        context = info.context if info else None
+        use_snapshot = context.get("use_snapshot", False) if context else False
+        use_journal = self._journal_fs is not None and bool(
+            context and context.get("metrics_journal", False)
+        )
+        if not (use_snapshot or use_journal):
+            # Full serialization includes the records that are still on disk
+            self._load_journal()
+
         # Get the default serialization
         data = serializer(self)
 
-        # Check if we should use snapshot serialization
-        context = info.context if info else None
-        use_snapshot = context.get("use_snapshot", False) if context else False
+        if use_journal and not use_snapshot and "usage_to_metrics" in data:
+            for metrics_data in data["usage_to_metrics"].values():
+                for name in _JOURNALED_LISTS:
+                    metrics_data.pop(name, None)
 
         if use_snapshot and "usage_to_metrics" in data:
             # Replace each Metrics with its snapshot
@@ -55,22 +89,133 @@ class ConversationStats(BaseModel):
 
         return data
 
+    def attach_journal(self, fs: FileStore) -> None:
+        """Persist per-call metric records to an append-only journal in fs.
+
+        Base state saves then only carry the aggregates. The records of a
+        resumed conversation are read back from the journal the first time the
+        metrics are used; legacy states that still hold them inline are moved to
+        the journal on the next save.
+        """
+        self._journal_fs = fs
+        self._journaled = {}
+        has_records = any(
+            getattr(metrics, name)
+            for metrics in self.usage_to_metrics.values()
+            for name in _JOURNALED_LISTS
+        )
+        self._journal_loaded = has_records or not fs.exists(METRICS_JOURNAL)
+
+    def write_journal(self) -> None:
+        """Append the records added since the previous call to the journal."""
+        fs = self._journal_fs
+        if fs is None:
+            return
+        if not self._journal_loaded and any(
+            getattr(metrics, name)
+            for metrics in self.usage_to_metrics.values()
+            for name in _JOURNALED_LISTS
+        ):
+            # Records of a resumed conversation go before the new ones
+            self._load_journal()
+        lines: list[str] = []
+        for usage_id, metrics in self.usage_to_metrics.items():
+            journaled = self._journaled.get(usage_id)
+            counts = journaled[1] if journaled else dict.fromkeys(_JOURNALED_LISTS, 0)
+            if journaled is not None and (
+                journaled[0] is not metrics
+                or any(len(getattr(metrics, n)) < c for n, c in counts.items())
+            ):
+                # Replaced or truncated rather than appended to: rewrite it
+                lines.append(json.dumps({"usage_id": usage_id, "reset": True}))
+                counts = dict.fromkeys(_JOURNALED_LISTS, 0)
+            for name in _JOURNALED_LISTS:
+                records = getattr(metrics, name)
+                for record in records[counts[name] :]:
+                    lines.append(
+                        json.dumps(
+                            {
+                                "usage_id": usage_id,
+                                "list": name,
+                                "record": record.model_dump(mode="json"),
+                            }
+                        )
+                    )
+                counts[name] = len(records)
+            self._journaled[usage_id] = (metrics, counts)
+        if lines:
+            fs.append(METRICS_JOURNAL, "\n".join(lines) + "\n")
+
+    def _load_journal(self) -> None:
+        """Prepend the journaled records of a resumed conversation to its metrics."""
+        if self._journal_loaded or self._journal_fs is None:
+            return
+        self._journal_loaded = True
+        try:
+            text = self._journal_fs.read(METRICS_JOURNAL)
+        except FileNotFoundError:
+            return
+        loaded: dict[str, dict[str, list[Any]]] = {}
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # A crash may leave a partial last line
+                logger.warning("Skipping malformed metrics journal line")
+                continue
+            lists = loaded.setdefault(
+                entry["usage_id"], {name: [] for name in _JOURNALED_LISTS}
+            )
+            if entry.get("reset"):
+                for records in lists.values():
+                    records.clear()
+                continue
+            record_cls = _JOURNALED_LISTS[entry["list"]]
+            lists[entry["list"]].append(record_cls.model_validate(entry["record"]))
+        for usage_id, lists in loaded.items():
+            metrics = self.usage_to_metrics.get(usage_id)
+            if metrics is None:
+                continue
+            journaled = self._journaled.get(usage_id)
+            counts = journaled[1] if journaled else dict.fromkeys(_JOURNALED_LISTS, 0)
+            for name, records in lists.items():
+                getattr(metrics, name)[:0] = records
+                counts[name] += len(records)
+            self._journaled[usage_id] = (metrics, counts)
+
     def get_combined_metrics(self) -> Metrics:
+        self._load_journal()
         total_metrics = Metrics()
         for metrics in self.usage_to_metrics.values():
             total_metrics.merge(metrics)
         return total_metrics
 
     def get_metrics_for_usage(self, usage_id: str) -> Metrics:
+        self._load_journal()
         if usage_id not in self.usage_to_metrics:
             raise Exception(f"LLM usage does not exist {usage_id}")
 
         return self.usage_to_metrics[usage_id]
 
+    def get_prompt_cache_stats(self) -> dict[str, PromptCacheStats]:
+        """Return prompt-prefix stability and cache usage per usage_id.
+
+        Only covers LLMs registered in this process; unlike the metrics these
+        stats are not persisted.
+        """
+        return {
+            usage_id: llm.telemetry.prompt_cache_stats
+            for usage_id, llm in self._llms.items()
+        }
+
     def register_llm(self, event: RegistryEvent):
         # Listen for LLM creations and track their metrics
         llm = event.llm
         usage_id = llm.usage_id
+        self._llms[usage_id] = llm
+        self._load_journal()
 
         # Usage costs exist but have not been restored yet
         if (
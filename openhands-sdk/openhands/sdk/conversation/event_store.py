@@ -1,16 +1,20 @@
 # state.py
 import operator
 from collections.abc import Iterator
-from typing import SupportsIndex, overload
+from typing import Literal, SupportsIndex, overload
 
 from openhands.sdk.conversation.events_list_base import EventsListBase
+from openhands.sdk.conversation.pending_actions import PendingActionIndex
 from openhands.sdk.conversation.persistence_const import (
     EVENT_FILE_PATTERN,
     EVENT_NAME_RE,
+    EVENT_SEGMENT_INDEX,
+    EVENT_SEGMENT_PATTERN,
     EVENTS_DIR,
 )
-from openhands.sdk.event import Event, EventID
+from openhands.sdk.event import ActionEvent, Event, EventID
 from openhands.sdk.io import FileStore
+from openhands.sdk.io.cache import MemoryLRUCache
 from openhands.sdk.logger import get_logger
 
 
@@ -18,6 +22,18 @@ logger = get_logger(__name__)
 
 LOCK_FILE_NAME = ".eventlog.lock"
 LOCK_TIMEOUT_SECONDS = 30
+DEFAULT_SEGMENT_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_EVENT_CACHE_SIZE = 1000
+DEFAULT_EVENT_CACHE_MEMORY = 32 * 1024 * 1024
+
+EventLogLayout = Literal["files", "segmented"]
+"""On-disk layout of an event log.
+
+- ``files``: one JSON file per event (``event-00000-<id>.json``).
+- ``segmented``: events appended as JSON lines to ``segment-00000.jsonl``
+  files, with a ``segments.idx`` offset index (one
+  ``<segment>\t<offset>\t<length>\t<event_id>`` line per event).
+"""
 
 
 class EventLog(EventsListBase):
@@ -27,6 +43,15 @@ class EventLog(EventsListBase):
     the FileStore's locking mechanism. Events are persisted to disk and
     can be accessed by index or event ID.
 
+    Two on-disk layouts are supported (see ``EventLogLayout``). The layout of
+    an existing directory is always detected from its contents; ``layout``
+    only selects the format used for a directory that has no events yet.
+    Use ``migrate_to_segmented`` to convert a per-file directory.
+
+    Parsed events are kept in an LRU cache keyed by index, bounded by entry
+    count and by the size of their serialized JSON. Events are immutable once
+    written, so cached objects are shared between callers; see ``cache_info``.
+
     Note:
         For LocalFileStore, file locking via flock() does NOT work reliably
         on NFS mounts or network filesystems. Users deploying with shared
@@ -37,14 +62,93 @@ class EventLog(EventsListBase):
     _dir: str
     _length: int
     _lock_path: str
-
-    def __init__(self, fs: FileStore, dir_path: str = EVENTS_DIR) -> None:
+    _layout: EventLogLayout
+
+    def __init__(
+        self,
+        fs: FileStore,
+        dir_path: str = EVENTS_DIR,
+        layout: EventLogLayout = "files",
+        segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+        cache_limit_size: int = DEFAULT_EVENT_CACHE_SIZE,
+        cache_memory_size: int = DEFAULT_EVENT_CACHE_MEMORY,
+    ) -> None:
         self._fs = fs
         self._dir = dir_path
         self._id_to_idx: dict[EventID, int] = {}
         self._idx_to_id: dict[int, EventID] = {}
         self._lock_path = f"{dir_path}/{LOCK_FILE_NAME}"
-        self._length = self._scan_and_build_index()
+        self._index_path = f"{dir_path}/{EVENT_SEGMENT_INDEX}"
+        self._segment_max_bytes = segment_max_bytes
+        # Segmented layout state: idx -> (segment, byte offset, byte length)
+        self._locations: list[tuple[int, int, int]] = []
+        self._index_bytes = 0
+        self._segment = 0
+        self._segment_size = 0
+        # Open actions, built lazily on first use and then kept up to date by
+        # append(); _pending_upto is the number of events already folded in.
+        self._pending = PendingActionIndex()
+        self._pending_upto = 0
+        # idx -> (event, size of its JSON); memory is accounted by JSON size
+        self._event_cache = MemoryLRUCache(
+            cache_memory_size, cache_limit_size, size_of=lambda entry: entry[1]
+        )
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._layout = self._detect_layout(layout)
+        if self._layout == "segmented":
+            with self._fs.lock(self._lock_path, timeout=LOCK_TIMEOUT_SECONDS):
+                self._length = self._scan_and_build_index()
+                self._recover_segment_tail()
+        else:
+            self._length = self._scan_and_build_index()
+
+    def unmatched_actions(self) -> list[ActionEvent]:
+        """Return executable actions without a matching observation.
+
+        Equivalent to ``ConversationState.get_unmatched_actions(self)``. The first
+        call reads the log once; afterwards only events appended since the
+        previous call are examined.
+        """
+        if self._pending_upto > self._length:
+            self._pending = PendingActionIndex()
+            self._pending_upto = 0
+        if self._pending_upto < self._length:
+            new_events = (
+                iter(self) if self._pending_upto == 0 else self[self._pending_upto :]
+            )
+            for event in new_events:
+                self._pending.add(event)
+            self._pending_upto = self._length
+        return self._pending.unmatched_actions()
+
+    def cache_info(self) -> dict[str, int]:
+        """Statistics for the parsed-event cache."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "entries": len(self._event_cache),
+            "memory": self._event_cache.current_memory,
+        }
+
+    def _cached(self, idx: int) -> Event | None:
+        entry = self._event_cache.get(idx)
+        # Only trust an entry that still agrees with the in-memory index
+        if entry is None or self._idx_to_id.get(idx) != entry[0].id:
+            self._cache_misses += 1
+            return None
+        self._cache_hits += 1
+        return entry[0]
+
+    def _parse(self, idx: int, txt: str | bytes) -> Event:
+        event = Event.model_validate_json(txt)
+        self._event_cache[idx] = (event, len(txt))
+        return event
+
+    @property
+    def layout(self) -> EventLogLayout:
+        """The on-disk layout in use for this log."""
+        return self._layout
 
     def get_index(self, event_id: EventID) -> int:
         """Return the integer index for a given event_id."""
@@ -79,6 +183,9 @@ class EventLog(EventsListBase):
             i += self._length
         if i < 0 or i >= self._length:
             raise IndexError("Event index out of range")
+        cached = self._cached(i)
+        if cached is not None:
+            return cached
         try:
             path = self._path(i)
         except KeyError:
@@ -89,17 +196,26 @@ class EventLog(EventsListBase):
             if i >= self._length:
                 raise IndexError("Event index out of range")
             path = self._path(i)
-        txt = self._fs.read(path)
+        if self._layout == "segmented":
+            seg, offset, length = self._locations[i]
+            txt = self._fs.read_range(self._segment_path(seg), offset, length)
+        else:
+            txt = self._fs.read(path)
         if not txt:
             raise FileNotFoundError(f"Missing event file: {path}")
-        return Event.model_validate_json(txt)
+        return self._parse(i, txt)
 
     def __iter__(self) -> Iterator[Event]:
+        if self._layout == "segmented":
+            yield from self._iter_segments()
+            return
         for i in range(self._length):
-            txt = self._fs.read(self._path(i))
-            if not txt:
-                continue
-            evt = Event.model_validate_json(txt)
+            evt = self._cached(i)
+            if evt is None:
+                txt = self._fs.read(self._path(i))
+                if not txt:
+                    continue
+                evt = self._parse(i, txt)
             evt_id = evt.id
             if i not in self._idx_to_id:
                 self._idx_to_id[i] = evt_id
@@ -118,9 +234,13 @@ class EventLog(EventsListBase):
         try:
             with self._fs.lock(self._lock_path, timeout=LOCK_TIMEOUT_SECONDS):
                 # Sync with disk in case another process wrote while we waited
-                disk_length = self._count_events_on_disk()
-                if disk_length > self._length:
-                    self._sync_from_disk(disk_length)
+                if self._layout == "segmented":
+                    self._ingest_index(self._read_index_tail())
+                    self._length = len(self._locations)
+                else:
+                    disk_length = self._count_events_on_disk()
+                    if disk_length > self._length:
+                        self._sync_from_disk(disk_length)
 
                 if evt_id in self._id_to_idx:
                     existing_idx = self._id_to_idx[evt_id]
@@ -129,10 +249,17 @@ class EventLog(EventsListBase):
                         f"{existing_idx}"
                     )
 
-                target_path = self._path(self._length, event_id=evt_id)
-                self._fs.write(target_path, event.model_dump_json(exclude_none=True))
+                payload = event.model_dump_json(exclude_none=True)
+                if self._layout == "segmented":
+                    self._append_to_segment(evt_id, payload)
+                else:
+                    target_path = self._path(self._length, event_id=evt_id)
+                    self._fs.write(target_path, payload)
                 self._idx_to_id[self._length] = evt_id
                 self._id_to_idx[evt_id] = self._length
+                if self._pending_upto == self._length:
+                    self._pending.add(event)
+                    self._pending_upto += 1
                 self._length += 1
         except TimeoutError:
             logger.error(
@@ -182,6 +309,10 @@ class EventLog(EventsListBase):
         return self._length
 
     def _path(self, idx: int, *, event_id: EventID | None = None) -> str:
+        if self._layout == "segmented":
+            if idx >= len(self._locations):
+                raise KeyError(idx)
+            return self._segment_path(self._locations[idx][0])
         return f"{self._dir}/{
             EVENT_FILE_PATTERN.format(
                 idx=idx, event_id=event_id or self._idx_to_id[idx]
@@ -189,6 +320,12 @@ class EventLog(EventsListBase):
         }"
 
     def _scan_and_build_index(self) -> int:
+        self._event_cache.clear()
+        if self._layout == "segmented":
+            return self._load_segment_index()
+        return self._scan_event_files()
+
+    def _scan_event_files(self) -> int:
         try:
             paths = self._fs.list(self._dir)
         except Exception:
@@ -237,3 +374,222 @@ class EventLog(EventsListBase):
             else:
                 self._id_to_idx[evt_id] = i
         return n
+
+    # ===== Segmented layout =====
+    def _detect_layout(self, requested: EventLogLayout) -> EventLogLayout:
+        """Pick the layout from the directory contents, falling back to
+        ``requested`` for an empty or missing directory."""
+        try:
+            names = [p.rsplit("/", 1)[-1] for p in self._fs.list(self._dir)]
+        except Exception:
+            return requested
+        if EVENT_SEGMENT_INDEX in names:
+            return "segmented"
+        if any(n.startswith("event-") and n.endswith(".json") for n in names):
+            if requested == "segmented":
+                logger.info(
+                    f"Event directory {self._dir} uses the per-file layout; "
+                    "call migrate_to_segmented() to convert it."
+                )
+            return "files"
+        return requested
+
+    def _segment_path(self, seg: int) -> str:
+        return f"{self._dir}/{EVENT_SEGMENT_PATTERN.format(seg=seg)}"
+
+    def _read_index_tail(self) -> str:
+        """Return the part of the offset index written since we last read it."""
+        try:
+            return self._fs.read_range(self._index_path, self._index_bytes)
+        except FileNotFoundError:
+            return ""
+
+    def _load_segment_index(self) -> int:
+        self._id_to_idx.clear()
+        self._idx_to_id.clear()
+        self._locations.clear()
+        self._index_bytes = 0
+        self._segment = 0
+        self._segment_size = 0
+        self._ingest_index(self._read_index_tail())
+        return len(self._locations)
+
+    def _ingest_index(self, text: str) -> None:
+        """Add complete index lines to the in-memory maps.
+
+        A trailing partial line (a write in progress or a crash mid-write) is
+        left unconsumed so that it is re-read on the next call.
+        """
+        end = text.rfind("\n")
+        if end < 0:
+            return
+        self._index_bytes += len(text[: end + 1].encode("utf-8"))
+        for line in text[:end].split("\n"):
+            if not line:
+                continue
+            try:
+                seg_s, offset_s, length_s, evt_id = line.split("\t", 3)
+                seg, offset, length = int(seg_s), int(offset_s), int(length_s)
+            except ValueError:
+                logger.warning(f"Malformed event index line ignored: {line!r}")
+                continue
+            self._record_location(evt_id, seg, offset, length)
+
+    def _record_location(
+        self, evt_id: EventID, seg: int, offset: int, length: int
+    ) -> None:
+        idx = len(self._locations)
+        self._locations.append((seg, offset, length))
+        self._idx_to_id[idx] = evt_id
+        if evt_id in self._id_to_idx:
+            logger.warning(
+                f"Duplicate event ID '{evt_id}' found in segment index. "
+                f"Keeping first occurrence at index {self._id_to_idx[evt_id]}, "
+                f"ignoring duplicate at index {idx}"
+            )
+        else:
+            self._id_to_idx[evt_id] = idx
+        if seg > self._segment:
+            self._segment = seg
+            self._segment_size = 0
+        if seg == self._segment:
+            self._segment_size = max(self._segment_size, offset + length + 1)
+
+    def _recover_segment_tail(self) -> None:
+        """Index events written to the last segment but missing from the index.
+
+        This covers a crash between the segment append and the index append.
+        Any unparseable trailing bytes are left in place and new events are
+        written to a fresh segment so that recorded offsets stay valid.
+        Must be called while holding the log lock.
+        """
+        try:
+            tail = self._fs.read_range(
+                self._segment_path(self._segment), self._segment_size
+            )
+        except FileNotFoundError:
+            return
+        if not tail:
+            return
+
+        data = tail.encode("utf-8")
+        offset = self._segment_size
+        entries: list[str] = []
+        roll = False
+        while data:
+            line, newline, data = data.partition(b"\n")
+            if not newline:
+                roll = True
+                break
+            try:
+                evt_id = Event.model_validate_json(line).id
+            except Exception:
+                roll = True
+                break
+            entries.append(f"{self._segment}\t{offset}\t{len(line)}\t{evt_id}\n")
+            self._record_location(evt_id, self._segment, offset, len(line))
+            offset += len(line) + 1
+
+        if entries:
+            logger.warning(
+                f"Recovered {len(entries)} unindexed event(s) in {self._dir}"
+            )
+            text = "".join(entries)
+            self._fs.append(self._index_path, text)
+            self._index_bytes += len(text.encode("utf-8"))
+            self._length = len(self._locations)
+        if roll:
+            logger.warning(
+                f"Trailing bytes in {self._segment_path(self._segment)} could not "
+                "be parsed; continuing in a new segment."
+            )
+            self._segment += 1
+            self._segment_size = 0
+
+    def _append_to_segment(self, evt_id: EventID, payload: str) -> None:
+        length = len(payload.encode("utf-8"))
+        if (
+            self._segment_size
+            and self._segment_size + length + 1 > self._segment_max_bytes
+        ):
+            self._segment += 1
+            self._segment_size = 0
+        seg, offset = self._segment, self._segment_size
+        # Segment first, index second: a crash in between leaves an event that
+        # _recover_segment_tail() re-indexes on the next open.
+        self._fs.append(self._segment_path(seg), payload + "\n")
+        entry = f"{seg}\t{offset}\t{length}\t{evt_id}\n"
+        self._fs.append(self._index_path, entry)
+        self._index_bytes += len(entry.encode("utf-8"))
+        self._locations.append((seg, offset, length))
+        self._segment_size = offset + length + 1
+
+    def _iter_segments(self) -> Iterator[Event]:
+        """Iterate events reading each segment file at most once."""
+        current_seg = -1
+        data = b""
+        for i in range(self._length):
+            cached = self._cached(i)
+            if cached is not None:
+                yield cached
+                continue
+            seg, offset, length = self._locations[i]
+            if seg != current_seg:
+                data = self._fs.read_range(self._segment_path(seg), 0).encode("utf-8")
+                current_seg = seg
+            yield self._parse(i, data[offset : offset + length])
+
+
+def migrate_to_segmented(
+    fs: FileStore,
+    dir_path: str = EVENTS_DIR,
+    segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+) -> int:
+    """Convert a per-file event directory to the segmented layout in place.
+
+    Segments and the offset index are written before any per-file event is
+    deleted, and the index is written last, so an interrupted migration
+    leaves a directory that still opens with the per-file layout and can be
+    migrated again. Re-running on a segmented directory only removes
+    per-file leftovers.
+
+    Returns:
+        The number of events migrated.
+    """
+    with fs.lock(f"{dir_path}/{LOCK_FILE_NAME}", timeout=LOCK_TIMEOUT_SECONDS):
+        try:
+            paths = fs.list(dir_path)
+        except Exception:
+            paths = []
+        names = {p.rsplit("/", 1)[-1] for p in paths}
+        if EVENT_SEGMENT_INDEX in names:
+            for p in paths:
+                if EVENT_NAME_RE.match(p.rsplit("/", 1)[-1]):
+                    fs.delete(p)
+            return 0
+
+        source = EventLog(fs, dir_path, layout="files")
+        migrated = [source._path(i) for i in range(len(source))]
+        segments: dict[int, list[str]] = {}
+        index_lines: list[str] = []
+        seg, size = 0, 0
+        for i, path in enumerate(migrated):
+            txt = fs.read(path)
+            if "\n" in txt:
+                txt = Event.model_validate_json(txt).model_dump_json(exclude_none=True)
+            length = len(txt.encode("utf-8"))
+            if size and size + length + 1 > segment_max_bytes:
+                seg, size = seg + 1, 0
+            segments.setdefault(seg, []).append(txt + "\n")
+            index_lines.append(f"{seg}\t{size}\t{length}\t{source.get_id(i)}\n")
+            size += length + 1
+
+        for n, lines in segments.items():
+            fs.write(
+                f"{dir_path}/{EVENT_SEGMENT_PATTERN.format(seg=n)}", "".join(lines)
+            )
+        fs.write(f"{dir_path}/{EVENT_SEGMENT_INDEX}", "".join(index_lines))
+        for path in migrated:
+            fs.delete(path)
+        logger.info(f"Migrated {len(index_lines)} events in {dir_path} to segments")
+        return len(index_lines)
@@ -131,3 +131,11 @@ class FIFOLock:
         """
         with self._mutex:
             return self._owner == threading.get_ident()
+
+    def depth(self) -> int:
+        """
+        Return how many times the calling thread currently holds the lock
+        (0 if it does not own it).
+        """
+        with self._mutex:
+            return self._count if self._owner == threading.get_ident() else 0
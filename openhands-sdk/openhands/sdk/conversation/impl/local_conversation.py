@@ -1,4 +1,5 @@
 import atexit
+import threading
 import uuid
 from collections.abc import Mapping
 from pathlib import Path
@@ -6,7 +7,7 @@ from pathlib import Path
 from openhands.sdk.agent.base import AgentBase
 from openhands.sdk.context.prompts.prompt import render_template
 from openhands.sdk.conversation.base import BaseConversation
-from openhands.sdk.conversation.event_store import EventLog
+from openhands.sdk.conversation.event_store import EventLog, EventLogLayout
 from openhands.sdk.conversation.exceptions import ConversationRunError
 from openhands.sdk.conversation.secret_registry import SecretValue
 from openhands.sdk.conversation.state import (
@@ -28,9 +29,11 @@ from openhands.sdk.conversation.visualizer import (
 from openhands.sdk.event import (
     ActionEvent,
     CondensationRequest,
+    Event,
     MessageEvent,
     ObservationEvent,
     PauseEvent,
+    ToolOutputEvent,
     UserRejectObservation,
 )
 from openhands.sdk.event.conversation_error import ConversationErrorEvent
@@ -71,6 +74,7 @@ class LocalConversation(BaseConversation):
     _visualizer: ConversationVisualizerBase | None
     _on_event: ConversationCallbackType
     _on_token: ConversationTokenCallbackType | None
+    _live_event_lock: threading.Lock
     max_iteration_per_run: int
     _stuck_detector: StuckDetector | None
     llm_registry: LLMRegistry
@@ -104,6 +108,8 @@ class LocalConversation(BaseConversation):
         secrets: Mapping[str, SecretValue] | None = None,
         delete_on_close: bool = True,
         cipher: Cipher | None = None,
+        event_log_layout: EventLogLayout = "files",
+        base_state_save_interval: float | None = None,
         **_: object,
     ):
         """Initialize the conversation.
@@ -143,6 +149,13 @@ class LocalConversation(BaseConversation):
                    state. If provided, secrets are encrypted when saving and
                    decrypted when loading. If not provided, secrets are redacted
                    (lost) on serialization.
+            event_log_layout: On-disk event layout for a new conversation
+                   ("files" or "segmented"). Resumed conversations keep the
+                   layout found on disk.
+            base_state_save_interval: If set, state changes made during a step
+                   are coalesced into at most one base_state.json write per this
+                   many seconds, plus one when the state lock is released.
+                   If None, the base state is saved on every change.
         """
         super().__init__()  # Initialize with span tracking
         # Mark cleanup as initiated as early as possible to avoid races or partially
@@ -181,14 +194,21 @@ class LocalConversation(BaseConversation):
             max_iterations=max_iteration_per_run,
             stuck_detection=stuck_detection,
             cipher=cipher,
+            event_log_layout=event_log_layout,
+            base_state_save_interval=base_state_save_interval,
         )
 
         # Default callback: persist every event to state
         def _default_callback(e):
+            # Live tool output is only published, never persisted
+            if isinstance(e, ToolOutputEvent):
+                return
             # This callback runs while holding the conversation state's lock
             # (see BaseConversation.compose_callbacks usage inside `with self._state:`
             # regions), so updating state here is thread-safe.
             self._state.events.append(e)
+            if self._stuck_detector is not None:
+                self._stuck_detector.observe(e)
             # Track user MessageEvent IDs here so hook callbacks (which may
             # synthesize or alter user messages) are captured in one place.
             if isinstance(e, MessageEvent) and e.source == "user":
@@ -233,6 +253,8 @@ class LocalConversation(BaseConversation):
             if token_callbacks
             else None
         )
+        # Serializes live events published from tool threads
+        self._live_event_lock = threading.Lock()
 
         self.max_iteration_per_run = max_iteration_per_run
 
@@ -566,6 +588,16 @@ class LocalConversation(BaseConversation):
             )
             self._on_event(user_msg_event)
 
+    def publish_live_event(self, event: Event) -> None:
+        """Send a transient event, such as live tool output, to the callbacks.
+
+        Unlike events emitted by the agent, live events are not persisted in
+        the conversation state. This may be called from tool threads while the
+        run loop holds the state lock, so the state lock is not taken here.
+        """
+        with self._live_event_lock:
+            self._on_event(event)
+
     @observe(name="conversation.run")
     def run(self) -> None:
         """Runs the conversation until the agent finishes.
@@ -797,6 +829,16 @@ class LocalConversation(BaseConversation):
             return
         self._cleanup_initiated = True
         logger.debug("Closing conversation and cleaning up tool executors")
+        # Save pending state changes. If a step still holds the lock, they are
+        # saved when it releases it.
+        state = getattr(self, "_state", None)
+        if state is not None and state.acquire(blocking=False):
+            try:
+                state.flush()
+            except Exception as e:
+                logger.warning(f"Error saving conversation state: {e}")
+            finally:
+                state.release()
         hook_processor = getattr(self, "_hook_processor", None)
         if hook_processor is not None:
             hook_processor.run_session_end()
@@ -43,6 +43,7 @@ from openhands.sdk.event.conversation_state import (
     ConversationStateUpdateEvent,
 )
 from openhands.sdk.event.llm_completion_log import LLMCompletionLogEvent
+from openhands.sdk.event.tool_output import ToolOutputEvent
 from openhands.sdk.hooks import HookConfig
 from openhands.sdk.llm import LLM, Message, TextContent
 from openhands.sdk.logger import DEBUG, get_logger
@@ -381,6 +382,9 @@ class RemoteEventsList(EventsListBase):
         """Create a default callback that adds events to this list."""
 
         def callback(event: Event) -> None:
+            # Live tool output is not persisted by the server either
+            if isinstance(event, ToolOutputEvent):
+                return
             self.add_event(event)
 
         return callback
@@ -0,0 +1,55 @@
+from openhands.sdk.event import (
+    ActionEvent,
+    AgentErrorEvent,
+    Event,
+    EventID,
+    ObservationEvent,
+    ToolCallID,
+    UserRejectObservation,
+)
+
+
+class PendingActionIndex:
+    """Tracks executable actions that have no matching observation yet.
+
+    Events are fed in chronological order with `add()`. Matching follows
+    `ConversationState.get_unmatched_actions`: an action is resolved by a later
+    ObservationEvent/UserRejectObservation with its `action_id`, or by a later
+    AgentErrorEvent with its `tool_call_id`. Only open actions are kept in memory,
+    so lookups cost O(open actions) regardless of history length.
+    """
+
+    def __init__(self) -> None:
+        self._open: dict[EventID, ActionEvent] = {}
+        self._open_by_tool_call: dict[ToolCallID, set[EventID]] = {}
+
+    def add(self, event: Event) -> None:
+        if isinstance(event, (ObservationEvent, UserRejectObservation)):
+            self._resolve(event.action_id)
+        elif isinstance(event, AgentErrorEvent):
+            for action_id in list(self._open_by_tool_call.get(event.tool_call_id, ())):
+                self._resolve(action_id)
+        elif isinstance(event, ActionEvent) and event.action is not None:
+            self._open[event.id] = event
+            self._open_by_tool_call.setdefault(event.tool_call_id, set()).add(event.id)
+
+    def _resolve(self, action_id: EventID) -> None:
+        action = self._open.pop(action_id, None)
+        if action is None:
+            return
+        ids = self._open_by_tool_call[action.tool_call_id]
+        ids.discard(action_id)
+        if not ids:
+            del self._open_by_tool_call[action.tool_call_id]
+
+    @property
+    def open_action_ids(self) -> set[EventID]:
+        return set(self._open)
+
+    @property
+    def open_tool_call_ids(self) -> set[ToolCallID]:
+        return set(self._open_by_tool_call)
+
+    def unmatched_actions(self) -> list[ActionEvent]:
+        """Open actions in chronological order."""
+        return list(self._open.values())
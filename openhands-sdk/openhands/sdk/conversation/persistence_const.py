@@ -2,8 +2,12 @@ import re
 
 
 BASE_STATE = "base_state.json"
+METRICS_JOURNAL = "metrics.jsonl"
 EVENTS_DIR = "events"
 EVENT_NAME_RE = re.compile(
     r"^event-(?P<idx>\d{5})-(?P<event_id>[0-9a-fA-F\-]{8,})\.json$"
 )
 EVENT_FILE_PATTERN = "event-{idx:05d}-{event_id}.json"
+EVENT_SEGMENT_RE = re.compile(r"^segment-(?P<seg>\d{5})\.jsonl$")
+EVENT_SEGMENT_PATTERN = "segment-{seg:05d}.jsonl"
+EVENT_SEGMENT_INDEX = "segments.idx"
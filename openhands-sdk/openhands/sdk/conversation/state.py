@@ -1,5 +1,6 @@
 # state.py
 import json
+import time
 from collections.abc import Sequence
 from enum import Enum
 from pathlib import Path
@@ -8,8 +9,9 @@ from typing import Any, Self
 from pydantic import Field, PrivateAttr, model_validator
 
 from openhands.sdk.agent.base import AgentBase
+from openhands.sdk.context.view import IncrementalView, View
 from openhands.sdk.conversation.conversation_stats import ConversationStats
-from openhands.sdk.conversation.event_store import EventLog
+from openhands.sdk.conversation.event_store import EventLog, EventLogLayout
 from openhands.sdk.conversation.fifo_lock import FIFOLock
 from openhands.sdk.conversation.persistence_const import BASE_STATE, EVENTS_DIR
 from openhands.sdk.conversation.secret_registry import SecretRegistry
@@ -194,6 +196,17 @@ class ConversationState(OpenHandsModel):
     _lock: FIFOLock = PrivateAttr(
         default_factory=FIFOLock
     )  # FIFO lock for thread safety
+    _view: IncrementalView = PrivateAttr(
+        default_factory=IncrementalView
+    )  # view of the events, maintained as events are appended
+    _save_interval: float | None = PrivateAttr(
+        default=None
+    )  # write-behind window for base state saves; None saves on every change
+    _dirty: bool = PrivateAttr(default=False)  # unsaved field changes (write-behind)
+    _last_save: float = PrivateAttr(default=0.0)  # time.monotonic() of last save
+    _saves: int = PrivateAttr(default=0)
+    _saves_avoided: int = PrivateAttr(default=0)
+    _bytes_written: int = PrivateAttr(default=0)
 
     @model_validator(mode="before")
     @classmethod
@@ -222,6 +235,15 @@ class ConversationState(OpenHandsModel):
     def events(self) -> EventLog:
         return self._events
 
+    @property
+    def view(self) -> View:
+        """The LLM-facing view of the events, equal to `View.from_events(events)`.
+
+        Only events appended since the last access are processed, so reading the
+        view once per step costs O(new events + view size) rather than O(history).
+        """
+        return self._view.get(self._events)
+
     @property
     def env_observation_persistence_dir(self) -> str | None:
         """Directory for persisting environment observation files."""
@@ -244,9 +266,12 @@ class ConversationState(OpenHandsModel):
         Persist base state snapshot (no events; events are file-backed).
 
         If a cipher is configured, secrets will be encrypted. Otherwise, they
-        will be redacted (serialized as '**********').
+        will be redacted (serialized as '**********'). Per-call LLM metrics are
+        appended to the metrics journal instead of being re-serialized.
         """
-        context = {"cipher": self._cipher} if self._cipher else None
+        context: dict[str, Any] = {"metrics_journal": True}
+        if self._cipher:
+            context["cipher"] = self._cipher
         # Warn if secrets exist but no cipher is configured
         if not self._cipher and self.secret_registry.secret_sources:
             logger.warning(
@@ -255,8 +280,31 @@ class ConversationState(OpenHandsModel):
                 "redacted and lost on restore. Consider providing a cipher to "
                 "preserve secrets."
             )
+        self.stats.write_journal()
         payload = self.model_dump_json(exclude_none=True, context=context)
-        fs.write(BASE_STATE, payload)
+        fs.write_atomic(BASE_STATE, payload)
+        self._dirty = False
+        self._last_save = time.monotonic()
+        self._saves += 1
+        self._bytes_written += len(payload.encode("utf-8"))
+
+    def flush(self) -> None:
+        """Write pending base state changes, if any.
+
+        Only needed with a base state save interval: changes are then saved when
+        the interval has elapsed, when the lock is released, or on flush.
+        """
+        fs = getattr(self, "_fs", None)
+        if self._dirty and fs is not None:
+            self._save_base_state(fs)
+
+    def save_info(self) -> dict[str, int]:
+        """Statistics for base state persistence."""
+        return {
+            "saves": self._saves,
+            "saves_avoided": self._saves_avoided,
+            "bytes_written": self._bytes_written,
+        }
 
     # ===== Factory: open-or-create (no load/save methods needed) =====
     @classmethod
@@ -269,6 +317,8 @@ class ConversationState(OpenHandsModel):
         max_iterations: int = 500,
         stuck_detection: bool = True,
         cipher: Cipher | None = None,
+        event_log_layout: EventLogLayout = "files",
+        base_state_save_interval: float | None = None,
     ) -> "ConversationState":
         """Create a new conversation state or resume from persistence.
 
@@ -296,6 +346,12 @@ class ConversationState(OpenHandsModel):
                     persisted state. If provided, secrets are encrypted when
                     saving and decrypted when loading. If not provided, secrets
                     are redacted (lost) on serialization.
+            event_log_layout: On-disk event layout for a new conversation.
+                    Resumed conversations keep the layout found on disk.
+            base_state_save_interval: If set, field changes made while the
+                    state lock is held are coalesced and saved at most once per
+                    this many seconds, and when the lock is released. If None,
+                    base_state.json is saved on every change.
 
         Returns:
             ConversationState ready for use
@@ -332,6 +388,8 @@ class ConversationState(OpenHandsModel):
             state._fs = file_store
             state._events = EventLog(file_store, dir_path=EVENTS_DIR)
             state._cipher = cipher
+            state.stats.attach_journal(file_store)
+            state._save_interval = base_state_save_interval
 
             # Verify compatibility (agent class + tools)
             agent.verify(state.agent, events=state._events)
@@ -344,10 +402,13 @@ class ConversationState(OpenHandsModel):
 
             # Note: stats are already deserialized from base_state.json above.
             # Do NOT reset stats here - this would lose accumulated metrics.
+            # Per-call records are read from the metrics journal when first used,
+            # so leave them out of the log.
+            log_context = {"metrics_journal": True}
 
             logger.info(
                 f"Resumed conversation {state.id} from persistent storage.\n"
-                f"State: {state.model_dump(exclude={'agent'})}\n"
+                f"State: {state.model_dump(exclude={'agent'}, context=log_context)}\n"
                 f"Agent: {state.agent.model_dump_succint()}"
             )
             return state
@@ -367,9 +428,13 @@ class ConversationState(OpenHandsModel):
             stuck_detection=stuck_detection,
         )
         state._fs = file_store
-        state._events = EventLog(file_store, dir_path=EVENTS_DIR)
+        state._events = EventLog(
+            file_store, dir_path=EVENTS_DIR, layout=event_log_layout
+        )
         state._cipher = cipher
+        state._save_interval = base_state_save_interval
         state.stats = ConversationStats()
+        state.stats.attach_journal(file_store)
 
         state._save_base_state(file_store)  # initial snapshot
         state._autosave_enabled = True
@@ -398,11 +463,20 @@ class ConversationState(OpenHandsModel):
             return
 
         if old is _sentinel or old != value:
-            try:
-                self._save_base_state(fs)
-            except Exception as e:
-                logger.exception("Auto-persist base_state failed", exc_info=True)
-                raise e
+            # In write-behind mode, changes made under the lock are saved when
+            # the window has elapsed or when the lock is released
+            if self._save_interval is not None and self._lock.owned():
+                if self._dirty:
+                    self._saves_avoided += 1
+                self._dirty = True
+                if time.monotonic() - self._last_save >= self._save_interval:
+                    self.flush()
+            else:
+                try:
+                    self._save_base_state(fs)
+                except Exception as e:
+                    logger.exception("Auto-persist base_state failed", exc_info=True)
+                    raise e
 
             # Call state change callback if set
             callback = getattr(self, "_on_state_change", None)
@@ -461,6 +535,10 @@ class ConversationState(OpenHandsModel):
         it doesn't have an action_id field. This is important for crash recovery
         scenarios where an error event is emitted after a server restart.
 
+        When ``events`` is an EventLog (e.g. ``state.events``), the log's pending
+        action index is used, so only events appended since the previous call are
+        examined instead of scanning the whole history.
+
         Args:
             events: List of events to search through
 
@@ -468,6 +546,9 @@ class ConversationState(OpenHandsModel):
             List of ActionEvent objects that don't have corresponding observations,
             in chronological order
         """
+        if isinstance(events, EventLog):
+            return events.unmatched_actions()
+
         observed_action_ids: set[EventID] = set()
         observed_tool_call_ids: set[str] = set()
         unmatched_actions = []
@@ -514,7 +595,11 @@ class ConversationState(OpenHandsModel):
         Raises:
             RuntimeError: If the current thread doesn't own the lock.
         """
-        self._lock.release()
+        try:
+            if self._dirty and self._lock.depth() == 1:
+                self.flush()
+        finally:
+            self._lock.release()
 
     def __enter__(self: Self) -> Self:
         """Context manager entry."""
@@ -523,7 +608,7 @@ class ConversationState(OpenHandsModel):
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Context manager exit."""
-        self._lock.release()
+        self.release()
 
     def locked(self) -> bool:
         """
@@ -1,3 +1,7 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Literal
+
 from openhands.sdk.conversation.state import ConversationState
 from openhands.sdk.conversation.types import StuckDetectionThresholds
 from openhands.sdk.event import (
@@ -20,6 +24,68 @@ logger = get_logger(__name__)
 # (4 repeats × 2 events per cycle = 8 events minimum, plus buffer for user messages)
 MAX_EVENTS_TO_SCAN_FOR_STUCK_DETECTION: int = 20
 
+EventKind = Literal[
+    "user_message",
+    "agent_message",
+    "message",
+    "action",
+    "observation",
+    "error",
+    "other_observation",
+    "condensation_summary",
+    "other",
+]
+
+
+@dataclass(frozen=True, slots=True)
+class EventFingerprint:
+    """Compact summary of an event for stuck detection.
+
+    Two events with the same ``key`` are considered repeats: the key covers
+    the event type and the content that matters (tool, arguments, thought,
+    observation or error text) and ignores ids that vary between calls.
+    """
+
+    kind: EventKind
+    key: int
+
+    @classmethod
+    def of(cls, event: Event) -> "EventFingerprint":
+        name = type(event).__name__
+        if isinstance(event, ActionEvent):
+            thought = tuple(t.model_dump_json() for t in event.thought)
+            action = (
+                (type(event.action).__name__, event.action.model_dump_json())
+                if event.action is not None
+                else None
+            )
+            content = (event.source, event.tool_name, thought, action)
+            return cls("action", hash((name, content)))
+        if isinstance(event, ObservationEvent):
+            content = (
+                event.source,
+                event.tool_name,
+                type(event.observation).__name__,
+                event.observation.model_dump_json(),
+            )
+            return cls("observation", hash((name, content)))
+        if isinstance(event, AgentErrorEvent):
+            return cls("error", hash((name, event.source, event.error)))
+        if isinstance(event, MessageEvent):
+            kind: EventKind = "message"
+            if event.source == "user":
+                kind = "user_message"
+            elif event.source == "agent":
+                kind = "agent_message"
+            content = (event.source, event.llm_message.model_dump_json())
+            return cls(kind, hash((name, content)))
+        # Other events never repeat: their equality includes the event id
+        if isinstance(event, ObservationBaseEvent):
+            return cls("other_observation", hash((name, event.id)))
+        if isinstance(event, CondensationSummaryEvent):
+            return cls("condensation_summary", hash((name, event.id)))
+        return cls("other", hash((name, event.id)))
+
 
 class StuckDetector:
     """Detects when an agent is stuck in repetitive or unproductive patterns.
@@ -30,6 +96,11 @@ class StuckDetector:
     3. Agent monologue (repeated messages without user input)
     4. Repeating alternating action-observation patterns
     5. Context window errors indicating memory issues
+
+    The detector keeps fingerprints of the most recent events in a ring
+    buffer. The conversation feeds it each appended event through
+    :meth:`observe`; events appended any other way are picked up from
+    ``state.events`` on the next :meth:`is_stuck` call.
     """
 
     state: ConversationState
@@ -42,6 +113,17 @@ class StuckDetector:
     ):
         self.state = state
         self.thresholds = thresholds or StuckDetectionThresholds()
+        # Every pattern needs at most two events per repetition
+        longest_pattern = 2 * max(
+            self.thresholds.action_observation,
+            self.thresholds.action_error,
+            self.thresholds.monologue,
+            self.thresholds.alternating_pattern,
+        )
+        self.window = max(MAX_EVENTS_TO_SCAN_FOR_STUCK_DETECTION, longest_pattern + 2)
+        self._fingerprints: deque[EventFingerprint] = deque(maxlen=self.window)
+        # Number of state events covered by the buffer; None until first sync
+        self._seen: int | None = None
 
     @property
     def action_observation_threshold(self) -> int:
@@ -59,22 +141,44 @@ class StuckDetector:
     def alternating_pattern_threshold(self) -> int:
         return self.thresholds.alternating_pattern
 
+    def observe(self, event: Event) -> None:
+        """Record an event that was just appended to ``state.events``."""
+        if self._seen is None or len(self.state.events) != self._seen + 1:
+            # Out of sync; the next is_stuck() call reloads from the state
+            return
+        self._fingerprints.append(EventFingerprint.of(event))
+        self._seen += 1
+
+    def _sync(self) -> None:
+        """Fingerprint events that were appended without :meth:`observe`."""
+        total = len(self.state.events)
+        if self._seen is not None and self._seen == total:
+            return
+        if self._seen is None or total < self._seen or total - self._seen > self.window:
+            self._fingerprints.clear()
+            new_events = self.state.events[-self.window :]
+        else:
+            new_events = self.state.events[self._seen - total :]
+        self._fingerprints.extend(EventFingerprint.of(e) for e in new_events)
+        self._seen = total
+
     def is_stuck(self) -> bool:
         """Check if the agent is currently stuck.
 
-        Note: To avoid materializing potentially large file-backed event histories,
-        only the last MAX_EVENTS_TO_SCAN_FOR_STUCK_DETECTION events are analyzed.
-        If a user message exists within this window, only events after it are checked.
-        Otherwise, all events in the window are analyzed.
+        Only the fingerprints of the last ``window`` events are analyzed, so no
+        events are read from storage while the conversation keeps the detector
+        up to date. If a user message exists within this window, only events
+        after it are checked. Otherwise, all events in the window are analyzed.
         """
-        events = list(self.state.events[-MAX_EVENTS_TO_SCAN_FOR_STUCK_DETECTION:])
+        self._sync()
+        events = list(self._fingerprints)
 
         # Only look at history after the last user message
         last_user_msg_index = next(
             (
                 i
                 for i in reversed(range(len(events)))
-                if isinstance(events[i], MessageEvent) and events[i].source == "user"
+                if events[i].kind == "user_message"
             ),
             -1,  # Default to -1 if no user message found
         )
@@ -91,21 +195,19 @@ class StuckDetector:
             return False
 
         logger.debug(f"Checking for stuck patterns in {len(events)} events")
-        logger.debug(
-            f"Events after last user message: {[type(e).__name__ for e in events]}"
-        )
+        logger.debug(f"Events after last user message: {[e.kind for e in events]}")
 
         # Collect enough actions and observations for detection
         max_needed = max(self.action_observation_threshold, self.action_error_threshold)
-        last_actions: list[Event] = []
-        last_observations: list[Event] = []
+        last_actions: list[EventFingerprint] = []
+        last_observations: list[EventFingerprint] = []
 
         # Retrieve the last N actions and observations from the end of history
         for event in reversed(events):
-            if isinstance(event, ActionEvent) and len(last_actions) < max_needed:
+            if event.kind == "action" and len(last_actions) < max_needed:
                 last_actions.append(event)
             elif (
-                isinstance(event, ObservationBaseEvent)
+                event.kind in _OBSERVATION_KINDS
                 and len(last_observations) < max_needed
             ):
                 last_observations.append(event)
@@ -138,7 +240,9 @@ class StuckDetector:
         return False
 
     def _is_stuck_repeating_action_observation(
-        self, last_actions: list[Event], last_observations: list[Event]
+        self,
+        last_actions: list[EventFingerprint],
+        last_observations: list[EventFingerprint],
     ) -> bool:
         # scenario 1: same action, same observation
         threshold = self.action_observation_threshold
@@ -149,14 +253,8 @@ class StuckDetector:
                 f"Found {len(last_actions)} actions and "
                 f"{len(last_observations)} observations, checking for equality"
             )
-            actions_equal = all(
-                self._event_eq(last_actions[0], action)
-                for action in last_actions[:threshold]
-            )
-            observations_equal = all(
-                self._event_eq(last_observations[0], observation)
-                for observation in last_observations[:threshold]
-            )
+            actions_equal = _all_same(last_actions[:threshold])
+            observations_equal = _all_same(last_observations[:threshold])
             logger.debug(
                 f"Actions equal: {actions_equal}, "
                 f"Observations equal: {observations_equal}"
@@ -174,7 +272,9 @@ class StuckDetector:
         return False
 
     def _is_stuck_repeating_action_error(
-        self, last_actions: list[Event], last_observations: list[Event]
+        self,
+        last_actions: list[EventFingerprint],
+        last_observations: list[EventFingerprint],
     ) -> bool:
         # scenario 2: same action, errors
         threshold = self.action_error_threshold
@@ -182,22 +282,16 @@ class StuckDetector:
             return False
 
         # are the last N actions the "same"?
-        if all(
-            self._event_eq(last_actions[0], action)
-            for action in last_actions[:threshold]
-        ):
+        if _all_same(last_actions[:threshold]):
             # and the last N observations are all errors?
-            if all(
-                isinstance(obs, AgentErrorEvent)
-                for obs in last_observations[:threshold]
-            ):
+            if all(obs.kind == "error" for obs in last_observations[:threshold]):
                 logger.warning("Action, Error loop detected")
                 return True
 
         # Check if observations are errors
         return False
 
-    def _is_stuck_monologue(self, events: list[Event]) -> bool:
+    def _is_stuck_monologue(self, events: list[EventFingerprint]) -> bool:
         # scenario 3: monologue
         # check for repeated MessageActions with source=AGENT
         # see if the agent is engaged in a good old monologue, telling
@@ -210,13 +304,13 @@ class StuckDetector:
         agent_message_count = 0
 
         for event in reversed(events):
-            if isinstance(event, MessageEvent):
-                if event.source == "agent":
-                    agent_message_count += 1
-                elif event.source == "user":
-                    break  # User interrupted, not a monologue
-            elif isinstance(event, CondensationSummaryEvent):
-                # Condensation events don't break the monologue pattern
+            if event.kind == "agent_message":
+                agent_message_count += 1
+            elif event.kind == "user_message":
+                break  # User interrupted, not a monologue
+            elif event.kind in ("message", "condensation_summary"):
+                # Other messages and condensation events don't break the
+                # monologue pattern
                 continue
             else:
                 # Other events (actions/observations) don't count as monologue
@@ -224,19 +318,21 @@ class StuckDetector:
 
         return agent_message_count >= threshold
 
-    def _is_stuck_alternating_action_observation(self, events: list[Event]) -> bool:
+    def _is_stuck_alternating_action_observation(
+        self, events: list[EventFingerprint]
+    ) -> bool:
         # scenario 4: alternating action-observation loop
         threshold = self.alternating_pattern_threshold
 
-        last_actions: list[Event] = []
-        last_observations: list[Event] = []
+        last_actions: list[EventFingerprint] = []
+        last_observations: list[EventFingerprint] = []
 
         # collect most recent N actions and N observations
         for event in reversed(events):
-            if isinstance(event, ActionEvent) and len(last_actions) < threshold:
+            if event.kind == "action" and len(last_actions) < threshold:
                 last_actions.append(event)
             elif (
-                isinstance(event, (ObservationEvent, AgentErrorEvent))
+                event.kind in ("observation", "error")
                 and len(last_observations) < threshold
             ):
                 last_observations.append(event)
@@ -247,11 +343,11 @@ class StuckDetector:
         if len(last_actions) == threshold and len(last_observations) == threshold:
             # Check alternating pattern: [A, B, A, B, A, B] where even/odd match
             actions_equal = all(
-                self._event_eq(last_actions[i], last_actions[i + 2])
+                last_actions[i].key == last_actions[i + 2].key
                 for i in range(threshold - 2)
             )
             observations_equal = all(
-                self._event_eq(last_observations[i], last_observations[i + 2])
+                last_observations[i].key == last_observations[i + 2].key
                 for i in range(threshold - 2)
             )
 
@@ -261,7 +357,9 @@ class StuckDetector:
 
         return False
 
-    def _is_stuck_context_window_error(self, _events: list[Event]) -> bool:
+    def _is_stuck_context_window_error(
+        self, _events: list[EventFingerprint]
+    ) -> bool:
         """Detects if we are stuck in a loop of context window errors.
 
         This happens when we repeatedly get context window errors and try to trim,
@@ -272,49 +370,9 @@ class StuckDetector:
         # TODO: blocked by https://github.com/OpenHands/agent-sdk/issues/282
         return False
 
-    def _event_eq(self, event1: Event, event2: Event) -> bool:
-        """
-        Compare two events for equality, ignoring irrelevant
-        details like ids, metrics.
-        """
-        # Must be same type
-        if type(event1) is not type(event2):
-            return False
-
-        # For ActionEvents, compare the action content, ignoring IDs
-        if isinstance(event1, ActionEvent) and isinstance(event2, ActionEvent):
-            return (
-                event1.source == event2.source
-                and event1.thought == event2.thought
-                and event1.action == event2.action
-                and event1.tool_name == event2.tool_name
-                # Ignore tool_call_id, llm_response_id, action_id as they vary
-            )
 
-        # For ObservationEvents, compare the observation content, ignoring IDs
-        if isinstance(event1, ObservationEvent) and isinstance(
-            event2, ObservationEvent
-        ):
-            return (
-                event1.source == event2.source
-                and event1.observation == event2.observation
-                and event1.tool_name == event2.tool_name
-                # Ignore action_id, tool_call_id as they vary
-            )
+_OBSERVATION_KINDS = ("observation", "error", "other_observation")
 
-        # For AgentErrorEvents, compare the error content
-        if isinstance(event1, AgentErrorEvent) and isinstance(event2, AgentErrorEvent):
-            return (
-                event1.source == event2.source and event1.error == event2.error
-                # Ignore action_id as it varies
-            )
-
-        # For MessageEvents, compare the message content
-        if isinstance(event1, MessageEvent) and isinstance(event2, MessageEvent):
-            return (
-                event1.source == event2.source
-                and event1.llm_message == event2.llm_message
-            )
 
-        # Default fallback
-        return event1 == event2
+def _all_same(fingerprints: list[EventFingerprint]) -> bool:
+    return all(f.key == fingerprints[0].key for f in fingerprints)
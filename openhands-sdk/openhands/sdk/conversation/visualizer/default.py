@@ -19,6 +19,7 @@ from openhands.sdk.event import (
     ObservationEvent,
     PauseEvent,
     SystemPromptEvent,
+    ToolOutputEvent,
     UserRejectObservation,
 )
 from openhands.sdk.event.base import Event
@@ -213,6 +214,11 @@ EVENT_VISUALIZATION_CONFIG: dict[type[Event], EventVisualizationConfig] = {
         color=_SYSTEM_COLOR,
         skip=True,
     ),
+    ToolOutputEvent: EventVisualizationConfig(
+        title="Tool Output",
+        color=_OBSERVATION_COLOR,
+        skip=True,
+    ),
 }
 
 
@@ -14,6 +14,8 @@ from pydantic import (
 )
 from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
+from openhands.sdk.utils.http_pool import get_http_client
+
 from .chat_template import ChatTemplateRenderer
 
 
@@ -107,7 +109,7 @@ class CriticClient(BaseModel):
     )
 
     # --- runtime fields ---
-    _client: httpx.Client = PrivateAttr(default_factory=httpx.Client)
+    _client: httpx.Client = PrivateAttr(default_factory=get_http_client)
     _template_renderer: ChatTemplateRenderer | None = PrivateAttr(default=None)
 
     # --- label space ---
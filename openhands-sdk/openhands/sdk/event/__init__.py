@@ -19,6 +19,7 @@ from openhands.sdk.event.llm_convertible import (
     UserRejectObservation,
 )
 from openhands.sdk.event.token import TokenEvent
+from openhands.sdk.event.tool_output import ToolOutputEvent
 from openhands.sdk.event.types import EventID, ToolCallID
 from openhands.sdk.event.user_action import PauseEvent
 
@@ -30,6 +31,7 @@ __all__ = [
     "SystemPromptEvent",
     "ActionEvent",
     "TokenEvent",
+    "ToolOutputEvent",
     "ObservationEvent",
     "ObservationBaseEvent",
     "MessageEvent",
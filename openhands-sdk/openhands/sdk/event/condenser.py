@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 from pydantic import Field
 from rich.text import Text
 
@@ -33,6 +35,11 @@ class Condensation(Event):
             "Completion or Response ID of the LLM response that generated this event"
         ),
     )
+    metadata: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Diagnostic information recorded by the condenser, such as the "
+        "size of the summarization prompt.",
+    )
 
     source: SourceType = "environment"
 
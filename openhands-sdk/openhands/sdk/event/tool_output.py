@@ -0,0 +1,47 @@
+"""Event for streaming the output of tool calls that are still running."""
+
+from pydantic import Field
+from rich.text import Text
+
+from openhands.sdk.event.base import Event
+from openhands.sdk.event.types import EventID, SourceType, ToolCallID
+
+
+class ToolOutputEvent(Event):
+    """A chunk of output from a tool call that has not finished yet.
+
+    These events are published to conversation callbacks (UIs, WebSocket
+    subscribers) while the tool runs. They are not persisted and never sent
+    to the LLM, which only sees the final ``ObservationEvent``.
+    """
+
+    source: SourceType = "environment"
+    tool_name: str = Field(..., description="The tool that produced the output")
+    tool_call_id: ToolCallID = Field(
+        ..., description="The tool call id of the running action"
+    )
+    action_id: EventID = Field(..., description="The id of the running ActionEvent")
+    output: str = Field(..., description="Output produced since the last chunk")
+    sequence: int = Field(
+        default=0, description="Position of this chunk within the tool call"
+    )
+    dropped_chars: int = Field(
+        default=0,
+        description="Characters produced before this chunk that were not streamed",
+    )
+
+    @property
+    def visualize(self) -> Text:
+        content = Text()
+        if self.dropped_chars:
+            content.append(
+                f"[{self.dropped_chars} characters not streamed]\n", style="dim"
+            )
+        content.append(self.output)
+        return content
+
+    def __str__(self) -> str:
+        return (
+            f"{self.__class__.__name__} ({self.source}): {self.tool_name} "
+            f"#{self.sequence} ({len(self.output)} chars)"
+        )
@@ -63,6 +63,49 @@ class FileStore(ABC):
             True if the path exists, False otherwise.
         """
 
+    def append(self, path: str, contents: str) -> None:
+        """Append text to the end of a file, creating it if needed.
+
+        The default implementation rewrites the whole file; backends that can
+        append natively should override it.
+
+        Args:
+            path: The file path to append to.
+            contents: The text to append.
+        """
+        try:
+            existing = self.read(path)
+        except FileNotFoundError:
+            existing = ""
+        self.write(path, existing + contents)
+
+    def write_atomic(self, path: str, contents: str) -> None:
+        """Replace a file's contents so readers never see a partial write.
+
+        The default implementation delegates to `write`; backends whose writes
+        are not atomic should override it.
+
+        Args:
+            path: The file path to write.
+            contents: The text to write.
+        """
+        self.write(path, contents)
+
+    def read_range(self, path: str, offset: int, length: int | None = None) -> str:
+        """Read part of a file, addressed in UTF-8 bytes.
+
+        Args:
+            path: The file path to read from.
+            offset: Byte offset to start reading at.
+            length: Number of bytes to read, or None to read to the end.
+
+        Returns:
+            The decoded text of the requested range.
+        """
+        data = self.read(path).encode("utf-8")
+        end = None if length is None else offset + length
+        return data[offset:end].decode("utf-8")
+
     @abstractmethod
     def get_absolute_path(self, path: str) -> str:
         """Get the absolute filesystem path for a given relative path.
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from typing import Any
 
 from cachetools import LRUCache
@@ -18,15 +19,24 @@ class MemoryLRUCache(LRUCache):
     When either limit is exceeded, the least recently used items are evicted.
 
     Note: Memory tracking is based on string length for simplicity and accuracy.
-    For non-string values, sys.getsizeof is used as a rough approximation.
+    For non-string values, sys.getsizeof is used as a rough approximation unless
+    a ``size_of`` function is provided.
     """
 
-    def __init__(self, max_memory: int, max_size: int, *args, **kwargs):
+    def __init__(
+        self,
+        max_memory: int,
+        max_size: int,
+        *args,
+        size_of: Callable[[Any], int] | None = None,
+        **kwargs,
+    ):
         # Ensure minimum maxsize of 1 to avoid LRUCache issues
         maxsize = max(1, max_size)
         super().__init__(maxsize=maxsize, *args, **kwargs)
         self.max_memory = max_memory
         self.current_memory = 0
+        self._size_of = size_of
 
     def _get_size(self, value: Any) -> int:
         """Calculate size of value for memory tracking.
@@ -35,6 +45,8 @@ class MemoryLRUCache(LRUCache):
         accurate character count. For other types, we use sys.getsizeof() as
         a rough approximation.
         """
+        if self._size_of is not None:
+            return self._size_of(value)
         if isinstance(value, str):
             # For strings, len() gives character count which is what we care about
             # This is much more accurate than sys.getsizeof for our use case
@@ -72,6 +72,33 @@ class LocalFileStore(FileStore):
             # Don't cache binary content - LocalFileStore is meant for JSON data
             # If binary data is written and then read, it will error on read
 
+    def write_atomic(self, path: str, contents: str) -> None:
+        full_path = self.get_full_path(path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        tmp_path = f"{full_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(contents)
+        os.replace(tmp_path, full_path)
+        self.cache[full_path] = contents
+
+    def append(self, path: str, contents: str) -> None:
+        full_path = self.get_full_path(path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "a", encoding="utf-8") as f:
+            f.write(contents)
+        self.cache.pop(full_path, None)
+
+    def read_range(self, path: str, offset: int, length: int | None = None) -> str:
+        full_path = self.get_full_path(path)
+        if not os.path.exists(full_path):
+            raise FileNotFoundError(path)
+        # Bypass the cache: ranged reads target large append-only files that
+        # would otherwise evict everything else.
+        with open(full_path, "rb") as f:
+            f.seek(offset)
+            data = f.read() if length is None else f.read(length)
+        return data.decode("utf-8")
+
     def read(self, path: str) -> str:
         full_path = self.get_full_path(path)
 
@@ -112,7 +139,7 @@ class LocalFileStore(FileStore):
 
             if os.path.isfile(full_path):
                 os.remove(full_path)
-                del self.cache[full_path]
+                self.cache.pop(full_path, None)
                 logger.debug(f"Removed local file: {full_path}")
             elif os.path.isdir(full_path):
                 shutil.rmtree(full_path)
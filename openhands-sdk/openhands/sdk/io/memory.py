@@ -28,6 +28,9 @@ class InMemoryFileStore(FileStore):
             contents = contents.decode("utf-8")
         self.files[path] = contents
 
+    def append(self, path: str, contents: str) -> None:
+        self.files[path] = self.files.get(path, "") + contents
+
     def read(self, path: str) -> str:
         if path not in self.files:
             raise FileNotFoundError(path)
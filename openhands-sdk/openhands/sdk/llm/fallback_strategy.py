@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Generator
+from collections.abc import Awaitable, Callable, Generator, Iterator
+from contextlib import contextmanager
 from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Final
@@ -78,37 +79,16 @@ class FallbackStrategy(BaseModel):
         Returns:
             LLMResponse from the first successful fallback, or None if all fail.
         """
-        total = len(self.fallback_llms)
         tried = 0
-        for i, fb in enumerate(self._iter_fallbacks()):
+        for i, fb in self._announce_fallbacks(primary_model, primary_error):
             tried += 1
-            remaining = total - i - 1
-            logger.warning(
-                f"[Fallback Strategy]Primary LLM ({primary_model}) failed with "
-                f"{type(primary_error).__name__}, "
-                f"trying fallback {i + 1}/{total} ({fb.model}); "
-                f"{remaining} fallback(s) remaining"
-            )
             try:
-                # Disable nested fallbacks to prevent recursive chains
-                saved_strategy = fb.fallback_strategy
-                fb.fallback_strategy = None
-                metrics_before = fb.metrics.deep_copy()
-                try:
+                with self._fallback_call(fb, primary_metrics):
                     result = call_fn(fb)
-                finally:
-                    fb.fallback_strategy = saved_strategy
-                # Merge fallback metrics (cost + tokens) into primary
-                metrics_diff = fb.metrics.diff(metrics_before)
-                primary_metrics.merge(metrics_diff)
                 logger.info(f"[Fallback Strategy] Fallback LLM ({fb.model}) succeeded")
                 return result
             except Exception as fb_error:
-                logger.warning(
-                    "[Fallback Strategy]"
-                    f"Fallback {i + 1} ({fb.model}) failed: "
-                    f"{type(fb_error).__name__}: {fb_error}"
-                )
+                self._log_fallback_error(i, fb, fb_error)
                 continue
 
         if tried > 0:
@@ -117,6 +97,67 @@ class FallbackStrategy(BaseModel):
             )
         return None
 
+    async def atry_fallback(
+        self,
+        primary_model: str,
+        primary_error: Exception,
+        primary_metrics: Metrics,
+        call_fn: Callable[[Any], Awaitable[LLMResponse]],
+    ) -> LLMResponse | None:
+        """Async version of `try_fallback`, awaiting each fallback call."""
+        tried = 0
+        for i, fb in self._announce_fallbacks(primary_model, primary_error):
+            tried += 1
+            try:
+                with self._fallback_call(fb, primary_metrics):
+                    result = await call_fn(fb)
+                logger.info(f"[Fallback Strategy] Fallback LLM ({fb.model}) succeeded")
+                return result
+            except Exception as fb_error:
+                self._log_fallback_error(i, fb, fb_error)
+                continue
+
+        if tried > 0:
+            logger.error(
+                "[Fallback Strategy] All fallback LLMs failed; re-raising primary error"
+            )
+        return None
+
+    def _announce_fallbacks(
+        self, primary_model: str, primary_error: Exception
+    ) -> Generator[tuple[int, Any]]:
+        total = len(self.fallback_llms)
+        for i, fb in enumerate(self._iter_fallbacks()):
+            remaining = total - i - 1
+            logger.warning(
+                f"[Fallback Strategy]Primary LLM ({primary_model}) failed with "
+                f"{type(primary_error).__name__}, "
+                f"trying fallback {i + 1}/{total} ({fb.model}); "
+                f"{remaining} fallback(s) remaining"
+            )
+            yield i, fb
+
+    @contextmanager
+    def _fallback_call(self, fb: Any, primary_metrics: Metrics) -> Iterator[None]:
+        # Disable nested fallbacks to prevent recursive chains
+        saved_strategy = fb.fallback_strategy
+        fb.fallback_strategy = None
+        metrics_before = fb.metrics.deep_copy()
+        try:
+            yield
+        finally:
+            fb.fallback_strategy = saved_strategy
+        # Merge fallback metrics (cost + tokens) into primary
+        metrics_diff = fb.metrics.diff(metrics_before)
+        primary_metrics.merge(metrics_diff)
+
+    def _log_fallback_error(self, i: int, fb: Any, fb_error: Exception) -> None:
+        logger.warning(
+            "[Fallback Strategy]"
+            f"Fallback {i + 1} ({fb.model}) failed: "
+            f"{type(fb_error).__name__}: {fb_error}"
+        )
+
     @cached_property
     def _profile_store(self) -> LLMProfileStore:
         return LLMProfileStore(self.profile_store_dir)
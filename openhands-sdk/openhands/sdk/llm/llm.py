@@ -4,8 +4,9 @@ import copy
 import json
 import os
 import warnings
-from collections.abc import Callable, Sequence
+from collections.abc import Awaitable, Callable, Sequence
 from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, get_args, get_origin
 
 import httpx  # noqa: F401
@@ -38,12 +39,15 @@ with warnings.catch_warnings():
     warnings.simplefilter("ignore")
     import litellm
 
+from contextvars import ContextVar
+from types import ModuleType
 from typing import Final, cast
 
 from litellm import (
     ChatCompletionToolParam,
     CustomStreamWrapper,
     ResponseInputParam,
+    acompletion as litellm_acompletion,
     completion as litellm_completion,
 )
 from litellm.exceptions import (
@@ -53,8 +57,14 @@ from litellm.exceptions import (
     ServiceUnavailableError,
     Timeout as LiteLLMTimeout,
 )
-from litellm.responses.main import responses as litellm_responses
-from litellm.responses.streaming_iterator import SyncResponsesAPIStreamingIterator
+from litellm.responses.main import (
+    aresponses as litellm_aresponses,
+    responses as litellm_responses,
+)
+from litellm.responses.streaming_iterator import (
+    ResponsesAPIStreamingIterator,
+    SyncResponsesAPIStreamingIterator,
+)
 from litellm.types.llms.openai import (
     OutputTextDeltaEvent,
     ReasoningSummaryTextDeltaEvent,
@@ -97,6 +107,7 @@ from openhands.sdk.llm.utils.model_features import get_features
 from openhands.sdk.llm.utils.retry_mixin import RetryMixin
 from openhands.sdk.llm.utils.telemetry import Telemetry
 from openhands.sdk.logger import ENV_LOG_DIR, get_logger
+from openhands.sdk.utils.http_pool import get_async_http_client, get_http_client
 
 
 logger = get_logger(__name__)
@@ -104,6 +115,68 @@ logger = get_logger(__name__)
 __all__ = ["LLM"]
 
 
+# Per-call override of ``litellm.modify_params``. LiteLLM only reads the
+# module global, so a context-local value is layered on top of it instead of
+# mutating the global around every request (which races between threads).
+_modify_params_override: ContextVar[bool | None] = ContextVar(
+    "litellm_modify_params", default=None
+)
+
+
+class _LiteLLMModule(ModuleType):
+    @property
+    def modify_params(self) -> bool:
+        override = _modify_params_override.get()
+        if override is not None:
+            return override
+        return self.__dict__.get("modify_params", False)
+
+    @modify_params.setter
+    def modify_params(self, value: bool) -> None:
+        self.__dict__["modify_params"] = value
+
+
+litellm.__class__ = _LiteLLMModule
+
+
+def _install_litellm_warning_filters() -> None:
+    """Silence noisy provider-library warnings once for the whole process."""
+    warnings.filterwarnings("ignore", category=DeprecationWarning, module="httpx.*")
+    warnings.filterwarnings(
+        "ignore", message=r".*content=.*upload.*", category=DeprecationWarning
+    )
+    warnings.filterwarnings(
+        "ignore",
+        message=r"There is no current event loop",
+        category=DeprecationWarning,
+    )
+    warnings.filterwarnings("ignore", category=UserWarning, module="litellm.*")
+    warnings.filterwarnings("ignore", category=DeprecationWarning, module="litellm.*")
+    warnings.filterwarnings(
+        "ignore",
+        category=DeprecationWarning,
+        message="Accessing the 'model_fields' attribute.*",
+    )
+
+
+_install_litellm_warning_filters()
+
+
+def _install_litellm_http_pools() -> None:
+    """Route litellm's HTTP clients through the process-wide connection pools.
+
+    Sessions set by the application before import are left alone. Timeouts
+    are passed per request by litellm, so the clients carry none of their own.
+    """
+    if getattr(litellm, "client_session", None) is None:
+        litellm.client_session = get_http_client(timeout=None)
+    if getattr(litellm, "aclient_session", None) is None:
+        litellm.aclient_session = get_async_http_client(timeout=None)
+
+
+_install_litellm_http_pools()
+
+
 # Exceptions we retry on
 LLM_RETRY_EXCEPTIONS: Final[tuple[type[Exception], ...]] = (
     APIConnectionError,
@@ -129,6 +202,30 @@ ENV_ALLOW_SHORT_CONTEXT_WINDOWS: Final[str] = "ALLOW_SHORT_CONTEXT_WINDOWS"
 DEFAULT_MAX_OUTPUT_TOKENS_CAP: Final[int] = 16384
 
 
+@dataclass
+class _CompletionRequest:
+    """Serialized request shared by the attempts of one completion call."""
+
+    messages: list[dict[str, Any]]
+    cc_tools: list[ChatCompletionToolParam]
+    use_mock_tools: bool
+    call_kwargs: dict[str, Any]
+    telemetry_ctx: dict[str, Any]
+    enable_streaming: bool
+
+
+@dataclass
+class _ResponsesRequest:
+    """Serialized request shared by the attempts of one Responses call."""
+
+    instructions: str | None
+    input_items: list[dict[str, Any]]
+    resp_tools: list[Any] | None
+    call_kwargs: dict[str, Any]
+    telemetry_ctx: dict[str, Any]
+    user_enable_streaming: bool
+
+
 class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
     """Language model interface for OpenHands agents.
 
@@ -624,6 +721,28 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
             raise mapped from error
         raise
 
+    async def _ahandle_error(
+        self,
+        error: Exception,
+        fallback_call_fn: Callable[[LLM], Awaitable[LLMResponse]],
+    ) -> LLMResponse:
+        """Async version of `_handle_error`, awaiting the fallback calls."""
+        assert self._telemetry is not None
+        self._telemetry.on_error(error)
+        if self.fallback_strategy and self.fallback_strategy.should_fallback(error):
+            result = await self.fallback_strategy.atry_fallback(
+                primary_model=self.model,
+                primary_error=error,
+                primary_metrics=self.metrics,
+                call_fn=fallback_call_fn,
+            )
+            if result is not None:
+                return result
+        mapped = map_provider_exception(error)
+        if mapped is not error:
+            raise mapped from error
+        raise error
+
     def completion(
         self,
         messages: list[Message],
@@ -665,6 +784,108 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
             print(response.content)
             ```
         """
+        request = self._prepare_completion(
+            messages, tools, add_security_risk_prediction, on_token, kwargs
+        )
+
+        # 5) do the call with retries
+        @self.retry_decorator(
+            num_retries=self.num_retries,
+            retry_exceptions=LLM_RETRY_EXCEPTIONS,
+            retry_min_wait=self.retry_min_wait,
+            retry_max_wait=self.retry_max_wait,
+            retry_multiplier=self.retry_multiplier,
+            retry_listener=self._retry_listener_fn,
+        )
+        def _one_attempt(**retry_kwargs) -> ModelResponse:
+            assert self._telemetry is not None
+            self._telemetry.on_request(telemetry_ctx=request.telemetry_ctx)
+            # Merge retry-modified kwargs (like temperature) with call_kwargs
+            final_kwargs = {**request.call_kwargs, **retry_kwargs}
+            resp = self._transport_call(
+                messages=request.messages,
+                **final_kwargs,
+                enable_streaming=request.enable_streaming,
+                on_token=on_token,
+            )
+            return self._finish_completion_attempt(request, resp)
+
+        try:
+            return self._completion_response(_one_attempt())
+        except Exception as e:
+            return self._handle_error(
+                e,
+                lambda fb: fb.completion(
+                    messages,
+                    tools,
+                    _return_metrics,
+                    add_security_risk_prediction,
+                    on_token,
+                ),
+            )
+
+    async def acompletion(
+        self,
+        messages: list[Message],
+        tools: Sequence[ToolDefinition] | None = None,
+        _return_metrics: bool = False,
+        add_security_risk_prediction: bool = False,
+        on_token: TokenCallbackType | None = None,
+        **kwargs,
+    ) -> LLMResponse:
+        """Async version of `completion`.
+
+        Retries, telemetry, streaming (on_token is called for each chunk as it
+        arrives) and fallbacks behave as in `completion`, but the request and
+        the waits between retries do not block a thread.
+        """
+        request = self._prepare_completion(
+            messages, tools, add_security_risk_prediction, on_token, kwargs
+        )
+
+        @self.retry_decorator(
+            num_retries=self.num_retries,
+            retry_exceptions=LLM_RETRY_EXCEPTIONS,
+            retry_min_wait=self.retry_min_wait,
+            retry_max_wait=self.retry_max_wait,
+            retry_multiplier=self.retry_multiplier,
+            retry_listener=self._retry_listener_fn,
+        )
+        async def _one_attempt(**retry_kwargs) -> ModelResponse:
+            assert self._telemetry is not None
+            self._telemetry.on_request(telemetry_ctx=request.telemetry_ctx)
+            final_kwargs = {**request.call_kwargs, **retry_kwargs}
+            resp = await self._atransport_call(
+                messages=request.messages,
+                **final_kwargs,
+                enable_streaming=request.enable_streaming,
+                on_token=on_token,
+            )
+            return self._finish_completion_attempt(request, resp)
+
+        try:
+            return self._completion_response(await _one_attempt())
+        except Exception as e:
+            return await self._ahandle_error(
+                e,
+                lambda fb: fb.acompletion(
+                    messages,
+                    tools,
+                    _return_metrics,
+                    add_security_risk_prediction,
+                    on_token,
+                ),
+            )
+
+    def _prepare_completion(
+        self,
+        messages: list[Message],
+        tools: Sequence[ToolDefinition] | None,
+        add_security_risk_prediction: bool,
+        on_token: TokenCallbackType | None,
+        kwargs: dict[str, Any],
+    ) -> _CompletionRequest:
+        """Serialize messages and tools and select call options for one request."""
         enable_streaming = bool(kwargs.get("stream", False)) or self.stream
         if enable_streaming:
             if on_token is None:
@@ -676,7 +897,8 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
 
         # 2) choose function-calling strategy
         use_native_fc = self.native_tool_calling
-        original_fncall_msgs = copy.deepcopy(formatted_messages)
+        # The prompt mock below converts a copy, so these stay unchanged
+        original_fncall_msgs = formatted_messages
 
         # Convert Tool objects to ChatCompletionToolParam once here
         cc_tools: list[ChatCompletionToolParam] = []
@@ -719,76 +941,60 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
             )
             if tools and not use_native_fc:
                 telemetry_ctx["raw_messages"] = original_fncall_msgs
+        self._telemetry.on_prompt(
+            formatted_messages, cc_tools if has_tools_flag else None
+        )
 
-        # 5) do the call with retries
-        @self.retry_decorator(
-            num_retries=self.num_retries,
-            retry_exceptions=LLM_RETRY_EXCEPTIONS,
-            retry_min_wait=self.retry_min_wait,
-            retry_max_wait=self.retry_max_wait,
-            retry_multiplier=self.retry_multiplier,
-            retry_listener=self._retry_listener_fn,
+        return _CompletionRequest(
+            messages=formatted_messages,
+            cc_tools=cc_tools,
+            use_mock_tools=use_mock_tools,
+            call_kwargs=call_kwargs,
+            telemetry_ctx=telemetry_ctx,
+            enable_streaming=enable_streaming,
         )
-        def _one_attempt(**retry_kwargs) -> ModelResponse:
-            assert self._telemetry is not None
-            self._telemetry.on_request(telemetry_ctx=telemetry_ctx)
-            # Merge retry-modified kwargs (like temperature) with call_kwargs
-            final_kwargs = {**call_kwargs, **retry_kwargs}
-            resp = self._transport_call(
-                messages=formatted_messages,
-                **final_kwargs,
-                enable_streaming=enable_streaming,
-                on_token=on_token,
+
+    def _finish_completion_attempt(
+        self, request: _CompletionRequest, resp: ModelResponse
+    ) -> ModelResponse:
+        """Undo function-calling mocking, record telemetry and check choices."""
+        assert self._telemetry is not None
+        raw_resp: ModelResponse | None = None
+        if request.use_mock_tools:
+            raw_resp = copy.deepcopy(resp)
+            resp = self.post_response_prompt_mock(
+                resp, nonfncall_msgs=request.messages, tools=request.cc_tools
+            )
+        # 6) telemetry
+        self._telemetry.on_response(resp, raw_resp=raw_resp)
+
+        # Ensure at least one choice.
+        # Gemini sometimes returns empty choices; we raise LLMNoResponseError here
+        # inside the retry boundary so it is retried.
+        if not resp.get("choices") or len(resp["choices"]) < 1:
+            raise LLMNoResponseError(
+                "Response choices is less than 1. Response: " + str(resp)
             )
-            raw_resp: ModelResponse | None = None
-            if use_mock_tools:
-                raw_resp = copy.deepcopy(resp)
-                resp = self.post_response_prompt_mock(
-                    resp, nonfncall_msgs=formatted_messages, tools=cc_tools
-                )
-            # 6) telemetry
-            self._telemetry.on_response(resp, raw_resp=raw_resp)
-
-            # Ensure at least one choice.
-            # Gemini sometimes returns empty choices; we raise LLMNoResponseError here
-            # inside the retry boundary so it is retried.
-            if not resp.get("choices") or len(resp["choices"]) < 1:
-                raise LLMNoResponseError(
-                    "Response choices is less than 1. Response: " + str(resp)
-                )
 
-            return resp
+        return resp
 
-        try:
-            resp = _one_attempt()
-
-            # Convert the first choice to an OpenHands Message
-            first_choice = resp["choices"][0]
-            message = Message.from_llm_chat_message(first_choice["message"])
-
-            # Get current metrics snapshot
-            metrics_snapshot = MetricsSnapshot(
-                model_name=self.metrics.model_name,
-                accumulated_cost=self.metrics.accumulated_cost,
-                max_budget_per_task=self.metrics.max_budget_per_task,
-                accumulated_token_usage=self.metrics.accumulated_token_usage,
-            )
+    def _completion_response(self, resp: ModelResponse) -> LLMResponse:
+        # Convert the first choice to an OpenHands Message
+        first_choice = resp["choices"][0]
+        message = Message.from_llm_chat_message(first_choice["message"])
 
-            # Create and return LLMResponse
-            return LLMResponse(
-                message=message, metrics=metrics_snapshot, raw_response=resp
-            )
-        except Exception as e:
-            return self._handle_error(
-                e,
-                lambda fb: fb.completion(
-                    messages,
-                    tools,
-                    _return_metrics,
-                    add_security_risk_prediction,
-                    on_token,
-                ),
-            )
+        # Create and return LLMResponse
+        return LLMResponse(
+            message=message, metrics=self._metrics_snapshot(), raw_response=resp
+        )
+
+    def _metrics_snapshot(self) -> MetricsSnapshot:
+        return MetricsSnapshot(
+            model_name=self.metrics.model_name,
+            accumulated_cost=self.metrics.accumulated_cost,
+            max_budget_per_task=self.metrics.max_budget_per_task,
+            accumulated_token_usage=self.metrics.accumulated_token_usage,
+        )
 
     # =========================================================================
     # Responses API (v1)
@@ -822,6 +1028,152 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
             Summary field is always added to tool schemas for transparency and
             explainability of agent actions.
         """
+        request = self._prepare_responses(
+            messages,
+            tools,
+            include,
+            store,
+            add_security_risk_prediction,
+            on_token,
+            kwargs,
+        )
+
+        # Perform call with retries
+        @self.retry_decorator(
+            num_retries=self.num_retries,
+            retry_exceptions=LLM_RETRY_EXCEPTIONS,
+            retry_min_wait=self.retry_min_wait,
+            retry_max_wait=self.retry_max_wait,
+            retry_multiplier=self.retry_multiplier,
+            retry_listener=self._retry_listener_fn,
+        )
+        def _one_attempt(**retry_kwargs) -> ResponsesAPIResponse:
+            assert self._telemetry is not None
+            self._telemetry.on_request(telemetry_ctx=request.telemetry_ctx)
+            final_kwargs = {**request.call_kwargs, **retry_kwargs}
+            with self._transport_ctx():
+                ret = litellm_responses(
+                    **self._responses_call_kwargs(request), **final_kwargs
+                )
+                if isinstance(ret, ResponsesAPIResponse):
+                    return self._finish_responses_attempt(request, ret)
+
+                # When stream=True, LiteLLM returns a streaming iterator rather than
+                # a single ResponsesAPIResponse. Drain the iterator and use the
+                # completed response.
+                if final_kwargs.get("stream", False):
+                    if not isinstance(ret, SyncResponsesAPIStreamingIterator):
+                        raise AssertionError(
+                            f"Expected Responses stream iterator, got {type(ret)}"
+                        )
+
+                    for event in ret:
+                        self._emit_responses_delta(request, event, on_token)
+                    return self._finish_responses_stream(ret)
+
+                raise AssertionError(
+                    f"Expected ResponsesAPIResponse, got {type(ret)}"
+                )
+
+        try:
+            return self._responses_response(_one_attempt())
+        except Exception as e:
+            return self._handle_error(
+                e,
+                lambda fb: fb.responses(
+                    messages,
+                    tools,
+                    include,
+                    store,
+                    _return_metrics,
+                    add_security_risk_prediction,
+                    on_token,
+                ),
+            )
+
+    async def aresponses(
+        self,
+        messages: list[Message],
+        tools: Sequence[ToolDefinition] | None = None,
+        include: list[str] | None = None,
+        store: bool | None = None,
+        _return_metrics: bool = False,
+        add_security_risk_prediction: bool = False,
+        on_token: TokenCallbackType | None = None,
+        **kwargs,
+    ) -> LLMResponse:
+        """Async version of `responses`, with the same retry, telemetry,
+        streaming and fallback behavior."""
+        request = self._prepare_responses(
+            messages,
+            tools,
+            include,
+            store,
+            add_security_risk_prediction,
+            on_token,
+            kwargs,
+        )
+
+        @self.retry_decorator(
+            num_retries=self.num_retries,
+            retry_exceptions=LLM_RETRY_EXCEPTIONS,
+            retry_min_wait=self.retry_min_wait,
+            retry_max_wait=self.retry_max_wait,
+            retry_multiplier=self.retry_multiplier,
+            retry_listener=self._retry_listener_fn,
+        )
+        async def _one_attempt(**retry_kwargs) -> ResponsesAPIResponse:
+            assert self._telemetry is not None
+            self._telemetry.on_request(telemetry_ctx=request.telemetry_ctx)
+            final_kwargs = {**request.call_kwargs, **retry_kwargs}
+            with self._transport_ctx():
+                ret = await litellm_aresponses(
+                    **self._responses_call_kwargs(request), **final_kwargs
+                )
+                if isinstance(ret, ResponsesAPIResponse):
+                    return self._finish_responses_attempt(request, ret)
+
+                if final_kwargs.get("stream", False):
+                    if not isinstance(ret, ResponsesAPIStreamingIterator):
+                        raise AssertionError(
+                            f"Expected Responses stream iterator, got {type(ret)}"
+                        )
+
+                    async for event in ret:
+                        self._emit_responses_delta(request, event, on_token)
+                    return self._finish_responses_stream(ret)
+
+                raise AssertionError(
+                    f"Expected ResponsesAPIResponse, got {type(ret)}"
+                )
+
+        try:
+            return self._responses_response(await _one_attempt())
+        except Exception as e:
+            return await self._ahandle_error(
+                e,
+                lambda fb: fb.aresponses(
+                    messages,
+                    tools,
+                    include,
+                    store,
+                    _return_metrics,
+                    add_security_risk_prediction,
+                    on_token,
+                ),
+            )
+
+    def _prepare_responses(
+        self,
+        messages: list[Message],
+        tools: Sequence[ToolDefinition] | None,
+        include: list[str] | None,
+        store: bool | None,
+        add_security_risk_prediction: bool,
+        on_token: TokenCallbackType | None,
+        kwargs: dict[str, Any],
+    ) -> _ResponsesRequest:
+        """Build the Responses API input, tools and options for one request."""
         user_enable_streaming = bool(kwargs.get("stream", False)) or self.stream
         if user_enable_streaming:
             if on_token is None and not self.is_subscription:
@@ -864,136 +1216,107 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
                     "kwargs": {k: v for k, v in call_kwargs.items()},
                 }
             )
+        # Instructions come first, like the system message on the chat path
+        self._telemetry.on_prompt(
+            [{"instructions": instructions}, *input_items], resp_tools
+        )
 
-        # Perform call with retries
-        @self.retry_decorator(
-            num_retries=self.num_retries,
-            retry_exceptions=LLM_RETRY_EXCEPTIONS,
-            retry_min_wait=self.retry_min_wait,
-            retry_max_wait=self.retry_max_wait,
-            retry_multiplier=self.retry_multiplier,
-            retry_listener=self._retry_listener_fn,
+        return _ResponsesRequest(
+            instructions=instructions,
+            input_items=input_items,
+            resp_tools=resp_tools,
+            call_kwargs=call_kwargs,
+            telemetry_ctx=telemetry_ctx,
+            user_enable_streaming=user_enable_streaming,
         )
-        def _one_attempt(**retry_kwargs) -> ResponsesAPIResponse:
-            assert self._telemetry is not None
-            self._telemetry.on_request(telemetry_ctx=telemetry_ctx)
-            final_kwargs = {**call_kwargs, **retry_kwargs}
-            with self._litellm_modify_params_ctx(self.modify_params):
-                with warnings.catch_warnings():
-                    warnings.filterwarnings("ignore", category=DeprecationWarning)
-                    typed_input: ResponseInputParam | str = (
-                        cast(ResponseInputParam, input_items) if input_items else ""
-                    )
-                    api_key_value = self._get_litellm_api_key_value()
-
-                    ret = litellm_responses(
-                        model=self.model,
-                        input=typed_input,
-                        instructions=instructions,
-                        tools=resp_tools,
-                        api_key=api_key_value,
-                        api_base=self.base_url,
-                        api_version=self.api_version,
-                        timeout=self.timeout,
-                        drop_params=self.drop_params,
-                        seed=self.seed,
-                        **final_kwargs,
-                    )
-                    if isinstance(ret, ResponsesAPIResponse):
-                        if user_enable_streaming:
-                            logger.warning(
-                                "Responses streaming was requested, but the provider "
-                                "returned a non-streaming response; no on_token deltas "
-                                "will be emitted."
-                            )
-                        self._telemetry.on_response(ret)
-                        return ret
-
-                    # When stream=True, LiteLLM returns a streaming iterator rather than
-                    # a single ResponsesAPIResponse. Drain the iterator and use the
-                    # completed response.
-                    if final_kwargs.get("stream", False):
-                        if not isinstance(ret, SyncResponsesAPIStreamingIterator):
-                            raise AssertionError(
-                                f"Expected Responses stream iterator, got {type(ret)}"
-                            )
-
-                        stream_callback = on_token if user_enable_streaming else None
-                        for event in ret:
-                            if stream_callback is None:
-                                continue
-                            if isinstance(
-                                event,
-                                (
-                                    OutputTextDeltaEvent,
-                                    RefusalDeltaEvent,
-                                    ReasoningSummaryTextDeltaEvent,
-                                ),
-                            ):
-                                delta = event.delta
-                                if delta:
-                                    stream_callback(
-                                        ModelResponseStream(
-                                            choices=[
-                                                StreamingChoices(
-                                                    delta=Delta(content=delta)
-                                                )
-                                            ]
-                                        )
-                                    )
-
-                        completed_event = ret.completed_response
-                        if completed_event is None:
-                            raise LLMNoResponseError(
-                                "Responses stream finished without a completed response"
-                            )
-                        if not isinstance(completed_event, ResponseCompletedEvent):
-                            raise LLMNoResponseError(
-                                f"Unexpected completed event: {type(completed_event)}"
-                            )
-
-                        completed_resp = completed_event.response
-
-                        self._telemetry.on_response(completed_resp)
-                        return completed_resp
-
-                    raise AssertionError(
-                        f"Expected ResponsesAPIResponse, got {type(ret)}"
-                    )
 
-        try:
-            resp: ResponsesAPIResponse = _one_attempt()
-
-            # Parse output -> Message (typed)
-            # Cast to a typed sequence
-            # accepted by from_llm_responses_output
-            output_seq = cast(Sequence[Any], resp.output or [])
-            message = Message.from_llm_responses_output(output_seq)
-
-            metrics_snapshot = MetricsSnapshot(
-                model_name=self.metrics.model_name,
-                accumulated_cost=self.metrics.accumulated_cost,
-                max_budget_per_task=self.metrics.max_budget_per_task,
-                accumulated_token_usage=self.metrics.accumulated_token_usage,
+    def _responses_call_kwargs(self, request: _ResponsesRequest) -> dict[str, Any]:
+        typed_input: ResponseInputParam | str = (
+            cast(ResponseInputParam, request.input_items)
+            if request.input_items
+            else ""
+        )
+        return dict(
+            model=self.model,
+            input=typed_input,
+            instructions=request.instructions,
+            tools=request.resp_tools,
+            api_key=self._get_litellm_api_key_value(),
+            api_base=self.base_url,
+            api_version=self.api_version,
+            timeout=self.timeout,
+            drop_params=self.drop_params,
+            seed=self.seed,
+        )
+
+    def _finish_responses_attempt(
+        self, request: _ResponsesRequest, resp: ResponsesAPIResponse
+    ) -> ResponsesAPIResponse:
+        assert self._telemetry is not None
+        if request.user_enable_streaming:
+            logger.warning(
+                "Responses streaming was requested, but the provider "
+                "returned a non-streaming response; no on_token deltas "
+                "will be emitted."
             )
+        self._telemetry.on_response(resp)
+        return resp
 
-            return LLMResponse(
-                message=message, metrics=metrics_snapshot, raw_response=resp
+    def _emit_responses_delta(
+        self,
+        request: _ResponsesRequest,
+        event: Any,
+        on_token: TokenCallbackType | None,
+    ) -> None:
+        if not request.user_enable_streaming or on_token is None:
+            return
+        if isinstance(
+            event,
+            (
+                OutputTextDeltaEvent,
+                RefusalDeltaEvent,
+                ReasoningSummaryTextDeltaEvent,
+            ),
+        ):
+            delta = event.delta
+            if delta:
+                on_token(
+                    ModelResponseStream(
+                        choices=[StreamingChoices(delta=Delta(content=delta))]
+                    )
+                )
+
+    def _finish_responses_stream(
+        self,
+        stream: SyncResponsesAPIStreamingIterator | ResponsesAPIStreamingIterator,
+    ) -> ResponsesAPIResponse:
+        assert self._telemetry is not None
+        completed_event = stream.completed_response
+        if completed_event is None:
+            raise LLMNoResponseError(
+                "Responses stream finished without a completed response"
             )
-        except Exception as e:
-            return self._handle_error(
-                e,
-                lambda fb: fb.responses(
-                    messages,
-                    tools,
-                    include,
-                    store,
-                    _return_metrics,
-                    add_security_risk_prediction,
-                    on_token,
-                ),
+        if not isinstance(completed_event, ResponseCompletedEvent):
+            raise LLMNoResponseError(
+                f"Unexpected completed event: {type(completed_event)}"
             )
 
+        completed_resp = completed_event.response
+
+        self._telemetry.on_response(completed_resp)
+        return completed_resp
+
+    def _responses_response(self, resp: ResponsesAPIResponse) -> LLMResponse:
+        # Parse output -> Message (typed)
+        # Cast to a typed sequence
+        # accepted by from_llm_responses_output
+        output_seq = cast(Sequence[Any], resp.output or [])
+        message = Message.from_llm_responses_output(output_seq)
+
+        return LLMResponse(
+            message=message, metrics=self._metrics_snapshot(), raw_response=resp
+        )
+
     # =========================================================================
     # Transport + helpers
     # =========================================================================
@@ -1029,66 +1352,75 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
         on_token: TokenCallbackType | None = None,
         **kwargs,
     ) -> ModelResponse:
-        # litellm.modify_params is GLOBAL; guard it for thread-safety
-        with self._litellm_modify_params_ctx(self.modify_params):
-            with warnings.catch_warnings():
-                warnings.filterwarnings(
-                    "ignore", category=DeprecationWarning, module="httpx.*"
-                )
-                warnings.filterwarnings(
-                    "ignore",
-                    message=r".*content=.*upload.*",
-                    category=DeprecationWarning,
-                )
-                warnings.filterwarnings(
-                    "ignore",
-                    message=r"There is no current event loop",
-                    category=DeprecationWarning,
-                )
-                warnings.filterwarnings(
-                    "ignore",
-                    category=UserWarning,
-                )
-                warnings.filterwarnings(
-                    "ignore",
-                    category=DeprecationWarning,
-                    message="Accessing the 'model_fields' attribute.*",
-                )
-                api_key_value = self._get_litellm_api_key_value()
+        with self._transport_ctx():
+            # Some providers need renames handled in _normalize_call_kwargs.
+            ret = litellm_completion(
+                **self._transport_kwargs(), messages=messages, **kwargs
+            )
+            if enable_streaming and on_token is not None:
+                assert isinstance(ret, CustomStreamWrapper)
+                chunks = []
+                for chunk in ret:
+                    on_token(chunk)
+                    chunks.append(chunk)
+                ret = litellm.stream_chunk_builder(chunks, messages=messages)
+
+            assert isinstance(ret, ModelResponse), (
+                f"Expected ModelResponse, got {type(ret)}"
+            )
+            return ret
 
-                # Some providers need renames handled in _normalize_call_kwargs.
-                ret = litellm_completion(
-                    model=self.model,
-                    api_key=api_key_value,
-                    api_base=self.base_url,
-                    api_version=self.api_version,
-                    timeout=self.timeout,
-                    drop_params=self.drop_params,
-                    seed=self.seed,
-                    messages=messages,
-                    **kwargs,
-                )
-                if enable_streaming and on_token is not None:
-                    assert isinstance(ret, CustomStreamWrapper)
-                    chunks = []
-                    for chunk in ret:
-                        on_token(chunk)
-                        chunks.append(chunk)
-                    ret = litellm.stream_chunk_builder(chunks, messages=messages)
-
-                assert isinstance(ret, ModelResponse), (
-                    f"Expected ModelResponse, got {type(ret)}"
-                )
-                return ret
+    async def _atransport_call(
+        self,
+        *,
+        messages: list[dict[str, Any]],
+        enable_streaming: bool = False,
+        on_token: TokenCallbackType | None = None,
+        **kwargs,
+    ) -> ModelResponse:
+        with self._transport_ctx():
+            ret = await litellm_acompletion(
+                **self._transport_kwargs(), messages=messages, **kwargs
+            )
+            if enable_streaming and on_token is not None:
+                assert isinstance(ret, CustomStreamWrapper)
+                chunks = []
+                async for chunk in ret:
+                    on_token(chunk)
+                    chunks.append(chunk)
+                ret = litellm.stream_chunk_builder(chunks, messages=messages)
+
+            assert isinstance(ret, ModelResponse), (
+                f"Expected ModelResponse, got {type(ret)}"
+            )
+            return ret
+
+    def _transport_kwargs(self) -> dict[str, Any]:
+        return dict(
+            model=self.model,
+            api_key=self._get_litellm_api_key_value(),
+            api_base=self.base_url,
+            api_version=self.api_version,
+            timeout=self.timeout,
+            drop_params=self.drop_params,
+            seed=self.seed,
+        )
+
+    @contextmanager
+    def _transport_ctx(self):
+        # Warning filters are installed once at import time; see
+        # _install_litellm_warning_filters.
+        with self._litellm_modify_params_ctx(self.modify_params):
+            yield
 
     @contextmanager
     def _litellm_modify_params_ctx(self, flag: bool):
-        old = getattr(litellm, "modify_params", None)
+        # Scoped to the current thread / asyncio task; the global is untouched.
+        token = _modify_params_override.set(flag)
         try:
-            litellm.modify_params = flag
             yield
         finally:
-            litellm.modify_params = old
+            _modify_params_override.reset(token)
 
     # =========================================================================
     # Capabilities, formatting, and info
@@ -1240,8 +1572,8 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
     # =========================================================================
     # Utilities preserved from previous class
     # =========================================================================
-    def _apply_prompt_caching(self, messages: list[Message]) -> None:
-        """Applies caching breakpoints to the messages.
+    def _cache_breakpoints(self, messages: list[Message]) -> dict[int, dict[int, bool]]:
+        """Returns the caching flag of content blocks, by message and block index.
 
         For Anthropic's prefix caching, we mark specific content blocks:
         1. System message: Mark the first block (static prompt) for caching.
@@ -1249,31 +1581,62 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
            to enable cross-conversation cache sharing.
         2. Last user/tool message: Mark for caching to extend the cache prefix.
         """
+        breakpoints: dict[int, dict[int, bool]] = {}
         if len(messages) > 0 and messages[0].role == "system":
             sys_content = messages[0].content
             if len(sys_content) >= 2:
                 # Two-block structure: static (index 0) + dynamic (index 1)
                 # Mark only the static block; ensure dynamic is unmarked
-                sys_content[0].cache_prompt = True
-                sys_content[1].cache_prompt = False
+                breakpoints[0] = {0: True, 1: False}
             elif len(sys_content) == 1:
                 # Single block: mark it for caching
-                sys_content[0].cache_prompt = True
+                breakpoints[0] = {0: True}
 
         # NOTE: this is only needed for anthropic
-        for message in reversed(messages):
+        for index in range(len(messages) - 1, -1, -1):
+            message = messages[index]
             if message.role in ("user", "tool"):
-                message.content[
-                    -1
-                ].cache_prompt = True  # Last item inside the message content
+                if message.content:
+                    # Last item inside the message content
+                    breakpoints.setdefault(index, {})[len(message.content) - 1] = True
                 break
+        return breakpoints
+
+    def _apply_prompt_caching(self, messages: list[Message]) -> None:
+        """Applies caching breakpoints to the messages in place."""
+        for index, blocks in self._cache_breakpoints(messages).items():
+            for block, cache_prompt in blocks.items():
+                messages[index].content[block].cache_prompt = cache_prompt
+
+    def _with_prompt_caching(self, messages: list[Message]) -> list[Message]:
+        """Returns the messages with caching breakpoints applied.
+
+        The input is left untouched: only messages whose flags change are
+        replaced, by shallow copies sharing their unchanged content blocks.
+        """
+        messages = list(messages)
+        for index, blocks in self._cache_breakpoints(messages).items():
+            message = messages[index]
+            content = list(message.content)
+            for block, cache_prompt in blocks.items():
+                if content[block].cache_prompt != cache_prompt:
+                    content[block] = content[block].model_copy(
+                        update={"cache_prompt": cache_prompt}
+                    )
+            if any(a is not b for a, b in zip(content, message.content)):
+                messages[index] = message.model_copy(update={"content": content})
+        return messages
 
     def format_messages_for_llm(self, messages: list[Message]) -> list[dict]:
-        """Formats Message objects for LLM consumption."""
+        """Formats Message objects for LLM consumption.
+
+        The messages are not copied or modified. Serialized messages are
+        memoized (see `Message.to_chat_dict`), so formatting a history again
+        only serializes the messages that are new or changed.
+        """
 
-        messages = copy.deepcopy(messages)
         if self.is_caching_prompt_active():
-            self._apply_prompt_caching(messages)
+            messages = self._with_prompt_caching(messages)
 
         model_features = get_features(self._model_name_for_capabilities())
         cache_enabled = self.is_caching_prompt_active()
@@ -1310,8 +1673,6 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
         - Concatenates system instructions into a single instructions string
         - For subscription mode, system prompts are prepended to user content
         """
-        msgs = copy.deepcopy(messages)
-
         # Determine vision based on model detection
         vision_active = self.vision_is_active()
 
@@ -1320,7 +1681,7 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
         input_items: list[dict[str, Any]] = []
         system_chunks: list[str] = []
 
-        for m in msgs:
+        for m in messages:
             val = m.to_responses_value(vision_enabled=vision_active)
             if isinstance(val, str):
                 s = val.strip()
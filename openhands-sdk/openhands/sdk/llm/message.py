@@ -1,4 +1,5 @@
 import json
+import weakref
 from abc import abstractmethod
 from collections.abc import Sequence
 from typing import Any, ClassVar, Literal
@@ -20,6 +21,23 @@ from openhands.sdk.utils.deprecation import handle_deprecated_model_fields
 
 logger = get_logger(__name__)
 
+# Memoized Message.to_chat_dict results by id(message):
+# (weak reference to the message, serialization key, serialized dict)
+_chat_dicts: dict[int, tuple[weakref.ref, tuple, dict[str, Any]]] = {}
+
+
+def _forget_chat_dict(message_id: int) -> None:
+    _chat_dicts.pop(message_id, None)
+
+
+def _copy_containers(value: Any) -> Any:
+    """Copy the dicts and lists of a serialized message, sharing the leaves."""
+    if isinstance(value, dict):
+        return {k: _copy_containers(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_containers(v) for v in value]
+    return value
+
 
 class MessageToolCall(BaseModel):
     """Transport-agnostic tool call representation.
@@ -252,6 +270,10 @@ class Message(BaseModel):
         """Remove deprecated fields for backward compatibility with old events."""
         return handle_deprecated_model_fields(data, cls._DEPRECATED_FIELDS)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        _forget_chat_dict(id(self))
+
     @property
     def contains_image(self) -> bool:
         return any(isinstance(content, ImageContent) for content in self.content)
@@ -288,7 +310,47 @@ class Message(BaseModel):
         Chooses the appropriate content serializer and then injects threading keys:
         - Assistant tool call turn: role == "assistant" and self.tool_calls
         - Tool result turn: role == "tool" and self.tool_call_id (with name)
+
+        Results are memoized per message and arguments until a field is
+        assigned or a content block is added, replaced or re-flagged for
+        caching. Each call returns fresh dicts and lists, so callers may
+        modify them.
         """
+        key = (
+            cache_enabled,
+            vision_enabled,
+            function_calling_enabled,
+            force_string_serializer,
+            send_reasoning_content,
+            tuple((id(item), item.cache_prompt) for item in self.content),
+            tuple(id(tc) for tc in self.tool_calls or ()),
+            tuple(id(block) for block in self.thinking_blocks),
+        )
+        memo = _chat_dicts.get(id(self))
+        if memo is not None and memo[0]() is self and memo[1] == key:
+            return _copy_containers(memo[2])
+
+        message_dict = self._chat_dict(
+            cache_enabled=cache_enabled,
+            vision_enabled=vision_enabled,
+            function_calling_enabled=function_calling_enabled,
+            force_string_serializer=force_string_serializer,
+            send_reasoning_content=send_reasoning_content,
+        )
+        message_id = id(self)
+        ref = weakref.ref(self, lambda _: _forget_chat_dict(message_id))
+        _chat_dicts[message_id] = (ref, key, message_dict)
+        return _copy_containers(message_dict)
+
+    def _chat_dict(
+        self,
+        *,
+        cache_enabled: bool,
+        vision_enabled: bool,
+        function_calling_enabled: bool,
+        force_string_serializer: bool,
+        send_reasoning_content: bool,
+    ) -> dict[str, Any]:
         if not force_string_serializer and (
             cache_enabled or vision_enabled or function_calling_enabled
         ):
@@ -0,0 +1,174 @@
+"""Prompt-prefix stability tracking for provider prompt caches.
+
+Provider prompt caches only hit when the request starts with a byte-identical
+prefix of an earlier request. :class:`PromptPrefixTracker` compares each
+request against the previous one from the same LLM, hashes the prefix at
+every cache breakpoint and reports the first message that changed, so
+dynamic context, condensation or skill injection that invalidates the cache
+can be found from the stats.
+"""
+
+import hashlib
+import json
+from collections.abc import Sequence
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+__all__ = ["PromptCacheCall", "PromptCacheStats", "PromptPrefixTracker"]
+
+# Number of per-call records kept in PromptCacheStats.recent_calls
+_RECENT_CALLS = 50
+
+
+class PromptCacheCall(BaseModel):
+    """Prefix and cache usage of a single LLM call."""
+
+    response_id: str = ""
+    messages: int = Field(default=0, description="Number of messages sent.")
+    first_divergence: int | None = Field(
+        default=None,
+        description=(
+            "Index of the first message that differs from the previous call, "
+            "or None when the previous prompt is a prefix of this one."
+        ),
+    )
+    tools_changed: bool = False
+    breakpoint_hashes: dict[int, str] = Field(
+        default_factory=dict,
+        description="Message index of each cache breakpoint -> prefix hash.",
+    )
+    prompt_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+
+class PromptCacheStats(BaseModel):
+    """Aggregated prompt-prefix stability and cache usage for one LLM."""
+
+    calls: int = 0
+    prefix_breaks: int = Field(
+        default=0, description="Calls whose prompt did not extend the previous one."
+    )
+    break_indices: dict[int, int] = Field(
+        default_factory=dict,
+        description="First diverging message index -> number of calls.",
+    )
+    prompt_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    recent_calls: list[PromptCacheCall] = Field(default_factory=list)
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of prompt tokens served from the provider cache."""
+        if not self.prompt_tokens:
+            return 0.0
+        return self.cache_read_tokens / self.prompt_tokens
+
+    def record(self, call: PromptCacheCall) -> None:
+        self.calls += 1
+        if call.first_divergence is not None:
+            self.prefix_breaks += 1
+            index = call.first_divergence
+            self.break_indices[index] = self.break_indices.get(index, 0) + 1
+        self.prompt_tokens += call.prompt_tokens
+        self.cache_read_tokens += call.cache_read_tokens
+        self.cache_write_tokens += call.cache_write_tokens
+        self.recent_calls.append(call)
+        del self.recent_calls[:-_RECENT_CALLS]
+
+
+def _strip_cache_control(message: Any) -> Any:
+    """Drop cache_control markers, which move between calls by design."""
+    if not isinstance(message, dict):
+        return message
+    content = message.get("content")
+    marked = "cache_control" in message or (
+        isinstance(content, list)
+        and any(isinstance(b, dict) and "cache_control" in b for b in content)
+    )
+    if not marked:
+        return message
+    stripped = {k: v for k, v in message.items() if k != "cache_control"}
+    if isinstance(content, list):
+        stripped["content"] = [
+            {k: v for k, v in b.items() if k != "cache_control"}
+            if isinstance(b, dict)
+            else b
+            for b in content
+        ]
+    return stripped
+
+
+def _is_breakpoint(message: Any) -> bool:
+    if not isinstance(message, dict):
+        return False
+    if "cache_control" in message:
+        return True
+    content = message.get("content")
+    return isinstance(content, list) and any(
+        isinstance(b, dict) and "cache_control" in b for b in content
+    )
+
+
+class PromptPrefixTracker:
+    """Compare each prompt with the previous one and hash its prefixes.
+
+    Messages are compared as formatted dicts, which is cheap because
+    unchanged messages share their string values between calls. Only
+    messages after the common prefix are serialized and hashed; the hashes
+    are chained so the hash at index ``i`` covers the tools and messages
+    ``0..i``.
+    """
+
+    def __init__(self) -> None:
+        self._tools: Any = None
+        self._messages: list[Any] = []
+        self._hashes: list[bytes] = []
+
+    def observe(
+        self, messages: Sequence[Any], tools: Any = None
+    ) -> tuple[int | None, bool, dict[int, str]]:
+        """Record a prompt and compare it with the previous one.
+
+        Returns the index of the first diverging message (None when the
+        previous prompt is a prefix of this one), whether the tools changed,
+        and the prefix hash at each cache breakpoint.
+        """
+        normalized = [_strip_cache_control(m) for m in messages]
+        tools_changed = bool(self._messages) and tools != self._tools
+        common = 0
+        if not tools_changed:
+            for previous, current in zip(self._messages, normalized):
+                if previous != current:
+                    break
+                common += 1
+        divergence = common if common < len(self._messages) else None
+
+        hashes = self._hashes[:common]
+        if hashes:
+            digest = hashes[-1]
+        else:
+            serialized = json.dumps(tools, sort_keys=True, default=str)
+            digest = hashlib.sha256(serialized.encode("utf-8")).digest()
+        for message in normalized[common:]:
+            serialized = json.dumps(message, sort_keys=True, default=str)
+            digest = hashlib.sha256(digest + serialized.encode("utf-8")).digest()
+            hashes.append(digest)
+        self._tools = tools
+        self._messages = normalized
+        self._hashes = hashes
+
+        breakpoints = {
+            i: hashes[i].hex()[:16]
+            for i, message in enumerate(messages)
+            if _is_breakpoint(message)
+        }
+        return divergence, tools_changed, breakpoints
+
+    def reset(self) -> None:
+        self._tools = None
+        self._messages = []
+        self._hashes = []
@@ -13,6 +13,11 @@ from litellm.types.utils import CostPerToken, ModelResponse, Usage
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from openhands.sdk.llm.utils.metrics import Metrics
+from openhands.sdk.llm.utils.prompt_cache import (
+    PromptCacheCall,
+    PromptCacheStats,
+    PromptPrefixTracker,
+)
 from openhands.sdk.logger import get_logger
 
 
@@ -48,6 +53,11 @@ class Telemetry(BaseModel):
         default=None
     )
     _stats_update_callback: Callable[[], None] | None = PrivateAttr(default=None)
+    _prefix_tracker: PromptPrefixTracker = PrivateAttr(
+        default_factory=PromptPrefixTracker
+    )
+    _prompt_cache: PromptCacheStats = PrivateAttr(default_factory=PromptCacheStats)
+    _pending_prompt: PromptCacheCall | None = PrivateAttr(default=None)
 
     model_config: ClassVar[ConfigDict] = ConfigDict(
         extra="forbid", arbitrary_types_allowed=True
@@ -74,6 +84,39 @@ class Telemetry(BaseModel):
         """
         self._stats_update_callback = callback
 
+    @property
+    def prompt_cache_stats(self) -> PromptCacheStats:
+        """Prompt-prefix stability and cache usage of the calls so far."""
+        return self._prompt_cache.model_copy(deep=True)
+
+    def on_prompt(self, messages: list[Any], tools: Any = None) -> None:
+        """Compare the prompt about to be sent with the previous one.
+
+        Args:
+            messages: The formatted messages (or Responses input items) in the
+                order they are sent.
+            tools: The serialized tool definitions sent alongside them.
+        """
+        divergence, tools_changed, breakpoints = self._prefix_tracker.observe(
+            messages, tools
+        )
+        self._pending_prompt = PromptCacheCall(
+            messages=len(messages),
+            first_divergence=divergence,
+            tools_changed=tools_changed,
+            breakpoint_hashes=breakpoints,
+        )
+        if divergence is None:
+            return
+        reason = "tools changed" if tools_changed else f"message {divergence} changed"
+        # Only noteworthy when the prompt is marked for provider caching
+        log = logger.info if breakpoints else logger.debug
+        log(
+            f"Prompt prefix for {self.model_name} diverged from the previous "
+            f"call ({reason}; {len(messages)} messages); cached prefix is "
+            "invalidated from there"
+        )
+
     def on_request(self, telemetry_ctx: dict | None) -> None:
         self._req_start = time.time()
         self._req_ctx = telemetry_ctx or {}
@@ -108,11 +151,17 @@ class Telemetry(BaseModel):
                 usage, response_id, self._req_ctx.get("context_window", 0)
             )
 
-        # 4) optional logging
+        # 4) prompt prefix / cache usage for this call
+        if self._pending_prompt is not None:
+            self._pending_prompt.response_id = response_id
+            self._prompt_cache.record(self._pending_prompt)
+            self._pending_prompt = None
+
+        # 5) optional logging
         if self.log_enabled:
             self.log_llm_call(resp, cost, raw_resp=raw_resp)
 
-        # 5) notify about stats update
+        # 6) notify about stats update
         if self._stats_update_callback is not None:
             try:
                 self._stats_update_callback()
@@ -235,6 +284,11 @@ class Telemetry(BaseModel):
         # Chat-specific: litellm may set a hidden cache write field
         cache_write = int(getattr(usage, "_cache_creation_input_tokens", 0) or 0)
 
+        if self._pending_prompt is not None:
+            self._pending_prompt.prompt_tokens = prompt_tokens
+            self._pending_prompt.cache_read_tokens = cache_read
+            self._pending_prompt.cache_write_tokens = cache_write
+
         self.metrics.add_token_usage(
             prompt_tokens=prompt_tokens,
             completion_tokens=completion_tokens,
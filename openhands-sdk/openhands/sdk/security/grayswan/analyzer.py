@@ -20,6 +20,7 @@ from openhands.sdk.logger import get_logger
 from openhands.sdk.security.analyzer import SecurityAnalyzerBase
 from openhands.sdk.security.grayswan.utils import convert_events_to_openai_messages
 from openhands.sdk.security.risk import SecurityRisk
+from openhands.sdk.utils.http_pool import get_http_client
 
 
 logger = get_logger(__name__)
@@ -134,9 +135,9 @@ class GraySwanAnalyzer(SecurityAnalyzerBase):
         self._events = list(events)
 
     def _create_client(self) -> httpx.Client:
-        """Create a new HTTP client instance."""
+        """Create a new HTTP client backed by the shared connection pools."""
         api_key_value = self.api_key.get_secret_value() if self.api_key else ""
-        return httpx.Client(
+        return get_http_client(
             timeout=self.timeout,
             headers={
                 "Authorization": f"Bearer {api_key_value}",
@@ -4,6 +4,11 @@ from openhands.sdk.tool.builtins import (
     FinishTool,
     ThinkTool,
 )
+from openhands.sdk.tool.output_stream import (
+    ToolOutputStream,
+    get_tool_output_stream,
+    streaming_tool_output,
+)
 from openhands.sdk.tool.registry import (
     list_registered_tools,
     register_tool,
@@ -27,6 +32,9 @@ __all__ = [
     "ToolDefinition",
     "ToolAnnotations",
     "ToolExecutor",
+    "ToolOutputStream",
+    "get_tool_output_stream",
+    "streaming_tool_output",
     "ExecutableTool",
     "Action",
     "Observation",
@@ -0,0 +1,127 @@
+"""Live output of tool calls that are still running.
+
+While a tool runs, the agent binds a :class:`ToolOutputStream` to the calling
+thread. Executors that produce output gradually (e.g. a long shell command)
+look it up with :func:`get_tool_output_stream` and :meth:`~ToolOutputStream.
+write` what they have so far. The chunks are published as events for UIs and
+subscribers only; the LLM still sees just the tool's final observation.
+"""
+
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+__all__ = [
+    "ToolOutputStream",
+    "get_tool_output_stream",
+    "streaming_tool_output",
+]
+
+# Minimum seconds between two chunks of the same tool call
+DEFAULT_MIN_INTERVAL = 1.0
+# Most characters published in one chunk; older pending output is dropped
+DEFAULT_MAX_CHUNK_CHARS = 8192
+
+# (output, sequence, dropped_chars) -> None
+ChunkCallback = Callable[[str, int, int], None]
+
+_current_stream: ContextVar["ToolOutputStream | None"] = ContextVar(
+    "tool_output_stream", default=None
+)
+
+
+class ToolOutputStream:
+    """Rate-limited, size-capped sink for the partial output of one tool call.
+
+    Written text is buffered and handed to ``on_chunk`` at most once every
+    ``min_interval`` seconds. If more than ``max_chunk_chars`` characters
+    pile up in between, only the newest ones are published and the number
+    of dropped characters is reported with the chunk. ``mask`` is applied to
+    each chunk before it is published, e.g. to hide secrets.
+
+    A stream belongs to a single tool call and is not thread-safe.
+    """
+
+    def __init__(
+        self,
+        on_chunk: ChunkCallback,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_chunk_chars: int = DEFAULT_MAX_CHUNK_CHARS,
+        mask: Callable[[str], str] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._on_chunk = on_chunk
+        self.min_interval = min_interval
+        self.max_chunk_chars = max_chunk_chars
+        self._mask = mask
+        self._clock = clock
+        self._pending: list[str] = []
+        self._pending_chars = 0
+        self._dropped = 0
+        self._sequence = 0
+        self._last_emit: float | None = None
+
+    @property
+    def chunks_emitted(self) -> int:
+        return self._sequence
+
+    def write(self, text: str) -> None:
+        """Buffer ``text`` and publish the pending output if a chunk is due.
+
+        Writing an empty string only checks whether pending output is due,
+        so callers polling for output can call this on every iteration.
+        """
+        if text:
+            self._pending.append(text)
+            self._pending_chars += len(text)
+            if self._pending_chars > 2 * self.max_chunk_chars:
+                self._compact()
+        if not self._pending:
+            return
+        now = self._clock()
+        if self._last_emit is None or now - self._last_emit >= self.min_interval:
+            self._emit(now)
+
+    def flush(self) -> None:
+        """Publish any pending output regardless of the rate limit."""
+        if self._pending:
+            self._emit(self._clock())
+
+    def _compact(self) -> None:
+        joined = "".join(self._pending)
+        keep = joined[-self.max_chunk_chars :]
+        self._dropped += len(joined) - len(keep)
+        self._pending = [keep]
+        self._pending_chars = len(keep)
+
+    def _emit(self, now: float) -> None:
+        self._compact()
+        output = self._pending[0]
+        dropped = self._dropped
+        self._pending = []
+        self._pending_chars = 0
+        self._dropped = 0
+        self._last_emit = now
+        if self._mask is not None:
+            output = self._mask(output)
+        sequence = self._sequence
+        self._sequence += 1
+        self._on_chunk(output, sequence, dropped)
+
+
+def get_tool_output_stream() -> ToolOutputStream | None:
+    """Return the stream of the tool call running in this thread, if any."""
+    return _current_stream.get()
+
+
+@contextmanager
+def streaming_tool_output(stream: ToolOutputStream) -> Iterator[ToolOutputStream]:
+    """Bind ``stream`` to the current thread; pending output is flushed on exit."""
+    token = _current_stream.set(stream)
+    try:
+        yield stream
+    finally:
+        _current_stream.reset(token)
+        stream.flush()
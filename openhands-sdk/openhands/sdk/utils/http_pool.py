@@ -0,0 +1,302 @@
+"""Process-wide HTTP connection pools.
+
+LLMs, condensers, title generation, the critic and security analyzers usually
+talk to a handful of provider endpoints. Instead of every client opening its
+own connections, clients created with :func:`get_http_client` or
+:func:`get_async_http_client` share a single registry of connection pools,
+keyed by the request origin and a hash of its credentials.
+
+The clients themselves are cheap wrappers holding headers and timeouts;
+closing one leaves the shared pools open.
+"""
+
+import asyncio
+import hashlib
+import importlib.util
+import threading
+import weakref
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
+
+from openhands.sdk.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "HTTPPoolConfig",
+    "HTTPPoolRegistry",
+    "HTTPPoolStats",
+    "configure_http_pools",
+    "get_async_http_client",
+    "get_http_client",
+    "get_http_pool_registry",
+]
+
+# Headers that carry credentials for the providers we talk to
+_AUTH_HEADERS = ("authorization", "x-api-key", "api-key", "x-goog-api-key")
+
+PoolKey = tuple[str, str]
+
+
+class HTTPPoolConfig(BaseModel):
+    """Limits applied to each pooled connection pool."""
+
+    max_connections: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum number of concurrent connections per pool.",
+    )
+    max_keepalive_connections: int = Field(
+        default=20,
+        ge=0,
+        description="Maximum number of idle connections kept open per pool.",
+    )
+    keepalive_expiry: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds an idle connection is kept open before closing.",
+    )
+    http2: bool = Field(
+        default=False,
+        description=(
+            "Whether to negotiate HTTP/2. Requires the 'h2' package; falls back "
+            "to HTTP/1.1 when it is not installed."
+        ),
+    )
+
+    model_config = ConfigDict(frozen=True)
+
+
+class HTTPPoolStats(BaseModel):
+    """Usage of one connection pool."""
+
+    origin: str
+    credentials: str = Field(description="Short hash of the credentials, or ''.")
+    requests: int = 0
+    connections: int = 0
+    idle_connections: int = 0
+
+
+def _pool_key(request: httpx.Request) -> PoolKey:
+    url = request.url
+    origin = f"{url.scheme}://{url.host}"
+    if url.port is not None:
+        origin = f"{origin}:{url.port}"
+    secret = "\n".join(request.headers.get(name, "") for name in _AUTH_HEADERS)
+    if not secret.strip():
+        return origin, ""
+    return origin, hashlib.sha256(secret.encode("utf-8")).hexdigest()[:12]
+
+
+def _connection_counts(transport: Any) -> tuple[int, int]:
+    # httpcore does not expose pool metrics publicly
+    pool = getattr(transport, "_pool", None)
+    connections = getattr(pool, "connections", None)
+    if connections is None:
+        return 0, 0
+    idle = sum(1 for c in connections if c.is_idle())
+    return len(connections), idle
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """Routes each request to the registry pool for its origin and credentials."""
+
+    def __init__(self, registry: "HTTPPoolRegistry"):
+        self._registry = registry
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._registry._transport_for(request).handle_request(request)
+
+    def close(self) -> None:
+        # Pools outlive the clients that use them
+        pass
+
+
+class _AsyncSharedTransport(httpx.AsyncBaseTransport):
+    def __init__(self, registry: "HTTPPoolRegistry"):
+        self._registry = registry
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        transport = self._registry._async_transport_for(request)
+        return await transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class HTTPPoolRegistry:
+    """Connection pools shared by every client created from this registry.
+
+    Async pools are additionally scoped to the running event loop, since
+    connections cannot be shared between loops.
+    """
+
+    def __init__(
+        self,
+        config: HTTPPoolConfig | None = None,
+        transport_factory: Callable[[HTTPPoolConfig], httpx.BaseTransport]
+        | None = None,
+        async_transport_factory: Callable[[HTTPPoolConfig], httpx.AsyncBaseTransport]
+        | None = None,
+    ):
+        self._config = config or HTTPPoolConfig()
+        self._transport_factory = transport_factory or _default_transport
+        self._async_transport_factory = (
+            async_transport_factory or _default_async_transport
+        )
+        self._lock = threading.Lock()
+        self._pools: dict[PoolKey, httpx.BaseTransport] = {}
+        self._async_pools: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[PoolKey, httpx.AsyncBaseTransport]
+        ] = weakref.WeakKeyDictionary()
+        self._requests: dict[PoolKey, int] = {}
+        self._transport = _SharedTransport(self)
+        self._async_transport = _AsyncSharedTransport(self)
+
+    @property
+    def config(self) -> HTTPPoolConfig:
+        return self._config
+
+    def configure(self, config: HTTPPoolConfig) -> None:
+        """Use ``config`` for pools opened from now on.
+
+        Existing pools keep their limits until :meth:`close` is called.
+        """
+        with self._lock:
+            self._config = config
+
+    def client(self, **kwargs: Any) -> httpx.Client:
+        """Create a client backed by the shared pools.
+
+        Keyword arguments are passed to :class:`httpx.Client`, except
+        ``transport``, which is always the shared one.
+        """
+        return httpx.Client(transport=self._transport, **kwargs)
+
+    def async_client(self, **kwargs: Any) -> httpx.AsyncClient:
+        """Create an async client backed by the shared pools."""
+        return httpx.AsyncClient(transport=self._async_transport, **kwargs)
+
+    def stats(self) -> list[HTTPPoolStats]:
+        """Return request and connection counts per pool."""
+        with self._lock:
+            transports: dict[PoolKey, list[Any]] = {
+                key: [transport] for key, transport in self._pools.items()
+            }
+            for pools in list(self._async_pools.values()):
+                for key, transport in pools.items():
+                    transports.setdefault(key, []).append(transport)
+            requests = dict(self._requests)
+
+        stats = []
+        for key in sorted(transports):
+            connections = idle = 0
+            for transport in transports[key]:
+                total, free = _connection_counts(transport)
+                connections += total
+                idle += free
+            stats.append(
+                HTTPPoolStats(
+                    origin=key[0],
+                    credentials=key[1],
+                    requests=requests.get(key, 0),
+                    connections=connections,
+                    idle_connections=idle,
+                )
+            )
+        return stats
+
+    def close(self) -> None:
+        """Close the synchronous pools and forget all pools.
+
+        Async pools are dropped without closing; their connections are
+        released when their event loop goes away.
+        """
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+            self._async_pools.clear()
+            self._requests.clear()
+        for transport in pools:
+            try:
+                transport.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled transport: {e}")
+
+    def _transport_for(self, request: httpx.Request) -> httpx.BaseTransport:
+        key = _pool_key(request)
+        with self._lock:
+            self._requests[key] = self._requests.get(key, 0) + 1
+            transport = self._pools.get(key)
+            if transport is None:
+                transport = self._transport_factory(self._config)
+                self._pools[key] = transport
+            return transport
+
+    def _async_transport_for(self, request: httpx.Request) -> httpx.AsyncBaseTransport:
+        key = _pool_key(request)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._requests[key] = self._requests.get(key, 0) + 1
+            pools = self._async_pools.get(loop)
+            if pools is None:
+                pools = self._async_pools[loop] = {}
+            transport = pools.get(key)
+            if transport is None:
+                transport = self._async_transport_factory(self._config)
+                pools[key] = transport
+            return transport
+
+
+def _http2_available(config: HTTPPoolConfig) -> bool:
+    if not config.http2:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP/2 requested but 'h2' is not installed; using HTTP/1.1")
+        return False
+    return True
+
+
+def _limits(config: HTTPPoolConfig) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry,
+    )
+
+
+def _default_transport(config: HTTPPoolConfig) -> httpx.BaseTransport:
+    return httpx.HTTPTransport(limits=_limits(config), http2=_http2_available(config))
+
+
+def _default_async_transport(config: HTTPPoolConfig) -> httpx.AsyncBaseTransport:
+    return httpx.AsyncHTTPTransport(
+        limits=_limits(config), http2=_http2_available(config)
+    )
+
+
+_registry = HTTPPoolRegistry()
+
+
+def get_http_pool_registry() -> HTTPPoolRegistry:
+    """Return the process-wide pool registry."""
+    return _registry
+
+
+def configure_http_pools(config: HTTPPoolConfig) -> None:
+    """Set the limits used by process-wide pools opened from now on."""
+    _registry.configure(config)
+
+
+def get_http_client(**kwargs: Any) -> httpx.Client:
+    """Create an :class:`httpx.Client` that uses the process-wide pools."""
+    return _registry.client(**kwargs)
+
+
+def get_async_http_client(**kwargs: Any) -> httpx.AsyncClient:
+    """Create an :class:`httpx.AsyncClient` that uses the process-wide pools."""
+    return _registry.async_client(**kwargs)
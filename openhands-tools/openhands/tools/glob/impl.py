@@ -7,6 +7,7 @@ import subprocess
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from openhands.sdk.logger import get_logger
 from openhands.sdk.tool import ToolExecutor
 from openhands.sdk.utils import sanitized_env
 
@@ -18,15 +19,27 @@ from openhands.tools.utils import (
     _check_ripgrep_available,
     _log_ripgrep_fallback_warning,
 )
+from openhands.tools.utils.file_index import (
+    FileIndexTooLargeError,
+    compile_glob,
+    get_file_index,
+    sort_newest_first,
+)
+
+
+logger = get_logger(__name__)
 
 
 class GlobExecutor(ToolExecutor[GlobAction, GlobObservation]):
     """Executor for glob pattern matching operations.
 
-    This implementation prefers ripgrep for performance but falls back to
-    Python's glob module if ripgrep is not available:
-    - Primary: Uses rg --files to list all files, filters by glob pattern with -g flag
-    - Fallback: Uses Python's glob.glob() for pattern matching
+    Queries are served from an in-memory file index of the search directory
+    that is refreshed incrementally, so repeated globs do not walk the tree.
+    Directories too large to index fall back to ripgrep, or to Python's glob
+    module if ripgrep is not available:
+    - Primary: Filters the file index with ripgrep's -g glob semantics
+    - Fallback: Uses rg --files to list all files, filters by glob pattern with -g flag
+    - Last resort: Uses Python's glob.glob() for pattern matching
     """
 
     def __init__(self, working_dir: str):
@@ -76,10 +89,14 @@ class GlobExecutor(ToolExecutor[GlobAction, GlobObservation]):
                     is_error=True,
                 )
 
-            if self._ripgrep_available:
-                files, truncated = self._execute_with_ripgrep(pattern, search_path)
-            else:
-                files, truncated = self._execute_with_glob(pattern, search_path)
+            try:
+                files, truncated = self._execute_with_index(pattern, search_path)
+            except FileIndexTooLargeError as e:
+                logger.info(f"glob: {e}, searching without the file index")
+                if self._ripgrep_available:
+                    files, truncated = self._execute_with_ripgrep(pattern, search_path)
+                else:
+                    files, truncated = self._execute_with_glob(pattern, search_path)
 
             # Format content message
             if not files:
@@ -125,6 +142,28 @@ class GlobExecutor(ToolExecutor[GlobAction, GlobObservation]):
                 is_error=True,
             )
 
+    def _execute_with_index(
+        self, pattern: str, search_path: Path
+    ) -> tuple[list[str], bool]:
+        """Execute glob pattern matching against the in-memory file index.
+
+        Args:
+            pattern: The glob pattern to match
+            search_path: The directory to search in
+
+        Returns:
+            Tuple of (file_paths, truncated) where file_paths is a list of matching files
+            and truncated is True if results were limited to 100 files
+
+        Raises:
+            FileIndexTooLargeError: If search_path is too large to index
+        """  # noqa: E501
+        index, subdir = get_file_index(search_path)
+        matches = list(index.iter_files(subdir, compile_glob(pattern)))
+        # Only matching files are stat'ed, to sort them newest first
+        file_paths = sort_newest_first(matches)
+        return file_paths[:100], len(file_paths) > 100
+
     def _execute_with_ripgrep(
         self, pattern: str, search_path: Path
     ) -> tuple[list[str], bool]:
@@ -2,9 +2,12 @@
 
 import re
 import subprocess
+import time
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from openhands.sdk.logger import get_logger
 from openhands.sdk.tool import ToolExecutor
 from openhands.sdk.utils import sanitized_env
 
@@ -16,15 +19,65 @@ from openhands.tools.utils import (
     _check_ripgrep_available,
     _log_ripgrep_fallback_warning,
 )
+from openhands.tools.utils.file_index import (
+    FileIndexTooLargeError,
+    compile_glob,
+    get_file_index,
+    get_io_pool,
+    sort_newest_first,
+)
+
+
+logger = get_logger(__name__)
+
+MAX_MATCHES = 100
+SEARCH_TIMEOUT_SECONDS = 30
+# Candidates are searched newest first in batches that double in size, so a
+# common pattern stops after a few hundred files while a rare one still gets
+# large batches that keep every core busy
+FIRST_BATCH_SIZE = 256
+MAX_BATCH_SIZE = 4096
+# Keeps a batch's command line well below the kernel's argument size limit
+MAX_BATCH_CHARS = 256 * 1024
+# As grep -I and ripgrep do, a NUL byte in the first block marks a binary file
+BINARY_SNIFF_BYTES = 8192
+
+
+def _batches(paths: Sequence[str]) -> Iterator[Sequence[str]]:
+    size = FIRST_BATCH_SIZE
+    start = 0
+    while start < len(paths):
+        end = start
+        chars = 0
+        while end < len(paths) and end - start < size and chars < MAX_BATCH_CHARS:
+            chars += len(paths[end]) + 1
+            end += 1
+        yield paths[start:end]
+        start = end
+        size = min(size * 2, MAX_BATCH_SIZE)
+
+
+def _file_contains(path: str, regex: re.Pattern[str]) -> bool:
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return False
+    if b"\0" in data[:BINARY_SNIFF_BYTES]:
+        return False
+    return regex.search(data.decode("utf-8", errors="replace")) is not None
 
 
 class GrepExecutor(ToolExecutor[GrepAction, GrepObservation]):
     """Executor for grep content search operations.
 
-    This implementation prefers ripgrep for performance but falls back to
-    regular grep if ripgrep is not available:
-    - Primary: Uses ripgrep with case-insensitive search and file listing
-    - Fallback: Uses regular grep command with similar functionality
+    Candidate files come from an in-memory file index of the search directory
+    that is refreshed incrementally. They are searched newest first in batches,
+    stopping as soon as 100 matching files are found:
+    - Primary: Each batch is handed to ripgrep, which searches it on all cores
+    - Without ripgrep: Each batch is searched on a thread pool in this process
+    Directories too large to index are searched with a single ripgrep call, or
+    the regular grep command if ripgrep is not available.
     """
 
     def __init__(self, working_dir: str):
@@ -80,6 +133,11 @@ class GrepExecutor(ToolExecutor[GrepAction, GrepObservation]):
                     is_error=True,
                 )
 
+            try:
+                return self._execute_with_index(action, search_path)
+            except FileIndexTooLargeError as e:
+                logger.info(f"grep: {e}, searching without the file index")
+
             if self._ripgrep_available:
                 return self._execute_with_ripgrep(action, search_path)
             else:
@@ -135,6 +193,98 @@ class GrepExecutor(ToolExecutor[GrepAction, GrepObservation]):
             )
         return output
 
+    def _execute_with_index(
+        self, action: GrepAction, search_path: Path
+    ) -> GrepObservation:
+        """Execute grep content search over files from the in-memory index.
+
+        Raises:
+            FileIndexTooLargeError: If search_path is too large to index
+        """
+        index, subdir = get_file_index(search_path)
+        matcher = compile_glob(action.include) if action.include else None
+        candidates = sort_newest_first(list(index.iter_files(subdir, matcher)))
+
+        deadline = time.monotonic() + SEARCH_TIMEOUT_SECONDS
+        matches: list[str] = []
+        for batch in _batches(candidates):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"Search timed out after {SEARCH_TIMEOUT_SECONDS} seconds"
+                )
+            if self._ripgrep_available:
+                found = self._search_batch_with_ripgrep(
+                    action.pattern, batch, remaining
+                )
+            else:
+                found = self._search_batch_in_process(
+                    action.pattern, batch, MAX_MATCHES - len(matches)
+                )
+            matches.extend(found[: MAX_MATCHES - len(matches)])
+            if len(matches) >= MAX_MATCHES:
+                break
+
+        truncated = len(matches) >= MAX_MATCHES
+
+        output = self._format_output(
+            matches=matches,
+            pattern=action.pattern,
+            search_path=str(search_path),
+            include_pattern=action.include,
+            truncated=truncated,
+        )
+
+        return GrepObservation.from_text(
+            text=output,
+            matches=matches,
+            pattern=action.pattern,
+            search_path=str(search_path),
+            include_pattern=action.include,
+            truncated=truncated,
+        )
+
+    def _search_batch_with_ripgrep(
+        self, pattern: str, paths: Sequence[str], timeout: float
+    ) -> list[str]:
+        """Return the files in paths containing pattern, in the given order.
+
+        Without --sortr, ripgrep searches the files on all cores; the order is
+        restored here from the newest-first candidate list.
+        """
+        cmd = ["rg", "-l", "-i", "--no-messages", "-e", pattern, "--", *paths]
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            check=False,
+            env=sanitized_env(),
+        )
+        found = set(result.stdout.splitlines())
+        return [path for path in paths if path in found]
+
+    def _search_batch_in_process(
+        self, pattern: str, paths: Sequence[str], limit: int
+    ) -> list[str]:
+        """Return up to limit files in paths containing pattern, in order.
+
+        Files are read on the shared I/O pool. Pending reads are cancelled once
+        limit files have matched.
+        """
+        regex = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+        found: list[str] = []
+        results = get_io_pool().map(lambda path: _file_contains(path, regex), paths)
+        try:
+            for path, contains in zip(paths, results):
+                if contains:
+                    found.append(path)
+                    if len(found) >= limit:
+                        break
+        finally:
+            results.close()
+        return found
+
     def _execute_with_ripgrep(
         self, action: GrepAction, search_path: Path
     ) -> GrepObservation:
@@ -10,6 +10,7 @@ from openhands.tools.terminal.impl import TerminalExecutor
 from openhands.tools.terminal.terminal import (
     TerminalCommandStatus,
     TerminalSession,
+    configure_terminal_session_pool,
     create_terminal_session,
 )
 
@@ -24,4 +25,5 @@ __all__ = [
     "TerminalSession",
     "TerminalCommandStatus",
     "create_terminal_session",
+    "configure_terminal_session_pool",
 ]
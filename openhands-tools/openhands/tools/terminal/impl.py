@@ -12,7 +12,7 @@ from openhands.tools.terminal.definition import (
     TerminalAction,
     TerminalObservation,
 )
-from openhands.tools.terminal.terminal.factory import create_terminal_session
+from openhands.tools.terminal.terminal.factory import checkout_terminal_session
 from openhands.tools.terminal.terminal.terminal_session import TerminalSession
 
 
@@ -47,14 +47,14 @@ class TerminalExecutor(ToolExecutor[TerminalAction, TerminalObservation]):
                                   logs and files, used when truncation is needed.
         """
         self.shell_path = shell_path
-        self.session = create_terminal_session(
+        # Takes a pre-warmed session from the process-wide pool when one is ready
+        self.session = checkout_terminal_session(
             work_dir=working_dir,
             username=username,
             no_change_timeout_seconds=no_change_timeout_seconds,
             terminal_type=terminal_type,
             shell_path=shell_path,
         )
-        self.session.initialize()
         self.full_output_save_dir: str | None = full_output_save_dir
         logger.info(
             f"TerminalExecutor initialized with working_dir: {working_dir}, "
@@ -110,14 +110,13 @@ class TerminalExecutor(ToolExecutor[TerminalAction, TerminalObservation]):
         original_no_change_timeout = self.session.no_change_timeout_seconds
 
         self.session.close()
-        self.session = create_terminal_session(
+        self.session = checkout_terminal_session(
             work_dir=original_work_dir,
             username=original_username,
             no_change_timeout_seconds=original_no_change_timeout,
             terminal_type=None,  # Let it auto-detect like before
             shell_path=self.shell_path,
         )
-        self.session.initialize()
 
         logger.info(
             f"Terminal session reset successfully with working_dir: {original_work_dir}"
@@ -1,7 +1,13 @@
 import platform
 from typing import TYPE_CHECKING
 
-from openhands.tools.terminal.terminal.factory import create_terminal_session
+from openhands.tools.terminal.terminal.factory import (
+    TerminalSessionPool,
+    checkout_terminal_session,
+    configure_terminal_session_pool,
+    create_terminal_session,
+    get_terminal_session_pool,
+)
 from openhands.tools.terminal.terminal.interface import (
     TerminalInterface,
     TerminalSessionBase,
@@ -34,4 +40,8 @@ __all__ = [
     "TerminalSession",
     "TerminalCommandStatus",
     "create_terminal_session",
+    "checkout_terminal_session",
+    "configure_terminal_session_pool",
+    "get_terminal_session_pool",
+    "TerminalSessionPool",
 ]
@@ -1,16 +1,33 @@
 """Factory for creating appropriate terminal sessions based on system capabilities."""
 
+import atexit
+import os
 import platform
+import re
+import shlex
 import subprocess
+import tempfile
+import threading
+from dataclasses import dataclass
 from typing import Literal
 
 from openhands.sdk.logger import get_logger
 from openhands.sdk.utils import sanitized_env
+from openhands.tools.terminal.constants import NO_CHANGE_TIMEOUT_SECONDS
+from openhands.tools.terminal.definition import TerminalAction
 from openhands.tools.terminal.terminal.terminal_session import TerminalSession
 
 
 logger = get_logger(__name__)
 
+TerminalType = Literal["tmux", "subprocess"]
+# (terminal type, username, shell path) of sessions that are interchangeable
+PoolKey = tuple[TerminalType, str | None, str | None]
+
+# Idle sessions kept per pool key unless configured otherwise
+_DEFAULT_POOL_SIZE_ENV = "OPENHANDS_TERMINAL_POOL_SIZE"
+_ENV_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
 
 def _is_tmux_available() -> bool:
     """Check if tmux is available on the system."""
@@ -53,7 +70,7 @@ def create_terminal_session(
     work_dir: str,
     username: str | None = None,
     no_change_timeout_seconds: int | None = None,
-    terminal_type: Literal["tmux", "subprocess"] | None = None,
+    terminal_type: TerminalType | None = None,
     shell_path: str | None = None,
 ) -> TerminalSession:
     """Create an appropriate terminal session based on system capabilities.
@@ -123,3 +140,314 @@ def create_terminal_session(
             logger.info("Auto-detected: Using SubprocessTerminal (tmux not available)")
             terminal = SubprocessTerminal(work_dir, username, shell_path)
             return TerminalSession(terminal, no_change_timeout_seconds)
+
+
+@dataclass
+class _PooledSession:
+    session: TerminalSession
+    # Environment the shell was started with
+    env: dict[str, str]
+
+
+class TerminalSessionPool:
+    """Process-wide pool of initialized, never used terminal sessions.
+
+    Starting a shell, configuring its prompt and letting it settle takes up
+    to a second per session. The pool keeps up to ``size`` idle sessions per
+    terminal type, user and shell ready, warming them in background threads,
+    so :meth:`checkout` only has to reset one: it changes to the requested
+    working directory, replays changes to the process environment made since
+    the shell started, and clears the shell history and terminal output.
+
+    Checked-out sessions are never returned to the pool, so nothing one
+    conversation does in its shell can leak into another; the pool is
+    refilled in the background instead. A size of 0 disables pooling.
+    """
+
+    def __init__(self, size: int = 0, work_dir: str | None = None):
+        if size < 0:
+            raise ValueError("Terminal session pool size must be >= 0")
+        self._size = size
+        # Sessions start here and are moved to the caller's work_dir on checkout
+        self._work_dir = work_dir or tempfile.gettempdir()
+        self._cond = threading.Condition()
+        self._idle: dict[PoolKey, list[_PooledSession]] = {}
+        self._warming: dict[PoolKey, int] = {}
+        self._detected_type: TerminalType | None = None
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def configure(self, size: int) -> None:
+        """Keep up to ``size`` idle sessions per key; extra ones are closed."""
+        if size < 0:
+            raise ValueError("Terminal session pool size must be >= 0")
+        excess: list[_PooledSession] = []
+        with self._cond:
+            self._size = size
+            for idle in self._idle.values():
+                excess.extend(idle[size:])
+                del idle[size:]
+        for pooled in excess:
+            pooled.session.close()
+
+    def idle_count(
+        self,
+        username: str | None = None,
+        terminal_type: TerminalType | None = None,
+        shell_path: str | None = None,
+    ) -> int:
+        """Number of sessions ready for :meth:`checkout` with these settings."""
+        key = self._key(username, terminal_type, shell_path)
+        with self._cond:
+            return len(self._idle.get(key, [])) if key else 0
+
+    def prewarm(
+        self,
+        username: str | None = None,
+        terminal_type: TerminalType | None = None,
+        shell_path: str | None = None,
+        timeout: float | None = None,
+    ) -> bool:
+        """Start filling the pool for sessions with these settings.
+
+        If ``timeout`` is given, wait up to that long for the pool to fill.
+
+        Returns:
+            True if the pool holds ``size`` idle sessions for these settings.
+        """
+        key = self._key(username, terminal_type, shell_path)
+        if key is None or self._size == 0:
+            return False
+        self._refill(key)
+        with self._cond:
+            if timeout is not None:
+                self._cond.wait_for(
+                    lambda: self._closed
+                    or len(self._idle.get(key, [])) >= self._size
+                    or not self._warming.get(key),
+                    timeout,
+                )
+            return len(self._idle.get(key, [])) >= self._size
+
+    def checkout(
+        self,
+        work_dir: str,
+        username: str | None = None,
+        no_change_timeout_seconds: int | None = None,
+        terminal_type: TerminalType | None = None,
+        shell_path: str | None = None,
+    ) -> TerminalSession | None:
+        """Take an idle session and reset it for ``work_dir``.
+
+        Returns:
+            An initialized session, or None if none was ready, in which case
+            the caller creates one itself. The pool is refilled either way.
+        """
+        if self._size == 0:
+            return None
+        key = self._key(username, terminal_type, shell_path)
+        if key is None:
+            return None
+        with self._cond:
+            idle = self._idle.get(key)
+            pooled = idle.pop() if idle else None
+            if pooled is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        self._refill(key)
+        if pooled is None:
+            return None
+
+        try:
+            if self._reset(pooled, work_dir, no_change_timeout_seconds):
+                return pooled.session
+        except Exception as e:
+            logger.warning(f"Failed to reset pooled terminal session: {e}")
+        pooled.session.close()
+        return None
+
+    def close(self) -> None:
+        """Close all idle sessions and stop refilling the pool."""
+        with self._cond:
+            self._closed = True
+            idle = [p for sessions in self._idle.values() for p in sessions]
+            self._idle.clear()
+            self._cond.notify_all()
+        for pooled in idle:
+            try:
+                pooled.session.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled terminal session: {e}")
+
+    def _key(
+        self,
+        username: str | None,
+        terminal_type: TerminalType | None,
+        shell_path: str | None,
+    ) -> PoolKey | None:
+        if terminal_type is None:
+            # Mirror the auto-detection of create_terminal_session
+            if platform.system() == "Windows":
+                return None
+            if self._detected_type is None:
+                self._detected_type = "tmux" if _is_tmux_available() else "subprocess"
+            terminal_type = self._detected_type
+        if terminal_type == "tmux":
+            # Tmux always starts /bin/bash
+            shell_path = None
+        return terminal_type, username, shell_path
+
+    def _refill(self, key: PoolKey) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            pending = len(self._idle.get(key, [])) + self._warming.get(key, 0)
+            missing = self._size - pending
+            if missing <= 0:
+                return
+            self._warming[key] = self._warming.get(key, 0) + missing
+        for _ in range(missing):
+            threading.Thread(
+                target=self._warm, args=(key,), name="terminal-pool", daemon=True
+            ).start()
+
+    def _warm(self, key: PoolKey) -> None:
+        terminal_type, username, shell_path = key
+        session: TerminalSession | None = None
+        env = sanitized_env()
+        try:
+            session = create_terminal_session(
+                work_dir=self._work_dir,
+                username=username,
+                terminal_type=terminal_type,
+                shell_path=shell_path,
+            )
+            session.initialize()
+        except Exception as e:
+            logger.warning(f"Failed to pre-warm {terminal_type} terminal session: {e}")
+            if session is not None:
+                session.close()
+            session = None
+
+        with self._cond:
+            self._warming[key] -= 1
+            idle = self._idle.setdefault(key, [])
+            if session is not None and not self._closed and len(idle) < self._size:
+                idle.append(_PooledSession(session, env))
+                session = None
+            self._cond.notify_all()
+        if session is not None:
+            session.close()
+
+    def _reset(
+        self,
+        pooled: _PooledSession,
+        work_dir: str,
+        no_change_timeout_seconds: int | None,
+    ) -> bool:
+        """Prepare a pooled session as if it had been started in ``work_dir``."""
+        session = pooled.session
+        if session._closed or session.terminal.is_powershell():
+            return False
+
+        env = sanitized_env()
+        lines = []
+        removed = [k for k in pooled.env if k not in env and _ENV_NAME.match(k)]
+        if removed:
+            lines.append("unset -v " + " ".join(sorted(removed)))
+        lines.extend(
+            f"export {k}={shlex.quote(v)}"
+            for k, v in env.items()
+            if pooled.env.get(k) != v and _ENV_NAME.match(k)
+        )
+        work_dir = os.path.abspath(work_dir)
+        commands = ["history -c", f"cd -- {shlex.quote(work_dir)}"]
+
+        env_file = None
+        if lines:
+            # Sourced from a private file so values are never typed into the
+            # terminal, where they would be echoed and subject to escaping
+            fd, env_file = tempfile.mkstemp(prefix="openhands-env-", suffix=".sh")
+            with os.fdopen(fd, "w") as f:
+                f.write("\n".join(lines) + "\n")
+            commands.insert(0, f"source {shlex.quote(env_file)}")
+        try:
+            obs = session.execute(TerminalAction(command=" && ".join(commands)))
+        finally:
+            if env_file is not None:
+                os.unlink(env_file)
+        if obs.metadata.exit_code != 0:
+            return False
+
+        session.terminal.clear_screen()
+        session.prev_status = None
+        session.prev_output = ""
+        session.work_dir = session.terminal.work_dir = work_dir
+        session.no_change_timeout_seconds = (
+            no_change_timeout_seconds or NO_CHANGE_TIMEOUT_SECONDS
+        )
+        return True
+
+
+def _default_pool_size() -> int:
+    value = os.environ.get(_DEFAULT_POOL_SIZE_ENV, "")
+    try:
+        return max(int(value), 0) if value else 0
+    except ValueError:
+        logger.warning(f"Ignoring invalid {_DEFAULT_POOL_SIZE_ENV}={value!r}")
+        return 0
+
+
+_pool = TerminalSessionPool(size=_default_pool_size())
+atexit.register(_pool.close)
+
+
+def get_terminal_session_pool() -> TerminalSessionPool:
+    """Return the process-wide terminal session pool."""
+    return _pool
+
+
+def configure_terminal_session_pool(size: int) -> None:
+    """Set how many idle sessions the process-wide pool keeps per key.
+
+    The default comes from the ``OPENHANDS_TERMINAL_POOL_SIZE`` environment
+    variable and is 0, which disables pooling.
+    """
+    _pool.configure(size)
+
+
+def checkout_terminal_session(
+    work_dir: str,
+    username: str | None = None,
+    no_change_timeout_seconds: int | None = None,
+    terminal_type: TerminalType | None = None,
+    shell_path: str | None = None,
+) -> TerminalSession:
+    """Return an initialized session, from the process-wide pool if possible.
+
+    Takes the same arguments as :func:`create_terminal_session`. Unlike it,
+    the returned session is already initialized.
+    """
+    session = _pool.checkout(
+        work_dir=work_dir,
+        username=username,
+        no_change_timeout_seconds=no_change_timeout_seconds,
+        terminal_type=terminal_type,
+        shell_path=shell_path,
+    )
+    if session is None:
+        session = create_terminal_session(
+            work_dir=work_dir,
+            username=username,
+            no_change_timeout_seconds=no_change_timeout_seconds,
+            terminal_type=terminal_type,
+            shell_path=shell_path,
+        )
+        session.initialize()
+    return session
@@ -1,6 +1,7 @@
 """Abstract interface for terminal backends."""
 
 import os
+import time
 from abc import ABC, abstractmethod
 
 from openhands.tools.terminal.constants import (
@@ -106,6 +107,59 @@ class TerminalInterface(ABC):
             True if a command is running, False otherwise.
         """
 
+    @property
+    def supports_read_since(self) -> bool:
+        """Whether :meth:`read_since` and :attr:`output_offset` are available."""
+        return False
+
+    @property
+    def output_offset(self) -> int:
+        """Offset just past the newest output, for use with :meth:`read_since`."""
+        raise NotImplementedError(f"{type(self).__name__} has no output offsets")
+
+    def read_since(self, offset: int) -> tuple[str, int]:
+        """Read the raw output appended after ``offset``.
+
+        Offsets count characters of the backend's output stream since the
+        terminal started, so passing back the returned end offset reads only
+        what arrived in between. Output is retained in a bounded buffer; if
+        ``offset`` was already evicted, the oldest retained output is where
+        the returned text starts. Unlike :meth:`read_screen`, the text is the
+        stream as printed, so it may contain control sequences.
+
+        Args:
+            offset: Offset returned by a previous call or :attr:`output_offset`.
+
+        Returns:
+            The new output and the offset just past it.
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no output offsets")
+
+    def wait_for_completion(self, timeout: float) -> bool:
+        """Wait until a command may have completed since the last screen read.
+
+        Backends that see output as it arrives return as soon as the PS1 end
+        marker appears in output not yet returned by :meth:`read_screen`.
+        The default implementation cannot tell and sleeps for ``timeout``.
+
+        Args:
+            timeout: Maximum time to wait, in seconds.
+
+        Returns:
+            True if a new prompt was printed, False if the wait timed out.
+        """
+        time.sleep(timeout)
+        return False
+
+    def has_new_output(self) -> bool:
+        """Check whether output arrived since the last :meth:`read_screen`.
+
+        Returns:
+            True if there may be new output. Backends that cannot tell
+            always return True.
+        """
+        return True
+
     @property
     def initialized(self) -> bool:
         """Check if the terminal is initialized."""
@@ -0,0 +1,127 @@
+"""Bounded terminal output buffer addressed by absolute offsets."""
+
+from collections import deque
+
+from openhands.tools.terminal.constants import HISTORY_LIMIT
+
+
+# Defaults bounding memory regardless of how much a command prints
+MAX_BUFFER_LINES = HISTORY_LIMIT + 50
+MAX_BUFFER_CHARS = 16 * 1024 * 1024
+MAX_LINE_CHARS = 64 * 1024
+
+
+class TerminalOutputBuffer:
+    """Ring buffer of terminal output, one line per item.
+
+    Every character ever appended has an absolute offset, so readers can ask
+    for what arrived after an offset they saw earlier (:meth:`read_since`)
+    without re-reading the whole history. The oldest lines are evicted once
+    the buffer holds more than ``max_lines`` lines or ``max_chars``
+    characters; a line longer than ``max_line_chars`` is stored in pieces.
+
+    The buffer is not thread-safe; callers hold their own lock.
+    """
+
+    def __init__(
+        self,
+        max_lines: int = MAX_BUFFER_LINES,
+        max_chars: int = MAX_BUFFER_CHARS,
+        max_line_chars: int = MAX_LINE_CHARS,
+    ):
+        self.max_lines = max_lines
+        self.max_chars = max_chars
+        self.max_line_chars = max_line_chars
+        self._items: deque[str] = deque()
+        self._start = 0
+        self._size = 0
+
+    @property
+    def start(self) -> int:
+        """Offset of the oldest character still held."""
+        return self._start
+
+    @property
+    def end(self) -> int:
+        """Offset just past the newest character."""
+        return self._start + self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def text(self) -> str:
+        return "".join(self._items)
+
+    def append(self, text: str) -> None:
+        if not text:
+            return
+        items = self._items
+        # Continue a trailing partial line unless it already reached the cap
+        if (
+            items
+            and not items[-1].endswith("\n")
+            and len(items[-1]) < self.max_line_chars
+        ):
+            last = items.pop()
+            self._size -= len(last)
+            text = last + text
+
+        lines = text.split("\n")
+        for line in lines[:-1]:
+            self._push(line + "\n")
+        if lines[-1]:
+            self._push(lines[-1])
+        self._trim()
+
+    def _push(self, line: str) -> None:
+        cap = self.max_line_chars
+        for i in range(0, len(line), cap):
+            piece = line[i : i + cap]
+            self._items.append(piece)
+            self._size += len(piece)
+
+    def _trim(self) -> None:
+        items = self._items
+        while items and (len(items) > self.max_lines or self._size > self.max_chars):
+            dropped = items.popleft()
+            self._start += len(dropped)
+            self._size -= len(dropped)
+
+    def read_since(self, offset: int) -> tuple[str, int]:
+        """Return the output after ``offset`` and the offset of its end.
+
+        If ``offset`` was already evicted, everything still held is returned.
+        The cost is proportional to the returned text, not the buffer size.
+        """
+        end = self.end
+        if offset >= end:
+            return "", end
+        if offset <= self._start:
+            return self.text(), end
+        parts: list[str] = []
+        pos = end
+        for item in reversed(self._items):
+            pos -= len(item)
+            if pos <= offset:
+                parts.append(item[offset - pos :])
+                break
+            parts.append(item)
+        parts.reverse()
+        return "".join(parts), end
+
+    def discard_before(self, offset: int) -> None:
+        """Drop everything before ``offset``; offsets of the rest are kept."""
+        offset = min(offset, self.end)
+        items = self._items
+        while items and self._start + len(items[0]) <= offset:
+            dropped = items.popleft()
+            self._start += len(dropped)
+            self._size -= len(dropped)
+        if items and self._start < offset:
+            cut = offset - self._start
+            items[0] = items[0][cut:]
+            self._start += cut
+            self._size -= cut
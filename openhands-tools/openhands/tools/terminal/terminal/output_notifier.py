@@ -0,0 +1,59 @@
+"""Wake-ups for terminal output and PS1 prompts as they arrive."""
+
+import threading
+
+from openhands.tools.terminal.constants import CMD_OUTPUT_PS1_END
+
+
+class OutputNotifier:
+    """Tracks terminal output as it is read from the backend.
+
+    The backend's reader calls :meth:`feed` with each chunk of raw output,
+    and :meth:`mark_read` whenever it hands the screen to the session.
+    Only the newly fed chunk (plus a few carried-over characters, so a
+    marker split across chunks is still found) is scanned for the PS1 end
+    marker. Waiters in :meth:`wait_for_prompt` wake as soon as it shows up.
+    """
+
+    def __init__(self, marker: str = CMD_OUTPUT_PS1_END.strip()):
+        self._marker = marker
+        self._cond = threading.Condition()
+        self._carry = ""
+        self._output_seq = 0
+        self._prompt_seq = 0
+        self._read_output_seq = 0
+        self._read_prompt_seq = 0
+
+    def feed(self, text: str) -> None:
+        """Record a chunk of output that was just made readable."""
+        if not text:
+            return
+        with self._cond:
+            window = self._carry + text
+            self._output_seq += 1
+            if self._marker in window:
+                self._prompt_seq += 1
+            self._carry = window[-(len(self._marker) - 1) :]
+            self._cond.notify_all()
+
+    def mark_read(self) -> None:
+        """Note that everything fed so far is about to be read."""
+        with self._cond:
+            self._read_output_seq = self._output_seq
+            self._read_prompt_seq = self._prompt_seq
+
+    def has_new_output(self) -> bool:
+        """Whether output was fed since the last read.
+
+        Until the first chunk arrives the feed is not known to work, so this
+        reports True and callers keep reading the screen.
+        """
+        with self._cond:
+            return self._output_seq == 0 or self._output_seq != self._read_output_seq
+
+    def wait_for_prompt(self, timeout: float) -> bool:
+        """Wait until a prompt is fed after the last read, or ``timeout``."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._prompt_seq != self._read_prompt_seq, timeout
+            )
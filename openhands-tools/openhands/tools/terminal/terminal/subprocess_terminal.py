@@ -1,5 +1,6 @@
 """PTY-based terminal backend implementation (replaces pipe-based subprocess)."""
 
+import codecs
 import os
 import platform
 import re
@@ -8,7 +9,6 @@ import signal
 import subprocess
 import threading
 import time
-from collections import deque
 
 
 if platform.system() == "Windows":
@@ -26,10 +26,11 @@ from openhands.sdk.utils import sanitized_env
 from openhands.tools.terminal.constants import (
     CMD_OUTPUT_PS1_BEGIN,
     CMD_OUTPUT_PS1_END,
-    HISTORY_LIMIT,
 )
 from openhands.tools.terminal.metadata import CmdOutputMetadata
 from openhands.tools.terminal.terminal import TerminalInterface
+from openhands.tools.terminal.terminal.output_buffer import TerminalOutputBuffer
+from openhands.tools.terminal.terminal.output_notifier import OutputNotifier
 
 
 logger = get_logger(__name__)
@@ -54,8 +55,9 @@ class SubprocessTerminal(TerminalInterface):
     PS1: str
     process: subprocess.Popen | None
     _pty_master_fd: int | None
-    output_buffer: deque[str]
+    output_buffer: TerminalOutputBuffer
     output_lock: threading.Lock
+    output_notifier: OutputNotifier
     reader_thread: threading.Thread | None
     _current_command_running: bool
 
@@ -69,10 +71,11 @@ class SubprocessTerminal(TerminalInterface):
         self.PS1 = CmdOutputMetadata.to_ps1_prompt()
         self.process = None
         self._pty_master_fd = None
-        # Use a slightly larger buffer to match tmux behavior which seems to keep
-        # ~10,001 lines instead of exactly 10,000
-        self.output_buffer = deque(maxlen=HISTORY_LIMIT + 50)  # Circular buffer
+        # Keeps slightly more lines than HISTORY_LIMIT to match tmux behavior,
+        # which seems to keep ~10,001 lines instead of exactly 10,000
+        self.output_buffer = TerminalOutputBuffer()
         self.output_lock = threading.Lock()
+        self.output_notifier = OutputNotifier()
         self.reader_thread = None
         self._current_command_running = False
         self.shell_path = shell_path
@@ -231,6 +234,8 @@ class SubprocessTerminal(TerminalInterface):
         if fd is None:
             return
 
+        # Multi-byte characters may be split across reads
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
         try:
             while True:
                 # Exit early if process died
@@ -247,10 +252,12 @@ class SubprocessTerminal(TerminalInterface):
                     if not chunk:
                         break  # EOF
                     # Normalize newlines; PTY typically uses \n already
-                    text = chunk.decode("utf-8", errors="replace")
+                    text = decoder.decode(chunk)
                     with self.output_lock:
-                        # Store one line per buffer item to make deque truncation work
+                        # Store one line per buffer item so old lines can be evicted
                         self._add_text_to_buffer(text)
+                    # After buffering, so a woken reader always sees the text
+                    self.output_notifier.feed(text)
                 except OSError:
                     # Would-block or FD closed
                     continue
@@ -262,23 +269,7 @@ class SubprocessTerminal(TerminalInterface):
 
     def _add_text_to_buffer(self, text: str) -> None:
         """Add text to buffer, ensuring one line per buffer item."""
-        # If there's a partial line in the last buffer item, combine with new text
-        if self.output_buffer and not self.output_buffer[-1].endswith("\n"):
-            combined_text = self.output_buffer[-1] + text
-            self.output_buffer.pop()  # Remove the partial line
-        else:
-            combined_text = text
-
-        # Split into lines and add each line as a separate buffer item
-        lines = combined_text.split("\n")
-
-        # Add all complete lines (all but the last, which might be partial)
-        for line in lines[:-1]:
-            self.output_buffer.append(line + "\n")
-
-        # Add the last part (might be partial line)
-        if lines[-1]:  # Only add if not empty
-            self.output_buffer.append(lines[-1])
+        self.output_buffer.append(text)
 
     # ------------------------- Readiness Helpers -------------------------
 
@@ -291,7 +282,7 @@ class SubprocessTerminal(TerminalInterface):
             if self._pty_master_fd is not None:
                 select.select([], [], [], 0.02)
             with self.output_lock:
-                data = "".join(self.output_buffer)
+                data = self.output_buffer.text()
             if is_regex:
                 assert isinstance(pattern, re.Pattern)
                 if pattern.search(data):
@@ -308,7 +299,7 @@ class SubprocessTerminal(TerminalInterface):
         deadline = time.time() + timeout
         while time.time() < deadline:
             with self.output_lock:
-                tail = "".join(self.output_buffer)[-4096:]
+                tail, _ = self.output_buffer.read_since(self.output_buffer.end - 4096)
             if pat.search(tail):
                 return True
             time.sleep(0.05)
@@ -453,12 +444,37 @@ class SubprocessTerminal(TerminalInterface):
         time.sleep(0.01)
 
         with self.output_lock:
-            content = "".join(self.output_buffer)
+            self.output_notifier.mark_read()
+            content = self.output_buffer.text()
             lines = content.split("\n")
             content = "\n".join(lines).replace("\r", "")
             logger.debug(f"Read from subprocess PTY: {content!r}")
             return content
 
+    @property
+    def supports_read_since(self) -> bool:
+        return True
+
+    @property
+    def output_offset(self) -> int:
+        with self.output_lock:
+            return self.output_buffer.end
+
+    def read_since(self, offset: int) -> tuple[str, int]:
+        """Read output after ``offset`` from the PTY buffer."""
+        with self.output_lock:
+            self.output_notifier.mark_read()
+            return self.output_buffer.read_since(offset)
+
+    def wait_for_completion(self, timeout: float) -> bool:
+        """Wait until the reader thread sees a new PS1 prompt, or ``timeout``."""
+        if not self._initialized:
+            return super().wait_for_completion(timeout)
+        return self.output_notifier.wait_for_prompt(timeout)
+
+    def has_new_output(self) -> bool:
+        return self.output_notifier.has_new_output()
+
     def clear_screen(self) -> None:
         """Drop buffered output up to the most recent PS1 block; do not emit ^L."""
         if not self._initialized:
@@ -466,18 +482,18 @@ class SubprocessTerminal(TerminalInterface):
 
         need_prompt_nudge = False
         with self.output_lock:
-            if not self.output_buffer:
+            buffer = self.output_buffer
+            if not buffer:
                 need_prompt_nudge = True
             else:
-                data = "".join(self.output_buffer)
+                # Offsets of the remaining output stay valid for read_since()
+                data = buffer.text()
                 start_idx = data.rfind(CMD_OUTPUT_PS1_BEGIN)
                 end_idx = data.rfind(CMD_OUTPUT_PS1_END)
                 if start_idx != -1 and end_idx != -1 and end_idx >= start_idx:
-                    tail = data[start_idx:]
-                    self.output_buffer.clear()
-                    self.output_buffer.append(tail)
+                    buffer.discard_before(buffer.start + start_idx)
                 else:
-                    self.output_buffer.clear()
+                    buffer.discard_before(buffer.end)
                     need_prompt_nudge = True
 
         if need_prompt_nudge:
@@ -5,8 +5,11 @@ import time
 from enum import Enum
 
 from openhands.sdk.logger import get_logger
+from openhands.sdk.tool import get_tool_output_stream
 from openhands.sdk.utils import maybe_truncate
 from openhands.tools.terminal.constants import (
+    CMD_OUTPUT_METADATA_PS1_REGEX,
+    CMD_OUTPUT_PS1_BEGIN,
     CMD_OUTPUT_PS1_END,
     MAX_CMD_OUTPUT_SIZE,
     NO_CHANGE_TIMEOUT_SECONDS,
@@ -30,6 +33,28 @@ from openhands.tools.terminal.utils.command import (
 
 logger = get_logger(__name__)
 
+_PS1_BEGIN_MARKER = CMD_OUTPUT_PS1_BEGIN.strip()
+_PS1_END_MARKER = CMD_OUTPUT_PS1_END.strip()
+
+
+def _split_live_output(text: str) -> tuple[str, str]:
+    """Split streamed output into the part to publish and the part to hold.
+
+    PS1 metadata blocks are removed. An unterminated block, or what may be
+    the start of one, is held back until more output arrives.
+    """
+    text = CMD_OUTPUT_METADATA_PS1_REGEX.sub("", text)
+    start = text.find(_PS1_BEGIN_MARKER)
+    if start != -1:
+        if len(text) - start > MAX_CMD_OUTPUT_SIZE:
+            # Not a prompt after all; stop holding it back
+            return text, ""
+        return text[:start], text[start:]
+    for size in range(min(len(_PS1_BEGIN_MARKER) - 1, len(text)), 0, -1):
+        if _PS1_BEGIN_MARKER.startswith(text[-size:]):
+            return text[:-size], text[-size:]
+    return text, ""
+
 
 class TerminalCommandStatus(Enum):
     """Status of a terminal command execution."""
@@ -309,6 +334,18 @@ class TerminalSession(TerminalSessionBase):
         logger.debug(f"COMBINED OUTPUT: {combined_output}")
         return combined_output
 
+    def _capture_screen(self) -> tuple[str, list[re.Match]]:
+        """Read the whole screen and find its PS1 metadata blocks."""
+        _start_time = time.time()
+        logger.debug(f"GETTING TERMINAL CONTENT at {_start_time}")
+        content = self.terminal.read_screen()
+        logger.debug(
+            f"TERMINAL CONTENT GOT after {time.time() - _start_time:.2f} seconds"
+        )
+        logger.debug(f"BEGIN OF TERMINAL CONTENT: {content.split('\n')[:10]}")
+        logger.debug(f"END OF TERMINAL CONTENT: {content.split('\n')[-10:]}")
+        return content, CmdOutputMetadata.matches_ps1_metadata(content)
+
     def execute(self, action: TerminalAction) -> TerminalObservation:
         """Execute a command using the terminal backend."""
         if not self._initialized:
@@ -416,6 +453,14 @@ class TerminalSession(TerminalSessionBase):
             logger.debug(f"RETURNING OBSERVATION (previous-command): {obs}")
             return obs
 
+        # Backends with an output stream are polled through deltas only; the
+        # screen is captured and parsed once a prompt may have been printed
+        incremental = self.terminal.supports_read_since
+        output_offset = self.terminal.output_offset if incremental else 0
+        # Deltas are also published as live output of the running tool call
+        stream = get_tool_output_stream() if incremental else None
+        held_output = ""
+
         # Send actual command/inputs to the terminal
         if command != "":
             is_special_key = self._is_special_key(command)
@@ -437,27 +482,41 @@ class TerminalSession(TerminalSessionBase):
                 )
 
         # Loop until the command completes or times out
+        cur_terminal_output = ""
+        ps1_matches: list[re.Match] = []
+        # Whether the screen must be captured and parsed on this iteration
+        refresh_screen = True
+        # Once a prompt was streamed, keep checking the screen until it shows
+        prompt_streamed = False
+        carry = ""
         while True:
-            _start_time = time.time()
-            logger.debug(f"GETTING TERMINAL CONTENT at {_start_time}")
-            cur_terminal_output = self.terminal.read_screen()
-            logger.debug(
-                f"TERMINAL CONTENT GOT after {time.time() - _start_time:.2f} seconds"
-            )
-            logger.debug(
-                f"BEGIN OF TERMINAL CONTENT: {cur_terminal_output.split('\n')[:10]}"
-            )
-            logger.debug(
-                f"END OF TERMINAL CONTENT: {cur_terminal_output.split('\n')[-10:]}"
-            )
-            ps1_matches = CmdOutputMetadata.matches_ps1_metadata(cur_terminal_output)
+            if incremental:
+                delta, output_offset = self.terminal.read_since(output_offset)
+                if delta:
+                    last_change_time = time.time()
+                    # Carry a marker's length over so a split marker is found
+                    window = carry + delta
+                    prompt_streamed = prompt_streamed or _PS1_END_MARKER in window
+                    carry = window[-len(_PS1_END_MARKER) :]
+                refresh_screen = refresh_screen or prompt_streamed
+                if stream is not None:
+                    live_output, held_output = _split_live_output(held_output + delta)
+                    stream.write(live_output)
+            elif self.terminal.has_new_output():
+                # Skip capturing and re-parsing the screen when the backend can
+                # tell that nothing was printed since the last read
+                refresh_screen = True
+
+            if refresh_screen:
+                refresh_screen = False
+                cur_terminal_output, ps1_matches = self._capture_screen()
+                if cur_terminal_output != last_terminal_output:
+                    last_terminal_output = cur_terminal_output
+                    if not incremental:
+                        last_change_time = time.time()
+                    logger.debug(f"CONTENT UPDATED DETECTED at {time.time()}")
             current_ps1_count = len(ps1_matches)
 
-            if cur_terminal_output != last_terminal_output:
-                last_terminal_output = cur_terminal_output
-                last_change_time = time.time()
-                logger.debug(f"CONTENT UPDATED DETECTED at {last_change_time}")
-
             # 1) Execution completed:
             # Condition 1: A new prompt has appeared since the command started.
             # Condition 2: The prompt count hasn't increased (potentially because the
@@ -491,6 +550,8 @@ class TerminalSession(TerminalSessionBase):
                 and self.no_change_timeout_seconds is not None
                 and time_since_last_change >= self.no_change_timeout_seconds
             ):
+                if incremental:
+                    cur_terminal_output, ps1_matches = self._capture_screen()
                 obs = self._handle_nochange_timeout_command(
                     command,
                     terminal_content=cur_terminal_output,
@@ -508,6 +569,8 @@ class TerminalSession(TerminalSessionBase):
             if action.timeout is not None:
                 time_since_start = time.time() - start_time
                 if time_since_start >= action.timeout:
+                    if incremental:
+                        cur_terminal_output, ps1_matches = self._capture_screen()
                     obs = self._handle_hard_timeout_command(
                         command,
                         terminal_content=cur_terminal_output,
@@ -517,5 +580,5 @@ class TerminalSession(TerminalSessionBase):
                     logger.debug(f"RETURNING OBSERVATION (hard-timeout): {obs}")
                     return obs
 
-            # Sleep before next check
-            time.sleep(POLL_INTERVAL)
+            # Wait for the next prompt; wake up regularly for the timeout checks
+            self.terminal.wait_for_completion(POLL_INTERVAL)
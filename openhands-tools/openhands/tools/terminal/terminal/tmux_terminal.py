@@ -1,5 +1,12 @@
 """Tmux-based terminal backend implementation."""
 
+import codecs
+import os
+import select
+import shlex
+import shutil
+import tempfile
+import threading
 import time
 import uuid
 
@@ -10,6 +17,8 @@ from openhands.sdk.utils import sanitized_env
 from openhands.tools.terminal.constants import HISTORY_LIMIT
 from openhands.tools.terminal.metadata import CmdOutputMetadata
 from openhands.tools.terminal.terminal import TerminalInterface
+from openhands.tools.terminal.terminal.output_buffer import TerminalOutputBuffer
+from openhands.tools.terminal.terminal.output_notifier import OutputNotifier
 
 
 logger = get_logger(__name__)
@@ -20,6 +29,12 @@ class TmuxTerminal(TerminalInterface):
 
     This backend uses tmux to provide a persistent terminal session
     with full screen capture and history management capabilities.
+
+    Pane output is also streamed through ``pipe-pane`` into a FIFO, so
+    command completion is noticed as soon as the prompt is printed instead
+    of by re-capturing the pane, and new output can be read incrementally
+    with :meth:`read_since`. If the pipe cannot be set up, the session falls
+    back to polling the captured pane.
     """
 
     PS1: str
@@ -27,6 +42,11 @@ class TmuxTerminal(TerminalInterface):
     session: libtmux.Session
     window: libtmux.Window
     pane: libtmux.Pane
+    output_notifier: OutputNotifier | None
+    _pipe_buffer: TerminalOutputBuffer
+    _pipe_lock: threading.Lock
+    _pipe_dir: str | None
+    _pipe_thread: threading.Thread | None
 
     def __init__(
         self,
@@ -35,6 +55,11 @@ class TmuxTerminal(TerminalInterface):
     ):
         super().__init__(work_dir, username)
         self.PS1 = CmdOutputMetadata.to_ps1_prompt()
+        self.output_notifier = None
+        self._pipe_buffer = TerminalOutputBuffer()
+        self._pipe_lock = threading.Lock()
+        self._pipe_dir = None
+        self._pipe_thread = None
 
     def initialize(self) -> None:
         """Initialize the tmux terminal session."""
@@ -90,8 +115,58 @@ class TmuxTerminal(TerminalInterface):
 
         logger.debug(f"Tmux terminal initialized with work dir: {self.work_dir}")
         self._initialized: bool = True
+        self._start_output_pipe()
         self.clear_screen()
 
+    def _start_output_pipe(self) -> None:
+        """Stream pane output into a FIFO read by a notifier thread."""
+        if not hasattr(os, "mkfifo"):
+            return
+        try:
+            self._pipe_dir = tempfile.mkdtemp(prefix="openhands-tmux-")
+            fifo = os.path.join(self._pipe_dir, "output")
+            os.mkfifo(fifo, 0o600)
+            # Opening read-write keeps a writer attached, so reads never hit
+            # EOF between pipe-pane commands and select() blocks as expected
+            fd = os.open(fifo, os.O_RDWR | os.O_NONBLOCK)
+            notifier = OutputNotifier()
+            self._pipe_thread = threading.Thread(
+                target=self._read_output_pipe, args=(fd, notifier), daemon=True
+            )
+            self._pipe_thread.start()
+            self.pane.cmd("pipe-pane", "-o", f"cat >> {shlex.quote(fifo)}")
+            self.output_notifier = notifier
+        except Exception as e:
+            logger.debug(f"tmux output pipe unavailable, polling instead: {e}")
+            self._remove_output_pipe()
+
+    def _read_output_pipe(self, fd: int, notifier: OutputNotifier) -> None:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        try:
+            while not self._closed:
+                r, _, _ = select.select([fd], [], [], 0.1)
+                if not r:
+                    continue
+                try:
+                    chunk = os.read(fd, 4096)
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    break
+                text = decoder.decode(chunk)
+                with self._pipe_lock:
+                    self._pipe_buffer.append(text)
+                notifier.feed(text)
+        except Exception as e:
+            logger.debug(f"tmux output pipe reader stopped: {e}")
+        finally:
+            os.close(fd)
+
+    def _remove_output_pipe(self) -> None:
+        if self._pipe_dir is not None:
+            shutil.rmtree(self._pipe_dir, ignore_errors=True)
+            self._pipe_dir = None
+
     def close(self) -> None:
         """Clean up the tmux session."""
         if self._closed:
@@ -105,6 +180,9 @@ class TmuxTerminal(TerminalInterface):
             # Also handles ImportError during Python shutdown
             logger.debug(f"Error closing tmux session (may already be dead): {e}")
         self._closed: bool = True
+        if self._pipe_thread is not None:
+            self._pipe_thread.join(timeout=1)
+        self._remove_output_pipe()
 
     def send_keys(self, text: str, enter: bool = True) -> None:
         """Send text/keys to the tmux pane.
@@ -127,6 +205,8 @@ class TmuxTerminal(TerminalInterface):
         if not self._initialized or not isinstance(self.pane, libtmux.Pane):
             raise RuntimeError("Tmux terminal is not initialized")
 
+        if self.output_notifier is not None:
+            self.output_notifier.mark_read()
         content = "\n".join(
             map(
                 # avoid double newlines
@@ -136,6 +216,36 @@ class TmuxTerminal(TerminalInterface):
         )
         return content
 
+    @property
+    def supports_read_since(self) -> bool:
+        # Only trust the pipe once it has delivered output
+        with self._pipe_lock:
+            return self.output_notifier is not None and self._pipe_buffer.end > 0
+
+    @property
+    def output_offset(self) -> int:
+        with self._pipe_lock:
+            return self._pipe_buffer.end
+
+    def read_since(self, offset: int) -> tuple[str, int]:
+        """Read the raw pane output piped after ``offset``."""
+        if self.output_notifier is None:
+            return super().read_since(offset)
+        with self._pipe_lock:
+            self.output_notifier.mark_read()
+            return self._pipe_buffer.read_since(offset)
+
+    def wait_for_completion(self, timeout: float) -> bool:
+        """Wait until the piped pane output shows a new PS1 prompt."""
+        if self.output_notifier is None:
+            return super().wait_for_completion(timeout)
+        return self.output_notifier.wait_for_prompt(timeout)
+
+    def has_new_output(self) -> bool:
+        if self.output_notifier is None:
+            return True
+        return self.output_notifier.has_new_output()
+
     def clear_screen(self) -> None:
         """Clear the tmux pane screen and history.
 
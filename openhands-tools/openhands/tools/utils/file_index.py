@@ -0,0 +1,439 @@
+"""In-memory index of the files in a workspace.
+
+The glob and grep tools used to walk the whole tree (through ``rg`` or Python's
+``glob``) on every call. ``FileIndex`` keeps the list of searchable files in
+memory instead and brings it up to date with a cheap incremental refresh: each
+directory is stat'ed and only directories whose mtime changed since the last
+refresh are listed again.
+
+The index follows ripgrep's default filtering so results do not change when
+queries are served from it:
+- hidden files and directories (names starting with ``.``) are skipped
+- symbolic links are not followed
+- ``.gitignore`` and ``.ignore`` files are honored, with the subset of the
+  gitignore syntax agents run into in practice: ``*``, ``?``, ``**``,
+  character classes, ``!`` negation, trailing ``/`` for directories and
+  leading or inner ``/`` to anchor a pattern to its directory.
+"""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from openhands.sdk.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+IGNORE_FILES = (".gitignore", ".ignore")
+# Workspaces larger than this are left to ripgrep / the Python fallbacks
+MAX_INDEXED_FILES = 500_000
+# Number of workspace roots whose index is kept in memory
+MAX_CACHED_INDEXES = 8
+
+
+class FileIndexTooLargeError(RuntimeError):
+    """Raised when a directory holds more files than an index may track."""
+
+
+def _translate_glob(pattern: str) -> str:
+    """Translate a gitignore-style glob into a regular expression body."""
+    out: list[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i) and (i == 0 or pattern[i - 1] == "/"):
+                if i + 2 == n:
+                    # Trailing "**" matches everything below
+                    out.append(".*")
+                    i += 2
+                    continue
+                if pattern[i + 2] == "/":
+                    # "**/" matches zero or more directories
+                    out.append("(?:.*/)?")
+                    i += 3
+                    continue
+            while i < n and pattern[i] == "*":
+                i += 1
+            out.append("[^/]*")
+            continue
+        if c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1 : end].replace("\\", "\\\\")
+                if body[0] in "!^":
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end + 1
+                continue
+        elif c == "{":
+            end = pattern.find("}", i)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                alternatives = pattern[i + 1 : end].split(",")
+                out.append("(?:" + "|".join(map(_translate_glob, alternatives)) + ")")
+                i = end + 1
+                continue
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+            continue
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+def compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compile a glob the way ripgrep's ``-g`` flag interprets it.
+
+    A pattern without a ``/`` matches file names at any depth; a pattern with
+    one is matched against the whole path relative to the search directory.
+
+    Args:
+        pattern: The glob pattern, e.g. ``*.py`` or ``src/**/test_*.py``
+
+    Returns:
+        A compiled regex to ``fullmatch`` against relative ``/``-separated paths
+    """
+    pattern = pattern.rstrip("/").removeprefix("./")
+    if pattern.startswith("/"):
+        return re.compile(f"(?s:{_translate_glob(pattern.lstrip('/'))})")
+    prefix = "" if "/" in pattern else "(?:.*/)?"
+    return re.compile(f"(?s:{prefix}{_translate_glob(pattern)})")
+
+
+@dataclass(frozen=True, slots=True)
+class _IgnoreRule:
+    base: str
+    regex: re.Pattern[str]
+    negate: bool
+    dir_only: bool
+
+
+def _parse_ignore_lines(lines: Sequence[str], base: str) -> tuple[_IgnoreRule, ...]:
+    rules = []
+    for line in lines:
+        line = line.rstrip("\n")
+        if not line.endswith("\\ "):
+            line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate or line.startswith("\\!") or line.startswith("\\#"):
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        try:
+            regex = compile_glob(line)
+        except re.error:
+            logger.debug(f"Skipping unsupported ignore pattern {line!r}")
+            continue
+        rules.append(_IgnoreRule(base, regex, negate, dir_only))
+    return tuple(rules)
+
+
+def _is_ignored(rules: Sequence[_IgnoreRule], rel_path: str, is_dir: bool) -> bool:
+    # As in git, the last matching rule wins. Rules only ever come from
+    # ancestors of rel_path, so it always starts with their base.
+    ignored = False
+    for rule in rules:
+        if rule.dir_only and not is_dir:
+            continue
+        sub_path = rel_path[len(rule.base) + 1 :] if rule.base else rel_path
+        if rule.regex.fullmatch(sub_path):
+            ignored = not rule.negate
+    return ignored
+
+
+@dataclass(slots=True)
+class _IndexedDir:
+    mtime_ns: int
+    ignore_mtimes: tuple[tuple[str, int], ...]
+    ignore_lines: tuple[str, ...]
+    rules: tuple[_IgnoreRule, ...]
+    files: list[str]
+    dirs: list[str]
+
+
+def _ignore_mtimes(path: str, names: Sequence[str]) -> tuple[tuple[str, int], ...]:
+    mtimes = []
+    for name in names:
+        try:
+            mtimes.append((name, os.stat(os.path.join(path, name)).st_mtime_ns))
+        except OSError:
+            mtimes.append((name, -1))
+    return tuple(mtimes)
+
+
+class FileIndex:
+    """Searchable files below a root directory, refreshed incrementally.
+
+    Example:
+        >>> index = FileIndex(Path("/workspace"))
+        >>> index.refresh()
+        >>> list(index.iter_files(matcher=compile_glob("*.py")))
+    """
+
+    def __init__(self, root: Path, max_files: int = MAX_INDEXED_FILES):
+        """Initialize an empty index; call ``refresh`` to populate it.
+
+        Args:
+            root: Resolved directory to index
+            max_files: Refuse to index directories holding more files
+        """
+        self.root = root
+        self.max_files = max_files
+        self.dirs_scanned = 0
+        self._dirs: dict[str, _IndexedDir] = {}
+        self._lock = threading.Lock()
+
+    def refresh(self) -> None:
+        """Bring the index up to date with the file system.
+
+        Raises:
+            FileIndexTooLargeError: If the root holds more than ``max_files``
+        """
+        with self._lock:
+            self._dirs = self._walk(self._dirs)
+
+    def _walk(self, previous: dict[str, _IndexedDir]) -> dict[str, _IndexedDir]:
+        dirs: dict[str, _IndexedDir] = {}
+        total = 0
+        # (relative dir, inherited ignore rules, whether those rules changed)
+        stack: list[tuple[str, tuple[_IgnoreRule, ...], bool]] = [("", (), False)]
+        while stack:
+            rel, inherited, rules_changed = stack.pop()
+            path = os.path.join(self.root, rel)
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            cached = previous.get(rel)
+            if (
+                cached is None
+                or rules_changed
+                or cached.mtime_ns != mtime_ns
+                or cached.ignore_mtimes
+                != _ignore_mtimes(path, [n for n, _ in cached.ignore_mtimes])
+            ):
+                try:
+                    entry = self._scan(rel, path, mtime_ns, inherited)
+                except OSError:
+                    continue
+                rules_changed = (
+                    rules_changed
+                    or cached is None
+                    or cached.ignore_lines != entry.ignore_lines
+                )
+            else:
+                entry = cached
+            dirs[rel] = entry
+            total += len(entry.files)
+            if total > self.max_files:
+                raise FileIndexTooLargeError(
+                    f"{self.root} holds more than {self.max_files} files"
+                )
+            rules = inherited + entry.rules
+            for name in entry.dirs:
+                stack.append((f"{rel}/{name}" if rel else name, rules, rules_changed))
+        return dirs
+
+    def _scan(
+        self,
+        rel: str,
+        path: str,
+        mtime_ns: int,
+        inherited: tuple[_IgnoreRule, ...],
+    ) -> _IndexedDir:
+        self.dirs_scanned += 1
+        with os.scandir(path) as it:
+            entries = list(it)
+
+        ignore_names = [e.name for e in entries if e.name in IGNORE_FILES]
+        ignore_names.sort(key=IGNORE_FILES.index)
+        ignore_lines: list[str] = []
+        for name in ignore_names:
+            try:
+                with open(os.path.join(path, name), encoding="utf-8") as f:
+                    ignore_lines.extend(f.readlines())
+            except (OSError, UnicodeDecodeError):
+                continue
+        own_rules = _parse_ignore_lines(ignore_lines, rel)
+        rules = inherited + own_rules
+
+        files: list[str] = []
+        dirs: list[str] = []
+        for e in entries:
+            if e.name.startswith("."):
+                continue
+            try:
+                if e.is_symlink():
+                    continue
+                is_dir = e.is_dir(follow_symlinks=False)
+                if not is_dir and not e.is_file(follow_symlinks=False):
+                    continue
+            except OSError:
+                continue
+            child = f"{rel}/{e.name}" if rel else e.name
+            if rules and _is_ignored(rules, child, is_dir):
+                continue
+            (dirs if is_dir else files).append(e.name)
+
+        return _IndexedDir(
+            mtime_ns=mtime_ns,
+            ignore_mtimes=_ignore_mtimes(path, ignore_names),
+            ignore_lines=tuple(ignore_lines),
+            rules=own_rules,
+            files=files,
+            dirs=dirs,
+        )
+
+    def contains_dir(self, rel_dir: str) -> bool:
+        """Return True if ``rel_dir`` is an indexed (visible) directory."""
+        return rel_dir in self._dirs
+
+    def iter_files(
+        self, subdir: str = "", matcher: re.Pattern[str] | None = None
+    ) -> Iterator[str]:
+        """Yield absolute paths of indexed files.
+
+        Args:
+            subdir: Only yield files below this directory, relative to the root
+            matcher: Only yield files whose path relative to ``subdir`` matches
+        """
+        prefix = f"{subdir}/" if subdir else ""
+        root = str(self.root)
+        for rel, entry in list(self._dirs.items()):
+            if subdir and rel != subdir and not rel.startswith(prefix):
+                continue
+            sub_rel = rel[len(prefix) :] if rel != subdir else ""
+            for name in entry.files:
+                sub_path = f"{sub_rel}/{name}" if sub_rel else name
+                if matcher is None or matcher.fullmatch(sub_path):
+                    yield os.path.join(root, rel, name)
+
+
+_io_pool: ThreadPoolExecutor | None = None
+_io_pool_lock = threading.Lock()
+
+
+def get_io_pool() -> ThreadPoolExecutor:
+    """Return the thread pool shared by index queries for blocking file I/O."""
+    global _io_pool
+    with _io_pool_lock:
+        if _io_pool is None:
+            _io_pool = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) * 4),
+                thread_name_prefix="file-index-io",
+            )
+        return _io_pool
+
+
+def _mtime_or_none(path: str) -> float | None:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def sort_newest_first(paths: Sequence[str]) -> list[str]:
+    """Sort files by modification time, newest first, dropping vanished ones.
+
+    File mtimes are read at query time rather than kept in the index: editing
+    a file does not touch its directory's mtime, so cached values go stale.
+    The stats run on the I/O pool since ``os.stat`` releases the GIL.
+    """
+    chunk = 512
+    if len(paths) <= chunk:
+        mtimes = [_mtime_or_none(p) for p in paths]
+    else:
+        chunks = [paths[i : i + chunk] for i in range(0, len(paths), chunk)]
+        mtimes = [
+            m
+            for result in get_io_pool().map(
+                lambda c: [_mtime_or_none(p) for p in c], chunks
+            )
+            for m in result
+        ]
+    stamped = [(m, p) for p, m in zip(paths, mtimes) if m is not None]
+    stamped.sort(key=lambda item: item[0], reverse=True)
+    return [p for _, p in stamped]
+
+
+_indexes: "OrderedDict[Path, FileIndex]" = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def _covering_index(search_path: Path) -> tuple[FileIndex, str] | None:
+    index = _indexes.get(search_path)
+    if index is not None:
+        return index, ""
+    best: tuple[FileIndex, str] | None = None
+    for root, candidate in _indexes.items():
+        if not search_path.is_relative_to(root):
+            continue
+        rel = search_path.relative_to(root).as_posix()
+        # Hidden directories are searched when asked for explicitly, but a
+        # covering index leaves them out
+        if any(part.startswith(".") for part in rel.split("/")):
+            continue
+        if best is None or len(rel) < len(best[1]):
+            best = candidate, rel
+    return best
+
+
+def get_file_index(search_path: Path) -> tuple[FileIndex, str]:
+    """Return a refreshed index covering ``search_path``.
+
+    An index is reused for any directory below its root, so switching between
+    a workspace and its subdirectories does not build new indexes. A new index
+    rooted at ``search_path`` is built when no cached index covers it.
+
+    Args:
+        search_path: Resolved directory to search
+
+    Returns:
+        Tuple of (index, subdir) where subdir is ``search_path`` relative to
+        the index root, ``""`` for the root itself
+
+    Raises:
+        FileIndexTooLargeError: If the directory is too large to index
+    """
+    with _indexes_lock:
+        found = _covering_index(search_path)
+        if found is None:
+            found = FileIndex(search_path), ""
+            _indexes[search_path] = found[0]
+            while len(_indexes) > MAX_CACHED_INDEXES:
+                _indexes.popitem(last=False)
+        index, subdir = found
+        _indexes.move_to_end(index.root)
+
+    try:
+        index.refresh()
+    except FileIndexTooLargeError:
+        with _indexes_lock:
+            _indexes.pop(index.root, None)
+        raise
+    if subdir and not index.contains_dir(subdir):
+        # Ignored by the covering index; give the directory its own index,
+        # which the next call finds as an exact match
+        with _indexes_lock:
+            index = _indexes.setdefault(search_path, FileIndex(search_path))
+        index.refresh()
+        subdir = ""
+    return index, subdir
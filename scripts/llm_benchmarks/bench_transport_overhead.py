@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Per-call overhead of the LLM transport context.
+
+Every LLM request runs inside ``LLM._transport_ctx()``. This compares the
+previous wrapper (toggle the global ``litellm.modify_params`` and install five
+warning filters in a fresh ``warnings.catch_warnings()`` block) against the
+current one (a context-local ``modify_params`` override, with the warning
+filters installed once at import time).
+
+It also runs both wrappers from several threads with alternating
+``modify_params`` values and counts how often a call observes a value other
+than its own, which the global toggle allows.
+
+Usage:
+    python bench_transport_overhead.py [--calls 200000] [--threads 8]
+"""
+
+import argparse
+import gc
+import statistics
+import threading
+import time
+import warnings
+from contextlib import contextmanager
+
+import litellm
+from pydantic import SecretStr
+
+from openhands.sdk.llm import LLM
+
+
+@contextmanager
+def legacy_transport_ctx(flag: bool):
+    """The wrapper used before modify_params became context-local."""
+    old = getattr(litellm, "modify_params", None)
+    try:
+        litellm.modify_params = flag
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                "ignore", category=DeprecationWarning, module="httpx.*"
+            )
+            warnings.filterwarnings(
+                "ignore",
+                message=r".*content=.*upload.*",
+                category=DeprecationWarning,
+            )
+            warnings.filterwarnings(
+                "ignore",
+                message=r"There is no current event loop",
+                category=DeprecationWarning,
+            )
+            warnings.filterwarnings("ignore", category=UserWarning)
+            warnings.filterwarnings(
+                "ignore",
+                category=DeprecationWarning,
+                message="Accessing the 'model_fields' attribute.*",
+            )
+            yield
+    finally:
+        litellm.modify_params = old
+
+
+def make_llm(modify_params: bool) -> LLM:
+    return LLM(
+        model="gpt-4o",
+        api_key=SecretStr("bench"),
+        usage_id=f"bench-{modify_params}",
+        modify_params=modify_params,
+    )
+
+
+def time_per_call(enter, calls: int, repeats: int = 5) -> list[float]:
+    """Return microseconds per call for each repeat."""
+    results = []
+    for _ in range(repeats):
+        gc.disable()
+        t0 = time.perf_counter()
+        for _ in range(calls):
+            with enter():
+                pass
+        t1 = time.perf_counter()
+        gc.enable()
+        results.append((t1 - t0) / calls * 1e6)
+    return results
+
+
+def count_races(enter_for, calls: int, threads: int) -> int:
+    """Count calls that observe a modify_params value other than their own."""
+    mismatches = 0
+    lock = threading.Lock()
+    barrier = threading.Barrier(threads)
+
+    def worker(flag: bool) -> None:
+        nonlocal mismatches
+        local = 0
+        barrier.wait()
+        for _ in range(calls):
+            with enter_for(flag)():
+                # Yield the GIL so other threads can interleave
+                time.sleep(0)
+                if litellm.modify_params is not flag:
+                    local += 1
+        with lock:
+            mismatches += local
+
+    workers = [
+        threading.Thread(target=worker, args=(i % 2 == 0,)) for i in range(threads)
+    ]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return mismatches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    llms = {flag: make_llm(flag) for flag in (True, False)}
+
+    legacy = time_per_call(lambda: legacy_transport_ctx(True), args.calls)
+    current = time_per_call(llms[True]._transport_ctx, args.calls)
+
+    print(f"Per-call transport overhead ({args.calls} calls x 5 repeats)")
+    print(f"  {'wrapper':<24} {'median us':>10} {'min us':>10}")
+    rows = (("global + catch_warnings", legacy), ("context-local", current))
+    for name, samples in rows:
+        print(
+            f"  {name:<24} {statistics.median(samples):>10.3f} {min(samples):>10.3f}"
+        )
+    print(f"  speedup: {statistics.median(legacy) / statistics.median(current):.1f}x")
+
+    race_calls = max(args.calls // 100, 1000)
+    legacy_races = count_races(
+        lambda flag: lambda: legacy_transport_ctx(flag), race_calls, args.threads
+    )
+    current_races = count_races(
+        lambda flag: llms[flag]._transport_ctx, race_calls, args.threads
+    )
+    total = race_calls * args.threads
+    print(f"\nCalls observing another thread's modify_params ({total} calls)")
+    print(f"  global + catch_warnings: {legacy_races}")
+    print(f"  context-local:           {current_races}")
+
+
+if __name__ == "__main__":
+    main()
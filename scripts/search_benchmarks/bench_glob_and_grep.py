@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Latency of repeated glob and grep queries over a workspace.
+
+The glob and grep tools used to walk the whole tree on every call, through
+``rg --sortr=modified`` (single-threaded, fully buffered) or the ``grep -r`` /
+``glob.glob`` fallbacks. They now query an in-memory file index that is
+refreshed incrementally and search candidates newest first in parallel
+batches, stopping at the 100-result limit.
+
+This times each query through the file index and through the previous
+ripgrep and Python code paths, which the executors keep as fallbacks for
+directories too large to index. The first index query includes building the
+index; later ones only pay for the incremental refresh.
+
+Usage:
+    python bench_glob_and_grep.py [--path .] [--runs 5] [--pattern import]
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from openhands.tools.glob.impl import GlobExecutor
+from openhands.tools.grep import GrepAction
+from openhands.tools.grep.impl import GrepExecutor
+
+
+def timed(fn: Callable[[], object], runs: int) -> list[float]:
+    """Return milliseconds per call for runs calls of fn."""
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--path", default=".")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--glob", default="**/*.py")
+    parser.add_argument("--pattern", default="import")
+    args = parser.parse_args()
+
+    path = Path(args.path).resolve()
+    glob_executor = GlobExecutor(working_dir=str(path))
+    grep_executor = GrepExecutor(working_dir=str(path))
+    action = GrepAction(pattern=args.pattern)
+
+    t0 = time.perf_counter()
+    glob_executor._execute_with_index(args.glob, path)
+    first_index_ms = (time.perf_counter() - t0) * 1000
+
+    rows = [
+        (
+            "glob index",
+            timed(
+                lambda: glob_executor._execute_with_index(args.glob, path), args.runs
+            ),
+        ),
+        (
+            "glob python",
+            timed(lambda: glob_executor._execute_with_glob(args.glob, path), args.runs),
+        ),
+        (
+            "grep index",
+            timed(lambda: grep_executor._execute_with_index(action, path), args.runs),
+        ),
+        (
+            "grep grep -r",
+            timed(lambda: grep_executor._execute_with_grep(action, path), args.runs),
+        ),
+    ]
+    if glob_executor._ripgrep_available:
+        rows += [
+            (
+                "glob rg",
+                timed(
+                    lambda: glob_executor._execute_with_ripgrep(args.glob, path),
+                    args.runs,
+                ),
+            ),
+            (
+                "grep rg",
+                timed(
+                    lambda: grep_executor._execute_with_ripgrep(action, path),
+                    args.runs,
+                ),
+            ),
+        ]
+
+    print(f"Search latency in {path} ({args.runs} runs)")
+    print(f"  building the index: {first_index_ms:.1f} ms")
+    print(f"  {'query':<14} {'median ms':>10} {'min ms':>10} {'max ms':>10}")
+    for name, samples in rows:
+        print(
+            f"  {name:<14} {statistics.median(samples):>10.1f} "
+            f"{min(samples):>10.1f} {max(samples):>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Time from creating a terminal session to its first command's output.
+
+A ``TerminalExecutor`` used to start a shell (tmux or a PTY bash), configure
+its prompt and wait for it to settle before the first command could run.
+This compares that cold path (``create_terminal_session`` + ``initialize``)
+against checking out a pre-warmed session from the process-wide
+``TerminalSessionPool``, which only resets the working directory,
+environment and history of an already running shell.
+
+Each run times session creation through the output of ``echo ready`` in a
+fresh temporary directory. Pooled runs wait for the pool to refill between
+runs, so they measure the steady state of a pool that keeps up with demand.
+
+Usage:
+    python bench_time_to_first_command.py [--runs 10] [--terminal-type subprocess]
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+
+from openhands.tools.terminal.definition import TerminalAction
+from openhands.tools.terminal.terminal import (
+    checkout_terminal_session,
+    configure_terminal_session_pool,
+    create_terminal_session,
+    get_terminal_session_pool,
+)
+
+
+def first_command(open_session, terminal_type: str | None) -> float:
+    """Return milliseconds from opening a session to its first output."""
+    with tempfile.TemporaryDirectory() as work_dir:
+        t0 = time.perf_counter()
+        session = open_session(work_dir, terminal_type)
+        obs = session.execute(TerminalAction(command="echo ready"))
+        elapsed = (time.perf_counter() - t0) * 1000
+        session.close()
+    assert "ready" in obs.text, obs.text
+    return elapsed
+
+
+def open_cold(work_dir: str, terminal_type: str | None):
+    session = create_terminal_session(work_dir=work_dir, terminal_type=terminal_type)
+    session.initialize()
+    return session
+
+
+def open_pooled(work_dir: str, terminal_type: str | None):
+    return checkout_terminal_session(work_dir=work_dir, terminal_type=terminal_type)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--terminal-type", choices=["tmux", "subprocess"], default=None
+    )
+    parser.add_argument("--pool-size", type=int, default=1)
+    args = parser.parse_args()
+
+    pool = get_terminal_session_pool()
+    configure_terminal_session_pool(0)
+    cold = [first_command(open_cold, args.terminal_type) for _ in range(args.runs)]
+
+    configure_terminal_session_pool(args.pool_size)
+    pooled = []
+    for _ in range(args.runs):
+        if not pool.prewarm(terminal_type=args.terminal_type, timeout=30):
+            raise RuntimeError("Terminal session pool did not fill within 30s")
+        pooled.append(first_command(open_pooled, args.terminal_type))
+    hits, misses = pool.hits, pool.misses
+    pool.close()
+
+    print(f"Time to first command output ({args.runs} runs)")
+    print(f"  {'session':<10} {'median ms':>10} {'min ms':>10} {'max ms':>10}")
+    for name, samples in (("cold", cold), ("pooled", pooled)):
+        print(
+            f"  {name:<10} {statistics.median(samples):>10.1f} "
+            f"{min(samples):>10.1f} {max(samples):>10.1f}"
+        )
+    print(f"  speedup: {statistics.median(cold) / statistics.median(pooled):.1f}x")
+    print(f"  pool hits: {hits}, misses: {misses}")
+
+
+if __name__ == "__main__":
+    main()
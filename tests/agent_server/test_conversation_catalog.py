@@ -0,0 +1,126 @@
+"""Tests that ConversationCatalog pages like a stable sort over all conversations."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from openhands.agent_server.conversation_catalog import (
+    CATALOG_FILE,
+    ConversationCatalog,
+)
+from openhands.agent_server.models import ConversationSortOrder, StoredConversation
+from openhands.sdk import LLM, Agent
+from openhands.sdk.agent.acp_agent import ACPAgent
+from openhands.sdk.conversation.state import ConversationExecutionStatus
+from openhands.sdk.security.confirmation_policy import NeverConfirm
+from openhands.sdk.workspace import LocalWorkspace
+
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
+
+
+def make_stored(created: int, updated: int, acp: bool = False) -> StoredConversation:
+    return StoredConversation(
+        id=uuid4(),
+        agent=(
+            ACPAgent(acp_command=["echo", "test"])
+            if acp
+            else Agent(llm=LLM(model="gpt-4o", usage_id="test-llm"), tools=[])
+        ),
+        workspace=LocalWorkspace(working_dir="workspace/project"),
+        confirmation_policy=NeverConfirm(),
+        created_at=BASE_TIME + timedelta(minutes=created),
+        updated_at=BASE_TIME + timedelta(minutes=updated),
+    )
+
+
+@pytest.fixture
+def entries():
+    # Repeated timestamps check that ties keep insertion order
+    stored = [make_stored(i % 3, 10 - i) for i in range(7)]
+    stored.append(make_stored(1, 1, acp=True))
+    return [
+        (
+            s,
+            ConversationExecutionStatus.IDLE
+            if i % 2
+            else ConversationExecutionStatus.FINISHED,
+        )
+        for i, s in enumerate(stored)
+    ]
+
+
+def scan(entries, sort_order, execution_status, include_acp):
+    matches = [
+        stored
+        for stored, status in entries
+        if (include_acp or isinstance(stored.agent, Agent))
+        and (execution_status is None or status == execution_status)
+    ]
+    attr = "created_at" if "CREATED" in sort_order.value else "updated_at"
+    matches.sort(
+        key=lambda s: getattr(s, attr), reverse=sort_order.value.endswith("DESC")
+    )
+    return [s.id for s in matches]
+
+
+@pytest.mark.parametrize("sort_order", list(ConversationSortOrder))
+@pytest.mark.parametrize("include_acp", [True, False])
+@pytest.mark.parametrize(
+    "execution_status", [None, ConversationExecutionStatus.IDLE]
+)
+def test_pages_match_full_scan(
+    tmp_path, entries, sort_order, include_acp, execution_status
+):
+    catalog = ConversationCatalog(tmp_path / CATALOG_FILE)
+    catalog.upsert_many(entries)
+
+    ids = []
+    page_id = None
+    while True:
+        page, page_id = catalog.search(
+            page_id, 3, execution_status, sort_order, include_acp=include_acp
+        )
+        ids.extend(page)
+        if page_id is None:
+            break
+
+    expected = scan(entries, sort_order, execution_status, include_acp)
+    assert ids == expected
+    assert catalog.count(execution_status, include_acp=include_acp) == len(expected)
+
+
+def test_unknown_page_id_starts_from_first(tmp_path, entries):
+    catalog = ConversationCatalog(tmp_path / CATALOG_FILE)
+    catalog.upsert_many(entries)
+
+    page, _ = catalog.search(
+        uuid4().hex,
+        2,
+        None,
+        ConversationSortOrder.CREATED_AT,
+        include_acp=True,
+    )
+
+    assert page == scan(entries, ConversationSortOrder.CREATED_AT, None, True)[:2]
+
+
+def test_catalog_persists_and_keeps_status_on_metadata_update(tmp_path, entries):
+    catalog = ConversationCatalog(tmp_path / CATALOG_FILE)
+    catalog.upsert_many(entries)
+    stored, _ = entries[0]
+    stored.title = "Renamed"
+    catalog.upsert(stored)
+    catalog.set_status(entries[1][0].id, ConversationExecutionStatus.ERROR)
+    catalog.remove(entries[2][0].id)
+    catalog.close()
+
+    catalog = ConversationCatalog(tmp_path / CATALOG_FILE)
+    statuses = catalog.statuses()
+    assert len(statuses) == len(entries) - 1
+    assert statuses[stored.id] == ConversationExecutionStatus.FINISHED
+    assert statuses[entries[1][0].id] == ConversationExecutionStatus.ERROR
+
+    catalog.retain({stored.id})
+    assert catalog.count(None, include_acp=True) == 1
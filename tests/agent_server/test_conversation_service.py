@@ -1632,3 +1632,151 @@ class TestAutoTitle:
         # Title remains unset; save_meta was never called
         assert service.stored.title is None
         service.save_meta.assert_not_called()
+
+
+class TestConversationServiceLazyLoading:
+    """Test cases for lazy loading and eviction of conversations."""
+
+    async def _persist_conversations(
+        self, conversations_dir: Path, workspace: str, n: int
+    ) -> list:
+        async with ConversationService(conversations_dir=conversations_dir) as service:
+            ids = []
+            for _ in range(n):
+                info, _ = await service.start_conversation(
+                    StartConversationRequest(
+                        agent=Agent(
+                            llm=LLM(model="gpt-4o", usage_id="test-llm"), tools=[]
+                        ),
+                        workspace=LocalWorkspace(working_dir=workspace),
+                        confirmation_policy=NeverConfirm(),
+                    )
+                )
+                ids.append(info.id)
+        return ids
+
+    @pytest.mark.asyncio
+    async def test_lazy_startup_only_indexes_conversations(self, tmp_path):
+        conversations_dir = tmp_path / "conversations"
+        ids = await self._persist_conversations(
+            conversations_dir, str(tmp_path / "ws"), 3
+        )
+
+        service = ConversationService(
+            conversations_dir=conversations_dir, lazy_loading=True
+        )
+        async with service:
+            assert service._event_services == {}
+            assert set(service._unloaded) == set(ids)
+
+            # Listing and counting read persisted state without loading
+            assert await service.count_conversations() == 3
+            page = await service.search_conversations()
+            assert {item.id for item in page.items} == set(ids)
+            assert service._event_services == {}
+
+            # First access starts the conversation
+            event_service = await service.get_event_service(ids[0])
+            assert event_service is not None and event_service.is_open()
+            assert list(service._event_services) == [ids[0]]
+            assert ids[0] not in service._unloaded
+            assert await service.get_event_service(ids[0]) is event_service
+            assert await service.count_conversations() == 3
+
+            assert await service.get_event_service(uuid4()) is None
+
+    @pytest.mark.asyncio
+    async def test_lazy_loading_evicts_least_recently_used(self, tmp_path):
+        conversations_dir = tmp_path / "conversations"
+        ids = await self._persist_conversations(
+            conversations_dir, str(tmp_path / "ws"), 3
+        )
+
+        service = ConversationService(
+            conversations_dir=conversations_dir,
+            lazy_loading=True,
+            max_loaded_conversations=2,
+        )
+        async with service:
+            await service.get_event_service(ids[0])
+            await service.get_event_service(ids[1])
+            await service.get_event_service(ids[0])
+            await service.get_event_service(ids[2])
+
+            assert set(service._event_services) == {ids[0], ids[2]}
+            assert ids[1] in service._unloaded
+            # An evicted conversation is loaded again on demand
+            assert await service.get_conversation(ids[1]) is not None
+            assert set(service._event_services) == {ids[1], ids[2]}
+
+    @pytest.mark.asyncio
+    async def test_idle_eviction_skips_conversations_with_clients(self, tmp_path):
+        conversations_dir = tmp_path / "conversations"
+        ids = await self._persist_conversations(
+            conversations_dir, str(tmp_path / "ws"), 2
+        )
+
+        service = ConversationService(
+            conversations_dir=conversations_dir, lazy_loading=True, idle_ttl=60
+        )
+        async with service:
+            first = await service.get_event_service(ids[0])
+            second = await service.get_event_service(ids[1])
+            assert first is not None and second is not None
+            client = AsyncMock()
+            await second.subscribe_to_events(client)
+
+            service._last_access = dict.fromkeys(service._last_access, float("-inf"))
+            await service._evict_idle()
+
+            assert list(service._event_services) == [ids[1]]
+            assert ids[0] in service._unloaded
+
+    @pytest.mark.asyncio
+    async def test_catalog_serves_search_without_loading(self, tmp_path):
+        conversations_dir = tmp_path / "conversations"
+        ids = await self._persist_conversations(
+            conversations_dir, str(tmp_path / "ws"), 3
+        )
+
+        def make_service():
+            return ConversationService(
+                conversations_dir=conversations_dir,
+                lazy_loading=True,
+                enable_catalog=True,
+            )
+
+        async with make_service() as service:
+            assert await service.update_conversation(
+                ids[1], UpdateConversationRequest(title="Renamed")
+            )
+
+        # Statuses now come from the catalog rather than base_state.json, which is
+        # only read for the conversations on the requested page
+        with patch.object(
+            ConversationService,
+            "_read_state",
+            autospec=True,
+            side_effect=ConversationService._read_state,
+        ) as read_state:
+            async with make_service() as service:
+                assert await service.count_conversations() == 3
+                assert read_state.call_count == 0
+
+                page = await service.search_conversations(
+                    limit=1, sort_order=ConversationSortOrder.CREATED_AT
+                )
+                assert [item.id for item in page.items] == [ids[0]]
+                assert page.next_page_id == ids[1].hex
+                assert read_state.call_count == 1
+                assert service._event_services == {}
+
+        async with make_service() as service:
+            page = await service.search_conversations(
+                page_id=ids[1].hex,
+                limit=1,
+                sort_order=ConversationSortOrder.CREATED_AT,
+            )
+            assert [item.title for item in page.items] == ["Renamed"]
+            assert await service.delete_conversation(ids[1])
+            assert await service.count_conversations() == 2
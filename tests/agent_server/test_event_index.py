@@ -0,0 +1,210 @@
+"""Tests that EventIndex returns the same results as a full scan."""
+
+import random
+from collections.abc import Callable
+
+import pytest
+
+from openhands.agent_server.event_index import (
+    BODY_INDEX_FILE,
+    BodyIndex,
+    EventIndex,
+    event_body_text,
+)
+from openhands.sdk import Message
+from openhands.sdk.event import Event
+from openhands.sdk.event.conversation_state import ConversationStateUpdateEvent
+from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.llm.message import TextContent
+
+
+MESSAGE_KIND = f"{MessageEvent.__module__}.{MessageEvent.__name__}"
+STATE_KIND = (
+    f"{ConversationStateUpdateEvent.__module__}.{ConversationStateUpdateEvent.__name__}"
+)
+
+
+def make_events(count: int, seed: int = 0) -> list[Event]:
+    """Events with repeated and out-of-order timestamps, mixed kinds and sources."""
+    rng = random.Random(seed)
+    events: list[Event] = []
+    for i in range(count):
+        timestamp = f"2025-01-01T10:{rng.randrange(10):02d}:00.000000"
+        if i % 4 == 3:
+            events.append(
+                ConversationStateUpdateEvent(
+                    id=f"event{i}", key="execution_status", value="idle"
+                ).model_copy(update={"timestamp": timestamp})
+            )
+        else:
+            events.append(
+                MessageEvent(
+                    id=f"event{i}",
+                    source=rng.choice(["user", "agent"]),
+                    llm_message=Message(
+                        role="user", content=[TextContent(text=f"text {i % 3}")]
+                    ),
+                    timestamp=timestamp,
+                )
+            )
+    return events
+
+
+def scan(
+    events: list[Event],
+    *,
+    page_id: str | None = None,
+    limit: int = 100,
+    kind: str | None = None,
+    source: str | None = None,
+    descending: bool = False,
+    timestamp_gte: str | None = None,
+    timestamp_lt: str | None = None,
+    predicate: Callable[[Event], bool] | None = None,
+) -> tuple[list[Event], str | None]:
+    """Reference implementation: the full scan EventService used to perform."""
+    matches = [
+        e
+        for e in events
+        if (kind is None or f"{type(e).__module__}.{type(e).__name__}" == kind)
+        and (source is None or e.source == source)
+        and (predicate is None or predicate(e))
+        and (timestamp_gte is None or e.timestamp >= timestamp_gte)
+        and (timestamp_lt is None or e.timestamp < timestamp_lt)
+    ]
+    matches.sort(key=lambda e: e.timestamp, reverse=descending)
+    start = next((i for i, e in enumerate(matches) if e.id == page_id), 0)
+    page = matches[start : start + limit]
+    rest = matches[start + limit :]
+    return page, rest[0].id if rest else None
+
+
+def has_text_1(event: Event) -> bool:
+    return isinstance(event, MessageEvent) and "text 1" in str(event.llm_message)
+
+
+FILTERS: list[dict] = [
+    {},
+    {"kind": MESSAGE_KIND},
+    {"kind": STATE_KIND},
+    {"source": "agent"},
+    {"kind": MESSAGE_KIND, "source": "user"},
+    {"kind": STATE_KIND, "source": "user"},
+    {"kind": "missing.Kind"},
+    {"timestamp_gte": "2025-01-01T10:03:00"},
+    {"timestamp_lt": "2025-01-01T10:05:00"},
+    {
+        "source": "user",
+        "timestamp_gte": "2025-01-01T10:02:00",
+        "timestamp_lt": "2025-01-01T10:07:00",
+    },
+    {"predicate": has_text_1},
+    {"predicate": has_text_1, "source": "agent"},
+]
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+@pytest.mark.parametrize("descending", [False, True])
+def test_paging_matches_full_scan(filters: dict, descending: bool):
+    events = make_events(60)
+    index = EventIndex()
+
+    expected = scan(events, limit=len(events), descending=descending, **filters)
+    expected_ids = [e.id for e in expected[0]]
+    assert index.count(events, **filters) == len(expected_ids)
+
+    page_id = None
+    seen: list[str] = []
+    while True:
+        items, next_page_id = index.search(
+            events, page_id=page_id, limit=7, descending=descending, **filters
+        )
+        page, expected_next = scan(
+            events, page_id=page_id, limit=7, descending=descending, **filters
+        )
+        assert [e.id for e in items] == [e.id for e in page]
+        assert next_page_id == expected_next
+        seen.extend(e.id for e in items)
+        if next_page_id is None:
+            break
+        page_id = next_page_id
+    assert seen == expected_ids
+
+
+def test_page_id_outside_results_starts_from_beginning():
+    events = make_events(20)
+    index = EventIndex()
+    user_event = next(e for e in events if e.source == "user")
+
+    items, _ = index.search(events, page_id=user_event.id, source="agent", limit=3)
+    assert [e.id for e in items] == [
+        e.id for e in scan(events, page_id=user_event.id, source="agent", limit=3)[0]
+    ]
+    items, _ = index.search(events, page_id="unknown", limit=3)
+    assert [e.id for e in items] == [e.id for e in scan(events, limit=3)[0]]
+
+
+def test_zero_limit_returns_first_match_as_next_page():
+    events = make_events(10)
+    items, next_page_id = EventIndex().search(events, limit=0)
+    assert items == []
+    assert next_page_id == scan(events, limit=0)[1]
+
+
+def test_index_catches_up_with_appends_and_rebuilds_on_new_sequence():
+    events = make_events(30)
+    log = events[:10]
+    index = EventIndex()
+    assert index.count(log) == 10
+
+    log.extend(events[10:])
+    assert index.count(log) == 30
+    assert index.count(log, source="agent") == len(scan(log, source="agent")[0])
+
+    other = make_events(5, seed=1)
+    items, _ = index.search(other)
+    assert [e.id for e in items] == [e.id for e in scan(other)[0]]
+
+
+def test_body_index_candidates_narrow_search_exactly(tmp_path):
+    events = make_events(40)
+    body_index = BodyIndex(tmp_path / BODY_INDEX_FILE)
+    index = EventIndex()
+
+    def matches_body(event: Event) -> bool:
+        text = event_body_text(event)
+        return text is not None and "xt 1" in text
+
+    positions = body_index.candidates(events, "XT 1")
+    assert positions is not None
+    assert all(isinstance(events[p], MessageEvent) for p in positions)
+    items, _ = index.search(
+        events, predicate=matches_body, positions=positions, descending=True
+    )
+    expected, _ = scan(events, predicate=matches_body, descending=True)
+    assert [e.id for e in items] == [e.id for e in expected]
+    assert index.count(
+        events, source="user", predicate=matches_body, positions=positions
+    ) == len(scan(events, source="user", predicate=matches_body)[0])
+
+    # Queries too short to use trigrams are not narrowed
+    assert body_index.candidates(events, "xt") is None
+
+
+def test_body_index_persists_and_catches_up(tmp_path):
+    path = tmp_path / BODY_INDEX_FILE
+    events = make_events(20)
+    log = events[:10]
+    first = BodyIndex(path).candidates(log, "text 2")
+
+    log.extend(events[10:])
+    reloaded = BodyIndex(path)
+    assert reloaded.candidates(log, "text 2") == BodyIndex().candidates(log, "text 2")
+    assert first is not None and first < reloaded.candidates(log, "text 2")
+
+    # An index written for a different event log is discarded
+    other = make_events(5, seed=1)
+    other = [e.model_copy(update={"id": f"other{i}"}) for i, e in enumerate(other)]
+    assert BodyIndex(path).candidates(other, "text") == BodyIndex().candidates(
+        other, "text"
+    )
@@ -6,6 +6,7 @@ from openhands.sdk.conversation.stuck_detector import (
     MAX_EVENTS_TO_SCAN_FOR_STUCK_DETECTION,
     StuckDetector,
 )
+from openhands.sdk.conversation.types import StuckDetectionThresholds
 from openhands.sdk.event import (
     ActionEvent,
     AgentErrorEvent,
@@ -604,3 +605,77 @@ def test_reset_after_user_message():
 
     # Still not stuck with just one action after user message
     assert stuck_detector.is_stuck() is False
+
+
+def _ls_pair(i):
+    action = ActionEvent(
+        source="agent",
+        thought=[TextContent(text="I need to run ls command")],
+        action=TerminalAction(command="ls"),
+        tool_name="terminal",
+        tool_call_id=f"call_{i}",
+        tool_call=MessageToolCall(
+            id=f"call_{i}",
+            name="terminal",
+            arguments='{"command": "ls"}',
+            origin="completion",
+        ),
+        llm_response_id=f"response_{i}",
+    )
+    observation = ObservationEvent(
+        source="environment",
+        observation=TerminalObservation.from_text(
+            text="file1.txt\nfile2.txt", command="ls", exit_code=0
+        ),
+        action_id=action.id,
+        tool_name="terminal",
+        tool_call_id=f"call_{i}",
+    )
+    return [action, observation]
+
+
+def test_observed_events_are_not_read_back_from_state():
+    user = MessageEvent(
+        source="user",
+        llm_message=Message(role="user", content=[TextContent(text="start")]),
+    )
+    spy_events = _SpySequence([user])
+    stuck_detector = StuckDetector(_SpyState(spy_events))  # pyright: ignore[reportArgumentType]
+    assert stuck_detector.is_stuck() is False
+    assert len(spy_events.slice_requests) == 1
+
+    for i in range(4):
+        for event in _ls_pair(i):
+            spy_events._items.append(event)
+            stuck_detector.observe(event)
+
+    assert stuck_detector.is_stuck() is True
+    assert len(spy_events.slice_requests) == 1
+
+
+def test_events_appended_without_observe_are_synced():
+    spy_events = _SpySequence([])
+    stuck_detector = StuckDetector(_SpyState(spy_events))  # pyright: ignore[reportArgumentType]
+    assert stuck_detector.is_stuck() is False
+
+    for i in range(4):
+        spy_events._items.extend(_ls_pair(i))
+        # Observing out of order is ignored rather than corrupting the window
+        stuck_detector.observe(spy_events._items[-1])
+
+    assert stuck_detector.is_stuck() is True
+    assert spy_events.slice_requests[-1] == slice(-8, None)
+
+
+def test_window_grows_with_thresholds():
+    stuck_detector = StuckDetector(
+        _SpyState(_SpySequence([])),  # pyright: ignore[reportArgumentType]
+        thresholds=StuckDetectionThresholds(action_observation=15),
+    )
+    assert stuck_detector.window == 32
+
+    for i in range(15):
+        for event in _ls_pair(i):
+            stuck_detector.state.events._items.append(event)
+
+    assert stuck_detector.is_stuck() is True
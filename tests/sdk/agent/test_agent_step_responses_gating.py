@@ -50,6 +50,14 @@ class DummyLLM(LLM):
             raw_response=MagicMock(spec=ModelResponse, id="r1"),
         )
 
+    async def acompletion(self, *, messages, tools=None, **kwargs) -> LLMResponse:  # type: ignore[override]
+        self._calls.append("acompletion")
+        return self.completion(messages=messages, tools=tools)
+
+    async def aresponses(self, *, messages, tools=None, **kwargs) -> LLMResponse:  # type: ignore[override]
+        self._calls.append("aresponses")
+        return self.responses(messages=messages, tools=tools)
+
 
 @pytest.mark.parametrize(
     "force_responses, expected",
@@ -79,6 +87,32 @@ def test_agent_step_routes_to_responses_or_completion(force_responses, expected)
     assert any(isinstance(e, MessageEvent) for e in events)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "force_responses, expected",
+    [
+        (True, ["aresponses", "responses"]),
+        (False, ["acompletion", "completion"]),
+    ],
+)
+async def test_agent_astep_awaits_async_llm_path(force_responses, expected):
+    llm = DummyLLM(model="test-model", force_responses=force_responses)
+    agent = Agent(llm=llm, tools=[])
+    convo = Conversation(agent=agent)
+    convo._ensure_agent_ready()
+
+    events: list[MessageEvent] = []
+
+    def on_event(e):
+        if isinstance(e, MessageEvent):
+            events.append(e)
+
+    await agent.astep(convo, on_event=on_event)
+
+    assert llm._calls == expected
+    assert any(isinstance(e, MessageEvent) for e in events)
+
+
 class ModelGateLLM(LLM):
     _calls: list[str] = PrivateAttr(default_factory=list)
 
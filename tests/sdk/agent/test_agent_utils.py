@@ -9,11 +9,15 @@ from unittest.mock import Mock, patch
 import pytest
 from pydantic import Field
 
-from openhands.sdk.agent.utils import make_llm_completion, prepare_llm_messages
+from openhands.sdk.agent.utils import (
+    apply_observation_token_budget,
+    make_llm_completion,
+    prepare_llm_messages,
+)
 from openhands.sdk.context.condenser.base import CondenserBase
 from openhands.sdk.context.view import View
 from openhands.sdk.event import Condensation, MessageEvent
-from openhands.sdk.llm import LLM, LLMResponse, Message, TextContent
+from openhands.sdk.llm import LLM, ImageContent, LLMResponse, Message, TextContent
 from openhands.sdk.tool import Action, Observation, ToolDefinition
 
 
@@ -497,3 +501,56 @@ def test_make_llm_completion_api_selection():
         on_token=None,
     )
     mock_llm.completion.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# apply_observation_token_budget
+# ---------------------------------------------------------------------------
+
+
+class BudgetTestObservation(Observation):
+    pass
+
+
+@pytest.fixture
+def counting_llm():
+    """An LLM whose tokenizer counts one token per four characters."""
+    llm = Mock(spec=LLM)
+    llm.get_token_count.side_effect = lambda messages: (
+        len(messages[0].content[0].text) // 4
+    )
+    return llm
+
+
+def test_observation_within_budget_is_unchanged(counting_llm):
+    observation = BudgetTestObservation.from_text("x" * 400)
+
+    result = apply_observation_token_budget(observation, counting_llm, 100)
+
+    assert result is observation
+    counting_llm.get_token_count.assert_called_once()
+
+
+def test_observation_over_budget_keeps_head_and_tail(counting_llm, tmp_path):
+    image = ImageContent(image_urls=["data:image/png;base64,AAAA"])
+    text = "HEAD" + "x" * 40_000 + "TAIL"
+    observation = BudgetTestObservation(content=[TextContent(text=text), image])
+
+    result = apply_observation_token_budget(
+        observation, counting_llm, 1_000, save_dir=str(tmp_path), tool_prefix="bash"
+    )
+
+    preview = result.content[0]
+    assert isinstance(preview, TextContent)
+    assert len(preview.text) <= 4_000
+    assert preview.text.startswith("HEAD") and preview.text.endswith("TAIL")
+    assert result.content[1] == image
+    # The full output is stored out-of-line and referenced from the preview
+    (saved,) = tmp_path.iterdir()
+    assert saved.name.startswith("bash_output_")
+    assert saved.read_text() == text
+    assert str(saved) in preview.text
+    # The original observation is not modified
+    assert observation.content[0].text == text
+    counting_llm.get_token_count.assert_called_once()
+
@@ -0,0 +1,100 @@
+"""Tests for live tool output published while a tool is running."""
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Self
+
+from pydantic import Field
+
+from openhands.sdk.agent import Agent
+from openhands.sdk.conversation import Conversation
+from openhands.sdk.event import ObservationEvent, ToolOutputEvent
+from openhands.sdk.llm import Message, MessageToolCall, TextContent
+from openhands.sdk.testing import TestLLM
+from openhands.sdk.tool import (
+    Action,
+    Observation,
+    Tool,
+    ToolExecutor,
+    get_tool_output_stream,
+    register_tool,
+)
+from openhands.sdk.tool.tool import ToolDefinition
+
+
+if TYPE_CHECKING:
+    from openhands.sdk.conversation.base import BaseConversation
+    from openhands.sdk.conversation.state import ConversationState
+
+
+class ChattyAction(Action):
+    lines: list[str] = Field(default_factory=list)
+
+
+class ChattyObservation(Observation):
+    pass
+
+
+class ChattyExecutor(ToolExecutor[ChattyAction, ChattyObservation]):
+    def __call__(
+        self, action: ChattyAction, conversation: "BaseConversation | None" = None
+    ) -> ChattyObservation:
+        stream = get_tool_output_stream()
+        assert stream is not None
+        for line in action.lines:
+            stream.write(f"{line}\n")
+        return ChattyObservation.from_text(text="".join(action.lines))
+
+
+class ChattyTool(ToolDefinition[ChattyAction, ChattyObservation]):
+    name = "chatty_tool"
+
+    @classmethod
+    def create(cls, conv_state: "ConversationState | None" = None) -> Sequence[Self]:
+        return [
+            cls(
+                description="A tool that streams its output",
+                action_type=ChattyAction,
+                observation_type=ChattyObservation,
+                executor=ChattyExecutor(),
+            )
+        ]
+
+
+register_tool("ChattyTool", ChattyTool)
+
+
+def test_live_output_is_published_but_not_persisted():
+    llm = TestLLM.from_messages(
+        [
+            Message(
+                role="assistant",
+                content=[TextContent(text="")],
+                tool_calls=[
+                    MessageToolCall(
+                        id="call_0",
+                        name="chatty_tool",
+                        arguments='{"lines": ["one", "two", "three"]}',
+                        origin="completion",
+                    )
+                ],
+            ),
+            Message(role="assistant", content=[TextContent(text="Done")]),
+        ]
+    )
+    agent = Agent(llm=llm, tools=[Tool(name="ChattyTool")])
+    published = []
+    conversation = Conversation(agent=agent, callbacks=[published.append])
+    conversation.send_message(Message(role="user", content=[TextContent(text="Go")]))
+
+    emitted = []
+    agent.step(conversation, on_event=emitted.append)
+
+    chunks = [e for e in published if isinstance(e, ToolOutputEvent)]
+    # The first write is published at once, the rest when the tool returns
+    assert [c.output for c in chunks] == ["one\n", "two\nthree\n"]
+    assert [c.sequence for c in chunks] == [0, 1]
+    assert all(c.tool_call_id == "call_0" for c in chunks)
+
+    (observation,) = [e for e in emitted if isinstance(e, ObservationEvent)]
+    assert all(c.action_id == observation.action_id for c in chunks)
+    assert not any(isinstance(e, ToolOutputEvent) for e in conversation.state.events)
@@ -11,10 +11,15 @@ from openhands.sdk.context.condenser.base import (
 from openhands.sdk.context.condenser.llm_summarizing_condenser import (
     LLMSummarizingCondenser,
     Reason,
+    _fair_share,
 )
 from openhands.sdk.context.view import View
 from openhands.sdk.event.base import Event
-from openhands.sdk.event.condenser import Condensation, CondensationRequest
+from openhands.sdk.event.condenser import (
+    Condensation,
+    CondensationRequest,
+    CondensationSummaryEvent,
+)
 from openhands.sdk.event.llm_convertible import MessageEvent
 from openhands.sdk.llm import (
     LLM,
@@ -794,3 +799,139 @@ def test_minimum_progress_threshold_met(mock_llm: LLM) -> None:
 
     assert isinstance(result, Condensation)
     assert result.summary == "Summary of forgotten events"
+
+
+def _wait_for_speculation(condenser: LLMSummarizingCondenser) -> None:
+    assert condenser._speculation is not None
+    condenser._speculation.future.result(timeout=5)
+
+
+def test_speculative_condensation_is_used_at_limit(mock_llm: LLM) -> None:
+    """A summary started below the limit is committed once the limit is hit."""
+    condenser = LLMSummarizingCondenser(
+        llm=mock_llm, max_size=20, keep_first=2, speculative_threshold=0.5
+    )
+    events: list[Event] = [message_event(f"Event {i}") for i in range(12)]
+
+    # 12 events >= 0.5 * max_size: summarize in the background, keep the view
+    result = condenser.condense(View.from_events(events))
+    assert isinstance(result, View)
+    _wait_for_speculation(condenser)
+    assert cast(Any, mock_llm).completion.call_count == 1
+
+    events.extend(message_event(f"Event {i}") for i in range(12, 21))
+    result = condenser.condense(View.from_events(events))
+
+    # The precomputed range (events 2-4) is committed without another LLM call
+    assert isinstance(result, Condensation)
+    assert result.forgotten_event_ids == [e.id for e in events[2:5]]
+    assert result.summary_offset == 2
+    assert cast(Any, mock_llm).completion.call_count == 1
+    assert condenser._speculation is None
+
+
+def test_stale_speculation_falls_back_to_synchronous(mock_llm: LLM) -> None:
+    condenser = LLMSummarizingCondenser(
+        llm=mock_llm, max_size=20, keep_first=2, speculative_threshold=0.5
+    )
+    events: list[Event] = [message_event(f"Event {i}") for i in range(12)]
+    condenser.condense(View.from_events(events))
+    _wait_for_speculation(condenser)
+
+    # Replace the events the speculation meant to forget
+    events[3] = message_event("Replaced")
+    events.extend(message_event(f"Event {i}") for i in range(12, 21))
+    result = condenser.condense(View.from_events(events))
+
+    assert isinstance(result, Condensation)
+    assert result.forgotten_event_ids == [e.id for e in events[2:14]]
+    assert cast(Any, mock_llm).completion.call_count == 2
+
+
+def test_failed_speculation_falls_back_to_synchronous(mock_llm: LLM) -> None:
+    condenser = LLMSummarizingCondenser(
+        llm=mock_llm, max_size=20, keep_first=2, speculative_threshold=0.5
+    )
+    success = cast(Any, mock_llm).completion.return_value
+    cast(Any, mock_llm).completion.side_effect = [RuntimeError("boom"), success]
+    events: list[Event] = [message_event(f"Event {i}") for i in range(12)]
+    condenser.condense(View.from_events(events))
+    assert condenser._speculation is not None
+    with pytest.raises(RuntimeError):
+        condenser._speculation.future.result(timeout=5)
+
+    events.extend(message_event(f"Event {i}") for i in range(12, 21))
+    result = condenser.condense(View.from_events(events))
+
+    assert isinstance(result, Condensation)
+    assert result.summary == "Summary of forgotten events"
+    assert cast(Any, mock_llm).completion.call_count == 2
+
+
+def _sent_prompt(mock_llm: LLM) -> str:
+    messages = cast(Any, mock_llm).completion.call_args.kwargs["messages"]
+    return messages[0].content[0].text
+
+
+@pytest.fixture
+def counting_llm(mock_llm: LLM) -> LLM:
+    # Roughly four characters per token
+    cast(Any, mock_llm).get_token_count.side_effect = lambda messages: (
+        len(messages[0].content[0].text) // 4
+    )
+    return mock_llm
+
+
+def test_incremental_passes_previous_summary_verbatim(counting_llm: LLM) -> None:
+    condenser = LLMSummarizingCondenser(llm=counting_llm, incremental=True)
+    previous = CondensationSummaryEvent(summary="USER_CONTEXT: old summary")
+    events = [previous] + [message_event(f"Event {i}") for i in range(3)]
+
+    condensation = condenser._generate_condensation(
+        forgotten_events=events, summary_offset=2
+    )
+
+    prompt = _sent_prompt(counting_llm)
+    assert "<PREVIOUS_SUMMARY>\nUSER_CONTEXT: old summary\n</PREVIOUS_SUMMARY>" in (
+        prompt
+    )
+    assert prompt.count("<EVENT>") == 3
+    assert condensation.forgotten_event_ids == [e.id for e in events]
+    assert set(condensation.metadata) == {
+        "prompt_tokens",
+        "full_prompt_tokens",
+        "tokens_saved",
+    }
+
+
+def test_incremental_prompt_size_is_capped(counting_llm: LLM) -> None:
+    condenser = LLMSummarizingCondenser(
+        llm=counting_llm, incremental=True, incremental_prompt_max_chars=20_000
+    )
+    events = [message_event(f"{i}" * 10_000) for i in range(10)]
+
+    condensation = condenser._generate_condensation(
+        forgotten_events=events, summary_offset=2
+    )
+
+    template_chars = len(condenser._render_prompt([]))
+    assert len(_sent_prompt(counting_llm)) < template_chars + 20_000 + 10 * 100
+    assert condensation.metadata["tokens_saved"] > 15_000
+
+
+def test_non_incremental_records_no_metadata(mock_llm: LLM) -> None:
+    condenser = LLMSummarizingCondenser(llm=mock_llm)
+    previous = CondensationSummaryEvent(summary="old summary")
+
+    condensation = condenser._generate_condensation(
+        forgotten_events=[previous, message_event("Event")], summary_offset=2
+    )
+
+    assert "<PREVIOUS_SUMMARY>" not in _sent_prompt(mock_llm)
+    assert condensation.metadata == {}
+
+
+def test_fair_share_gives_unused_budget_to_long_events() -> None:
+    assert _fair_share([10, 20, 1000], budget=530) == 500
+    assert _fair_share([10, 20], budget=530) == 20
+    assert _fair_share([1000, 1000], budget=100) == 200
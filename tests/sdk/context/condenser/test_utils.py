@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from openhands.sdk.context.condenser.utils import (
+    TokenAccounting,
     get_shortest_prefix_above_token_count,
     get_suffix_length_for_token_reduction,
     get_total_token_count,
@@ -78,6 +79,23 @@ class TestGetTotalTokenCount:
         assert isinstance(call_args, list)
         assert all(isinstance(msg, Message) for msg in call_args)
 
+    def test_events_are_tokenized_once(self, mock_llm: LLM):
+        """Test that repeated and growing views only tokenize new events."""
+        events = [message_event("A" * 40), message_event("B" * 40)]
+        assert get_total_token_count(events, mock_llm) == 20
+        calls = mock_llm.get_token_count.call_count  # type: ignore
+
+        assert get_total_token_count(events, mock_llm) == 20
+        assert mock_llm.get_token_count.call_count == calls  # type: ignore
+
+        events.append(message_event("C" * 40))
+        assert get_total_token_count(events, mock_llm) == 30
+        assert mock_llm.get_token_count.call_count == calls + 1  # type: ignore
+
+        # A view that drops a prefix (as after condensation) reuses the counts
+        assert get_total_token_count(events[1:], mock_llm) == 20
+        assert mock_llm.get_token_count.call_count == calls + 1  # type: ignore
+
 
 class TestGetShortestPrefixAboveTokenCount:
     """Tests for get_shortest_prefix_above_token_count function."""
@@ -234,3 +252,36 @@ class TestGetSuffixLengthForTokenReduction:
 
         # Suffix + prefix should equal total length
         assert suffix_length + prefix_length == len(events)
+
+
+class TestTokenAccounting:
+    """Tests for the per-request overhead handling of TokenAccounting."""
+
+    @pytest.fixture
+    def framed_llm(self) -> LLM:
+        """A mock LLM counting 3 tokens per message plus 3 per request."""
+        llm = MagicMock(spec=LLM)
+        llm.model = "framed-model"
+        llm.get_token_count.side_effect = lambda messages: 3 + sum(
+            3 + len(content.text) // 4
+            for msg in messages
+            for content in msg.content
+        )
+        return llm
+
+    def test_total_matches_counting_all_messages(self, framed_llm: LLM):
+        accounting = TokenAccounting()
+        events = [message_event("A" * 40), message_event("B" * 20)]
+
+        assert accounting.overhead(framed_llm) == 3
+        assert accounting.total(events, framed_llm) == 3 + 13 + 8
+
+    def test_shortest_prefix_accounts_for_overhead(self, framed_llm: LLM):
+        accounting = TokenAccounting()
+        events = [message_event("A" * 40) for _ in range(3)]
+
+        # Prefix totals are 16, 29 and 42 tokens
+        assert accounting.shortest_prefix_above(events, framed_llm, 15) == 1
+        assert accounting.shortest_prefix_above(events, framed_llm, 16) == 2
+        assert accounting.shortest_prefix_above(events, framed_llm, 29) == 3
+        assert accounting.shortest_prefix_above(events, framed_llm, 100) == 3
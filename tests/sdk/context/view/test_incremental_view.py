@@ -0,0 +1,102 @@
+"""Tests that IncrementalView always matches View.from_events."""
+
+from openhands.sdk.context.view import IncrementalView, View
+from openhands.sdk.event.base import Event
+from openhands.sdk.event.condenser import Condensation, CondensationRequest
+from openhands.sdk.event.conversation_state import ConversationStateUpdateEvent
+from tests.sdk.context.view.conftest import (
+    create_action_event,
+    create_observation_event,
+    message_event,
+)
+
+
+def assert_views_equal(actual: View, expected: View) -> None:
+    assert [e.id for e in actual.events] == [e.id for e in expected.events]
+    assert [c.id for c in actual.condensations] == [
+        c.id for c in expected.condensations
+    ]
+    assert (
+        actual.unhandled_condensation_request
+        == expected.unhandled_condensation_request
+    )
+
+
+def build_events() -> list[Event]:
+    """A history exercising batches, tool loops, pending actions and condensation."""
+    m0, m1 = message_event("first"), message_event("second")
+    # Batch of two actions, only one observed so far at first
+    a1 = create_action_event("resp-1", "call-1")
+    a2 = create_action_event("resp-1", "call-2")
+    o1 = create_observation_event("call-1")
+    o2 = create_observation_event("call-2")
+    # Tool loop started by an action with thinking blocks
+    a3 = create_action_event("resp-2", "call-3", thinking="hmm")
+    o3 = create_observation_event("call-3")
+    a4 = create_action_event("resp-3", "call-4")
+    o4 = create_observation_event("call-4")
+    state_update = ConversationStateUpdateEvent(key="execution_status", value="idle")
+    m2 = message_event("third")
+    # Condensation that forgets part of the tool loop and half of the batch
+    condensation = Condensation(
+        forgotten_event_ids=[m0.id, a1.id, o1.id, a3.id],
+        summary="summary",
+        summary_offset=0,
+        llm_response_id="condensation-1",
+    )
+    m3 = message_event("fourth")
+    return [
+        m0,
+        a1,
+        a2,
+        o1,
+        o2,
+        m1,
+        a3,
+        o3,
+        a4,
+        o4,
+        state_update,
+        CondensationRequest(),
+        m2,
+        condensation,
+        m3,
+        CondensationRequest(),
+    ]
+
+
+def test_incremental_view_matches_from_events_at_every_prefix() -> None:
+    events = build_events()
+    log: list[Event] = []
+    incremental = IncrementalView()
+
+    for event in events:
+        log.append(event)
+        assert_views_equal(incremental.get(log), View.from_events(log))
+
+
+def test_incremental_view_catches_up_in_one_call() -> None:
+    events = build_events()
+    incremental = IncrementalView()
+    assert_views_equal(incremental.get(events), View.from_events(events))
+
+
+def test_incremental_view_reuses_view_until_new_events() -> None:
+    log: list[Event] = [message_event("a"), message_event("b")]
+    incremental = IncrementalView()
+
+    first = incremental.get(log)
+    assert incremental.get(log) is first
+
+    log.append(message_event("c"))
+    second = incremental.get(log)
+    assert second is not first
+    assert len(second) == 3
+
+
+def test_incremental_view_rebuilds_for_new_sequence() -> None:
+    incremental = IncrementalView()
+    incremental.get([message_event("a"), message_event("b")])
+
+    other: list[Event] = [message_event("x")]
+    assert_views_equal(incremental.get(other), View.from_events(other))
@@ -3,6 +3,7 @@ import uuid
 from unittest.mock import patch
 
 import pytest
+from litellm.types.utils import ModelResponse
 from pydantic import SecretStr
 
 from openhands.sdk import LLM, ConversationStats, LLMRegistry, RegistryEvent
@@ -131,6 +132,23 @@ def test_register_llm_with_new_usage(conversation_stats):
         assert conversation_stats.usage_to_metrics[usage_id] is llm.metrics
 
 
+def test_get_prompt_cache_stats_per_usage(connected_registry_and_stats):
+    """Prompt cache stats come from the telemetry of registered LLMs."""
+    registry, stats = connected_registry_and_stats
+    llm = LLM(usage_id="agent", model="gpt-4o", api_key=SecretStr("test_key"))
+    registry.add(llm)
+
+    llm.telemetry.on_prompt([{"role": "system", "content": "sys"}])
+    llm.telemetry.on_request(None)
+    with patch.object(llm.telemetry, "_compute_cost", return_value=None):
+        llm.telemetry.on_response(ModelResponse(id="r1", choices=[]))
+
+    report = stats.get_prompt_cache_stats()
+    assert list(report) == ["agent"]
+    assert report["agent"].calls == 1
+    assert report["agent"].recent_calls[0].response_id == "r1"
+
+
 def test_register_llm_with_restored_metrics(conversation_stats):
     """Test registering an LLM usage with restored metrics."""
     # Create restored metrics
@@ -361,3 +379,98 @@ def test_register_llm_with_multiple_restored_usage_ids(conversation_stats):
         # After both usages are marked restored
         assert usage_id_2 in conversation_stats._restored_usage_ids
         assert len(conversation_stats._restored_usage_ids) == 2
+
+
+def _add_call(metrics: Metrics, cost: float, response_id: str) -> None:
+    metrics.add_cost(cost)
+    metrics.add_response_latency(0.5, response_id)
+    metrics.add_token_usage(
+        prompt_tokens=100,
+        completion_tokens=10,
+        cache_read_tokens=0,
+        cache_write_tokens=0,
+        context_window=8000,
+        response_id=response_id,
+    )
+
+
+def test_metrics_journal_keeps_records_out_of_serialized_state(mock_file_store):
+    stats = ConversationStats()
+    stats.attach_journal(mock_file_store)
+    metrics = Metrics(model_name="gpt-4")
+    stats.usage_to_metrics["agent"] = metrics
+    _add_call(metrics, 0.01, "resp1")
+
+    stats.write_journal()
+    data = stats.model_dump(mode="json", context={"metrics_journal": True})
+
+    saved = data["usage_to_metrics"]["agent"]
+    assert saved["accumulated_cost"] == 0.01
+    assert "costs" not in saved and "token_usages" not in saved
+    # Default serialization is unchanged
+    assert len(stats.model_dump()["usage_to_metrics"]["agent"]["costs"]) == 1
+
+    # Only records added since the previous write are appended
+    _add_call(metrics, 0.02, "resp2")
+    stats.write_journal()
+    stats.write_journal()
+    assert len(mock_file_store.read("metrics.jsonl").splitlines()) == 6
+
+
+def test_metrics_journal_is_loaded_lazily_on_resume(mock_file_store):
+    stats = ConversationStats()
+    stats.attach_journal(mock_file_store)
+    metrics = Metrics(model_name="gpt-4")
+    stats.usage_to_metrics["agent"] = metrics
+    _add_call(metrics, 0.01, "resp1")
+    _add_call(metrics, 0.02, "resp2")
+    baseline = metrics.deep_copy()
+    stats.write_journal()
+    saved = stats.model_dump_json(context={"metrics_journal": True})
+
+    resumed = ConversationStats.model_validate_json(saved)
+    resumed.attach_journal(mock_file_store)
+    resumed_metrics = resumed.usage_to_metrics["agent"]
+    assert resumed_metrics.costs == []
+    assert resumed_metrics.accumulated_cost == pytest.approx(0.03)
+
+    # A call made before the records are loaded is journaled after them
+    _add_call(resumed_metrics, 0.04, "resp3")
+    resumed.write_journal()
+    assert [u.response_id for u in resumed_metrics.token_usages] == [
+        "resp1",
+        "resp2",
+        "resp3",
+    ]
+
+    diff = resumed_metrics.diff(baseline)
+    assert diff.accumulated_cost == pytest.approx(0.04)
+    assert [u.response_id for u in diff.token_usages] == ["resp3"]
+
+    again = ConversationStats.model_validate_json(
+        resumed.model_dump_json(context={"metrics_journal": True})
+    )
+    again.attach_journal(mock_file_store)
+    combined = again.get_combined_metrics()
+    assert [c.cost for c in combined.costs] == [0.01, 0.02, 0.04]
+
+
+def test_metrics_journal_rewrites_replaced_metrics(mock_file_store):
+    stats = ConversationStats()
+    stats.attach_journal(mock_file_store)
+    first = Metrics(model_name="gpt-4")
+    _add_call(first, 0.01, "resp1")
+    stats.usage_to_metrics["delegate"] = first
+    stats.write_journal()
+
+    replacement = Metrics(model_name="gpt-4")
+    _add_call(replacement, 0.05, "resp2")
+    stats.usage_to_metrics["delegate"] = replacement
+    stats.write_journal()
+
+    resumed = ConversationStats.model_validate_json(
+        stats.model_dump_json(context={"metrics_journal": True})
+    )
+    resumed.attach_journal(mock_file_store)
+    metrics = resumed.get_metrics_for_usage("delegate")
+    assert [c.cost for c in metrics.costs] == [0.05]
@@ -441,3 +441,36 @@ def test_get_single_item_stale_index_out_of_range():
     # Index 3 doesn't exist on disk; should raise IndexError after rebuild
     with pytest.raises(IndexError, match="Event index out of range"):
         log[3]
+
+
+def test_event_log_caches_parsed_events():
+    """Repeated reads return the cached Event object and update the counters."""
+    fs = InMemoryFileStore()
+    log = EventLog(fs)
+    for i in range(3):
+        log.append(create_test_event(f"event-{i}", f"Content {i}"))
+
+    first = log[1]
+    assert log[1] is first
+    assert log[-2] is first
+    assert list(log)[1] is first
+
+    info = log.cache_info()
+    assert info["hits"] == 3
+    assert info["misses"] == 3  # log[1], then events 0 and 2 during iteration
+    assert info["entries"] == 3
+    assert info["memory"] > 0
+
+
+def test_event_log_cache_evicts_by_memory():
+    """The parsed-event cache respects its memory bound."""
+    fs = InMemoryFileStore()
+    log = EventLog(fs, cache_memory_size=600)
+    for i in range(5):
+        log.append(create_test_event(f"event-{i}", "x" * 200))
+
+    list(log)
+
+    info = log.cache_info()
+    assert 0 < info["entries"] < 5
+    assert info["memory"] <= 600
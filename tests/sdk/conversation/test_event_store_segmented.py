@@ -0,0 +1,127 @@
+"""Tests for the segmented (JSONL + offset index) EventLog layout."""
+
+import tempfile
+
+import pytest
+
+from openhands.sdk.conversation.event_store import EventLog, migrate_to_segmented
+from openhands.sdk.conversation.persistence_const import EVENT_SEGMENT_INDEX
+from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.io.local import LocalFileStore
+from openhands.sdk.io.memory import InMemoryFileStore
+from openhands.sdk.llm import Message, TextContent
+
+
+def create_test_event(event_id: str, content: str = "Test content") -> MessageEvent:
+    return MessageEvent(
+        id=event_id,
+        llm_message=Message(role="user", content=[TextContent(text=content)]),
+        source="user",
+    )
+
+
+def test_segmented_append_read_and_reopen():
+    fs = InMemoryFileStore()
+    log = EventLog(fs, layout="segmented")
+    for i in range(5):
+        log.append(create_test_event(f"event-{i}", f"content ünïcode {i}"))
+
+    assert log.layout == "segmented"
+    assert len(log) == 5
+    assert log[3].id == "event-3"
+    assert [e.id for e in log[-2:]] == ["event-3", "event-4"]
+    assert log.get_index("event-2") == 2
+
+    names = sorted(p.rsplit("/", 1)[-1] for p in fs.list("events"))
+    assert names == ["segment-00000.jsonl", EVENT_SEGMENT_INDEX]
+
+    # A new instance detects the layout without being told
+    reopened = EventLog(fs)
+    assert reopened.layout == "segmented"
+    assert [e.id for e in reopened] == [f"event-{i}" for i in range(5)]
+
+
+def test_segmented_rolls_segments_at_size_limit():
+    fs = InMemoryFileStore()
+    log = EventLog(fs, layout="segmented", segment_max_bytes=400)
+    for i in range(6):
+        log.append(create_test_event(f"event-{i}", "x" * 100))
+
+    segments = [p for p in fs.list("events") if p.endswith(".jsonl")]
+    assert len(segments) > 1
+    assert [e.id for e in EventLog(fs)] == [f"event-{i}" for i in range(6)]
+
+
+def test_segmented_duplicate_id_rejected():
+    log = EventLog(InMemoryFileStore(), layout="segmented")
+    log.append(create_test_event("dup"))
+    with pytest.raises(ValueError, match="already exists at index 0"):
+        log.append(create_test_event("dup"))
+    assert len(log) == 1
+
+
+def test_segmented_two_instances_stay_in_sync():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        fs = LocalFileStore(temp_dir)
+        log1 = EventLog(fs, layout="segmented")
+        log1.append(create_test_event("event-1", "First"))
+        log2 = EventLog(fs)
+        log2.append(create_test_event("event-2", "Second"))
+        log1.append(create_test_event("event-3", "Third"))
+
+        assert len(log1) == 3
+        assert [e.id for e in EventLog(fs)] == ["event-1", "event-2", "event-3"]
+
+
+def test_segmented_recovers_unindexed_tail():
+    fs = InMemoryFileStore()
+    log = EventLog(fs, layout="segmented")
+    log.append(create_test_event("event-0"))
+
+    # Simulate a crash after the segment append but before the index append,
+    # followed by a torn write.
+    orphan = create_test_event("event-1").model_dump_json(exclude_none=True)
+    fs.append("events/segment-00000.jsonl", orphan + "\n" + '{"partial')
+
+    reopened = EventLog(fs)
+    assert [e.id for e in reopened] == ["event-0", "event-1"]
+
+    reopened.append(create_test_event("event-2"))
+    assert "events/segment-00001.jsonl" in fs.files
+    assert [e.id for e in EventLog(fs)] == ["event-0", "event-1", "event-2"]
+
+
+def uuid_id(i: int) -> str:
+    # The per-file layout only recognizes hex-like IDs in file names
+    return f"00000000-0000-0000-0000-{i:012d}"
+
+
+def test_migrate_to_segmented():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        fs = LocalFileStore(temp_dir)
+        log = EventLog(fs)
+        for i in range(4):
+            log.append(create_test_event(uuid_id(i), f"content {i}"))
+        assert log.layout == "files"
+
+        assert migrate_to_segmented(fs, segment_max_bytes=500) == 4
+
+        names = [p.rsplit("/", 1)[-1] for p in fs.list("events")]
+        assert not any(n.startswith("event-") for n in names)
+        migrated = EventLog(fs)
+        assert migrated.layout == "segmented"
+        assert [e.id for e in migrated] == [uuid_id(i) for i in range(4)]
+
+        migrated.append(create_test_event(uuid_id(4)))
+        assert len(EventLog(fs)) == 5
+        # Running again is a no-op
+        assert migrate_to_segmented(fs) == 0
+
+
+def test_segmented_request_keeps_existing_per_file_layout():
+    fs = InMemoryFileStore()
+    EventLog(fs).append(create_test_event(uuid_id(0)))
+
+    log = EventLog(fs, layout="segmented")
+    assert log.layout == "files"
+    assert [e.id for e in log] == [uuid_id(0)]
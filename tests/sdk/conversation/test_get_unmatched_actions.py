@@ -288,3 +288,40 @@ def test_non_executable_action_is_not_considered_unmatched():
 
     # Non-executable actions should not appear in unmatched
     assert len(unmatched) == 0
+
+
+def test_event_log_index_matches_full_scan():
+    """EventLog's pending-action index agrees with the scan as events arrive,
+    and is rebuilt in a single pass when the log is reopened."""
+    from openhands.sdk.conversation.event_store import EventLog
+    from openhands.sdk.io.memory import InMemoryFileStore
+
+    action1 = _create_action_event(call_id="call_1", command="cmd1")
+    action2 = _create_action_event(call_id="call_2", command="cmd2")
+    action3 = _create_action_event(call_id="call_3", command="cmd3")
+    sequence: list[Event] = [
+        action1,
+        action2,
+        action3,
+        ObservationEvent(
+            source="environment",
+            observation=MockTestObservation(result="result1"),
+            action_id=action1.id,
+            tool_name="test_tool",
+            tool_call_id="call_1",
+        ),
+        AgentErrorEvent(
+            tool_name="test_tool", tool_call_id="call_3", error="Crash recovery"
+        ),
+    ]
+
+    fs = InMemoryFileStore()
+    log = EventLog(fs)
+    for i, event in enumerate(sequence):
+        log.append(event)
+        expected = ConversationState.get_unmatched_actions(list(sequence[: i + 1]))
+        actual = ConversationState.get_unmatched_actions(log)
+        assert [a.id for a in actual] == [a.id for a in expected]
+
+    reopened = EventLog(fs)
+    assert [a.id for a in reopened.unmatched_actions()] == [action2.id]
@@ -0,0 +1,88 @@
+"""Tests for coalesced (write-behind) base state persistence."""
+
+import json
+import uuid
+
+import pytest
+from pydantic import SecretStr
+
+from openhands.sdk import LLM, Agent
+from openhands.sdk.conversation.persistence_const import BASE_STATE
+from openhands.sdk.conversation.state import (
+    ConversationExecutionStatus,
+    ConversationState,
+)
+from openhands.sdk.io import InMemoryFileStore
+from openhands.sdk.workspace import LocalWorkspace
+
+
+def make_state(save_interval: float | None) -> ConversationState:
+    llm = LLM(model="gpt-4o-mini", api_key=SecretStr("test-key"), usage_id="test-llm")
+    state = ConversationState.create(
+        id=uuid.uuid4(),
+        agent=Agent(llm=llm),
+        workspace=LocalWorkspace(working_dir="/tmp/test"),
+        base_state_save_interval=save_interval,
+    )
+    assert isinstance(state._fs, InMemoryFileStore)
+    return state
+
+
+def saved_state(state: ConversationState) -> dict:
+    return json.loads(state._fs.read(BASE_STATE))
+
+
+def test_changes_under_lock_are_saved_once_on_release():
+    state = make_state(save_interval=60)
+    saves = state.save_info()["saves"]
+    events = []
+    state.set_on_state_change(events.append)
+
+    with state:
+        state.execution_status = ConversationExecutionStatus.RUNNING
+        state.agent_state = {"step": 1}
+        state.execution_status = ConversationExecutionStatus.FINISHED
+        # Nested acquisitions do not flush
+        with state:
+            state.agent_state = {"step": 2}
+        assert saved_state(state)["execution_status"] == "idle"
+
+    saved = saved_state(state)
+    assert saved["execution_status"] == "finished"
+    assert saved["agent_state"] == {"step": 2}
+    info = state.save_info()
+    assert info["saves"] == saves + 1
+    assert info["saves_avoided"] == 3
+    # State change callbacks are not delayed
+    assert len(events) == 4
+
+
+def test_changes_are_saved_when_window_elapses():
+    state = make_state(save_interval=0)
+
+    with state:
+        state.execution_status = ConversationExecutionStatus.RUNNING
+        assert saved_state(state)["execution_status"] == "running"
+
+
+def test_changes_without_lock_are_saved_immediately():
+    state = make_state(save_interval=60)
+
+    state.agent_state = {"key": "value"}
+
+    assert saved_state(state)["agent_state"] == {"key": "value"}
+
+
+@pytest.mark.parametrize("save_interval", [None, 60])
+def test_bytes_written_are_counted(save_interval):
+    state = make_state(save_interval=save_interval)
+    before = state.save_info()
+
+    with state:
+        state.agent_state = {"key": "value"}
+
+    after = state.save_info()
+    assert after["saves"] == before["saves"] + 1
+    assert after["bytes_written"] - before["bytes_written"] == len(
+        state._fs.read(BASE_STATE).encode("utf-8")
+    )
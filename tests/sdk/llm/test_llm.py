@@ -1,5 +1,7 @@
+import threading
 from unittest.mock import Mock, patch
 
+import litellm
 import pytest
 from litellm.exceptions import (
     RateLimitError,
@@ -255,6 +257,44 @@ def test_llm_completion_with_mock(mock_completion):
     mock_completion.assert_called_once()
 
 
+@patch("openhands.sdk.llm.llm.litellm_completion")
+def test_modify_params_is_scoped_to_each_call(mock_completion):
+    """Concurrent calls see their own modify_params; the global is untouched."""
+    barrier = threading.Barrier(2, timeout=5)
+    seen = {}
+
+    def side_effect(**kwargs):
+        # Both calls are inside their transport context at the same time
+        barrier.wait()
+        seen[kwargs["model"]] = litellm.modify_params
+        barrier.wait()
+        return create_mock_litellm_response("ok")
+
+    mock_completion.side_effect = side_effect
+    llms = [
+        LLM(
+            usage_id=f"test-{model}",
+            model=model,
+            api_key=SecretStr("test_key"),
+            modify_params=flag,
+        )
+        for model, flag in (("gpt-4o", True), ("gpt-4o-mini", False))
+    ]
+    messages = [Message(role="user", content=[TextContent(text="Hello")])]
+    global_value = litellm.modify_params
+
+    threads = [
+        threading.Thread(target=llm.completion, args=(messages,)) for llm in llms
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert seen == {"gpt-4o": True, "gpt-4o-mini": False}
+    assert litellm.modify_params == global_value
+
+
 @patch("openhands.sdk.llm.llm.litellm_completion")
 def test_llm_retry_on_rate_limit(mock_completion):
     """Test that LLM retries on rate limit errors."""
@@ -633,6 +673,31 @@ def test_llm_force_string_serializer_override():
     assert isinstance(formatted_cache[0]["content"], list)
 
 
+def test_format_messages_for_llm_does_not_modify_messages():
+    """Test that cache breakpoints are applied to copies of the marked messages."""
+    llm = LLM(
+        model="anthropic/claude-sonnet-4-20250514",
+        api_key=SecretStr("test_key"),
+        caching_prompt=True,
+        usage_id="test-caching",
+    )
+    messages = [
+        Message(role="system", content=[TextContent(text="System")]),
+        Message(role="user", content=[TextContent(text="Hello")]),
+        Message(role="assistant", content=[TextContent(text="Hi")]),
+    ]
+
+    formatted = llm.format_messages_for_llm(messages)
+
+    assert formatted[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert formatted[1]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in formatted[2]["content"][0]
+    assert all(
+        not content.cache_prompt for message in messages for content in message.content
+    )
+    assert llm.format_messages_for_llm(messages) == formatted
+
+
 def test_llm_caching_support(default_llm):
     """Test LLM prompt caching support detection."""
     llm = default_llm
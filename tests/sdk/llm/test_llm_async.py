@@ -0,0 +1,186 @@
+"""Tests for the async LLM paths (acompletion / aresponses)."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from litellm import CustomStreamWrapper
+from litellm.exceptions import APIConnectionError
+from litellm.types.llms.openai import ResponsesAPIResponse
+from litellm.types.utils import (
+    Choices,
+    Delta,
+    Message as LiteLLMMessage,
+    ModelResponse,
+    StreamingChoices,
+    Usage,
+)
+from pydantic import SecretStr
+
+from openhands.sdk.llm import LLM, FallbackStrategy, Message, TextContent
+from openhands.sdk.llm.exceptions import LLMServiceUnavailableError
+
+
+_MSGS = [Message(role="user", content=[TextContent(text="hi")])]
+
+
+def _response(content: str = "ok", model: str = "gpt-4o") -> ModelResponse:
+    return ModelResponse(
+        id="resp-1",
+        choices=[
+            Choices(
+                finish_reason="stop",
+                index=0,
+                message=LiteLLMMessage(content=content, role="assistant"),
+            )
+        ],
+        created=1,
+        model=model,
+        object="chat.completion",
+        usage=Usage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+    )
+
+
+def _llm(model: str = "gpt-4o", **kw) -> LLM:
+    return LLM(
+        model=model,
+        api_key=SecretStr("k"),
+        usage_id=f"test-{model}",
+        retry_min_wait=0,
+        retry_max_wait=0,
+        **kw,
+    )
+
+
+def _text(response) -> str:
+    content = response.message.content[0]
+    assert isinstance(content, TextContent)
+    return content.text
+
+
+@pytest.mark.asyncio
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_acompletion_returns_response_and_tracks_metrics(mock_acompletion):
+    mock_acompletion.return_value = _response("async ok")
+    llm = _llm()
+
+    response = await llm.acompletion(_MSGS)
+
+    assert _text(response) == "async ok"
+    assert mock_acompletion.await_count == 1
+    assert mock_acompletion.call_args.kwargs["messages"][0]["role"] == "user"
+    assert llm.metrics.accumulated_token_usage is not None
+    assert llm.metrics.accumulated_token_usage.prompt_tokens == 10
+
+
+@pytest.mark.asyncio
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_acompletion_retries_transient_errors(mock_acompletion):
+    mock_acompletion.side_effect = [
+        APIConnectionError(message="reset", llm_provider="openai", model="gpt-4o"),
+        _response("second try"),
+    ]
+    llm = _llm(num_retries=2)
+
+    response = await llm.acompletion(_MSGS)
+
+    assert _text(response) == "second try"
+    assert mock_acompletion.await_count == 2
+
+
+@pytest.mark.asyncio
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_acompletion_maps_errors_after_retries(mock_acompletion):
+    mock_acompletion.side_effect = APIConnectionError(
+        message="reset", llm_provider="openai", model="gpt-4o"
+    )
+    llm = _llm(num_retries=0)
+
+    with pytest.raises(LLMServiceUnavailableError):
+        await llm.acompletion(_MSGS)
+
+
+@pytest.mark.asyncio
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_acompletion_uses_fallback(mock_acompletion):
+    async def side_effect(**kwargs):
+        if kwargs["model"] == "gpt-4o":
+            raise APIConnectionError(
+                message="down", llm_provider="openai", model="gpt-4o"
+            )
+        return _response("fallback ok", model="fallback-model")
+
+    mock_acompletion.side_effect = side_effect
+    fallback = _llm("fallback-model", num_retries=0)
+    primary = _llm(
+        num_retries=0,
+        fallback_strategy=FallbackStrategy(fallback_llms=["fallback-profile"]),
+    )
+    assert primary.fallback_strategy is not None
+    primary.fallback_strategy._resolved = [fallback]
+
+    response = await primary.acompletion(_MSGS)
+
+    assert _text(response) == "fallback ok"
+    assert fallback.fallback_strategy is None
+
+
+@pytest.mark.asyncio
+@patch("openhands.sdk.llm.llm.litellm.stream_chunk_builder")
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_acompletion_streams_chunks(mock_acompletion, mock_stream_builder):
+    chunks = [
+        ModelResponse(
+            id="chatcmpl-test",
+            choices=[
+                StreamingChoices(
+                    finish_reason=None,
+                    index=0,
+                    delta=Delta(content=text, role="assistant"),
+                )
+            ],
+            created=1,
+            model="gpt-4o",
+            object="chat.completion.chunk",
+        )
+        for text in ("Hello", " world!")
+    ]
+    stream = MagicMock(spec=CustomStreamWrapper)
+    stream.__aiter__.return_value = chunks
+    mock_acompletion.return_value = stream
+    mock_stream_builder.return_value = _response("Hello world!")
+    received = []
+
+    response = await _llm().acompletion(_MSGS, stream=True, on_token=received.append)
+
+    assert received == chunks
+    assert _text(response) == "Hello world!"
+
+
+@pytest.mark.asyncio
+@patch("openhands.sdk.llm.llm.litellm_aresponses", new_callable=AsyncMock)
+async def test_aresponses_returns_response(mock_aresponses):
+    mock_aresponses.return_value = ResponsesAPIResponse(
+        id="resp-1",
+        created_at=1,
+        model="gpt-4o",
+        object="response",
+        output=[
+            {
+                "type": "message",
+                "id": "msg-1",
+                "role": "assistant",
+                "status": "completed",
+                "content": [
+                    {"type": "output_text", "text": "async ok", "annotations": []}
+                ],
+            }
+        ],
+        parallel_tool_calls=False,
+        tool_choice="auto",
+        tools=[],
+    )
+
+    response = await _llm().aresponses(_MSGS)
+
+    assert _text(response) == "async ok"
+    assert mock_aresponses.call_args.kwargs["model"] == "gpt-4o"
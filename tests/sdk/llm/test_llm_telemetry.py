@@ -946,3 +946,84 @@ class TestTelemetryCallbacks:
         # Should not raise exception even if callback fails
         metrics = basic_telemetry.on_response(mock_response)
         assert isinstance(metrics, Metrics)
+
+
+class TestTelemetryPromptCache:
+    """Test prompt-prefix stability and cache-hit tracking."""
+
+    SYSTEM = {
+        "role": "system",
+        "content": [
+            {"type": "text", "text": "sys", "cache_control": {"type": "ephemeral"}}
+        ],
+    }
+
+    @staticmethod
+    def _user(text, cached=False):
+        block = {"type": "text", "text": text}
+        if cached:
+            block["cache_control"] = {"type": "ephemeral"}
+        return {"role": "user", "content": [block]}
+
+    @staticmethod
+    def _respond(telemetry, response_id, cache_read=0):
+        usage = Usage(prompt_tokens=100, completion_tokens=10, total_tokens=110)
+        if cache_read:
+            details = MagicMock()
+            details.cached_tokens = cache_read
+            usage.prompt_tokens_details = details
+        telemetry.on_request(None)
+        with patch.object(telemetry, "_compute_cost", return_value=None):
+            telemetry.on_response(
+                ModelResponse(id=response_id, choices=[], usage=usage)
+            )
+
+    def test_extended_prompt_keeps_prefix(self, basic_telemetry):
+        first = [self.SYSTEM, self._user("a", cached=True)]
+        basic_telemetry.on_prompt(first)
+        self._respond(basic_telemetry, "r1")
+        # The breakpoint moves to the new last message
+        second = [self.SYSTEM, self._user("a"), self._user("b", cached=True)]
+        basic_telemetry.on_prompt(second)
+        self._respond(basic_telemetry, "r2", cache_read=80)
+
+        stats = basic_telemetry.prompt_cache_stats
+        assert stats.calls == 2
+        assert stats.prefix_breaks == 0
+        assert stats.cache_read_tokens == 80
+        assert stats.cache_hit_rate == pytest.approx(0.4)
+        call1, call2 = stats.recent_calls
+        assert call2.response_id == "r2"
+        assert call2.first_divergence is None
+        assert set(call2.breakpoint_hashes) == {0, 2}
+        assert call2.breakpoint_hashes[0] == call1.breakpoint_hashes[0]
+        assert call2.breakpoint_hashes[2] != call1.breakpoint_hashes[1]
+
+    def test_changed_message_reports_first_divergence(self, basic_telemetry):
+        basic_telemetry.on_prompt([self.SYSTEM, self._user("a"), self._user("b")])
+        self._respond(basic_telemetry, "r1")
+        basic_telemetry.on_prompt([self.SYSTEM, self._user("x"), self._user("b")])
+        self._respond(basic_telemetry, "r2")
+
+        stats = basic_telemetry.prompt_cache_stats
+        assert stats.prefix_breaks == 1
+        assert stats.break_indices == {1: 1}
+        assert stats.recent_calls[-1].first_divergence == 1
+
+    def test_changed_tools_invalidate_whole_prefix(self, basic_telemetry):
+        messages = [self.SYSTEM, self._user("a")]
+        basic_telemetry.on_prompt(messages, tools=[{"name": "t1"}])
+        basic_telemetry.on_prompt(messages, tools=[{"name": "t2"}])
+        self._respond(basic_telemetry, "r1")
+
+        (call,) = basic_telemetry.prompt_cache_stats.recent_calls
+        assert call.tools_changed
+        assert call.first_divergence == 0
+
+    def test_stats_are_a_copy(self, basic_telemetry):
+        basic_telemetry.on_prompt([self.SYSTEM])
+        self._respond(basic_telemetry, "r1")
+
+        basic_telemetry.prompt_cache_stats.recent_calls.clear()
+        assert basic_telemetry.prompt_cache_stats.calls == 1
+        assert len(basic_telemetry.prompt_cache_stats.recent_calls) == 1
@@ -599,3 +599,32 @@ def test_text_content_both_old_and_new_format_in_sequence():
     assert loaded_contents[2].cache_prompt is True
     assert loaded_contents[3].text == "New event 2"
     assert loaded_contents[3].cache_prompt is True
+
+
+def test_to_chat_dict_is_memoized_until_message_changes():
+    """Test that serialization is reused until the message is modified."""
+    from openhands.sdk.llm.message import Message, TextContent
+
+    message = Message(
+        role="tool",
+        content=[TextContent(text="output")],
+        name="terminal",
+        tool_call_id="call_1",
+    )
+
+    with patch.object(
+        Message, "_list_serializer", wraps=message._list_serializer
+    ) as serializer:
+        opts = {**DEFAULT_SERIALIZATION_OPTS, "cache_enabled": True}
+        first = message.to_chat_dict(**opts)
+        first["content"].append({"type": "text", "text": "caller change"})
+        second = message.to_chat_dict(**opts)
+        assert serializer.call_count == 1
+        assert second["content"] == [{"type": "text", "text": "output"}]
+
+        # Re-flagging a block for caching, or assigning a field, re-serializes
+        message.content[0].cache_prompt = True
+        assert message.to_chat_dict(**opts)["cache_control"] == {"type": "ephemeral"}
+        message.content = [TextContent(text="new output")]
+        assert message.to_chat_dict(**opts)["content"][0]["text"] == "new output"
+        assert serializer.call_count == 3
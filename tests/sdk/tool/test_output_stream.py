@@ -0,0 +1,81 @@
+"""Tests for live tool output streams."""
+
+from openhands.sdk.tool import (
+    ToolOutputStream,
+    get_tool_output_stream,
+    streaming_tool_output,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _stream(chunks, clock, **kwargs) -> ToolOutputStream:
+    def on_chunk(output: str, sequence: int, dropped: int) -> None:
+        chunks.append((output, sequence, dropped))
+
+    return ToolOutputStream(on_chunk, clock=clock, **kwargs)
+
+
+def test_writes_are_rate_limited():
+    chunks = []
+    clock = FakeClock()
+    stream = _stream(chunks, clock, min_interval=1.0)
+
+    stream.write("a")
+    stream.write("b")
+    clock.now = 0.5
+    stream.write("c")
+    assert chunks == [("a", 0, 0)]
+
+    # An empty write publishes output that became due
+    clock.now = 1.0
+    stream.write("")
+    assert chunks == [("a", 0, 0), ("bc", 1, 0)]
+    assert stream.chunks_emitted == 2
+
+
+def test_pending_output_is_capped_to_the_newest_chars():
+    chunks = []
+    clock = FakeClock()
+    stream = _stream(chunks, clock, min_interval=1.0, max_chunk_chars=4)
+
+    stream.write("abc")
+    for i in range(10):
+        stream.write(f"{i}")
+    stream.flush()
+
+    assert chunks[0] == ("abc", 0, 0)
+    assert chunks[1] == ("6789", 1, 6)
+
+
+def test_mask_is_applied_to_each_chunk():
+    chunks = []
+    stream = _stream(
+        chunks, FakeClock(), mask=lambda text: text.replace("s3cret", "<hidden>")
+    )
+
+    stream.write("token=s3cret\n")
+
+    assert chunks == [("token=<hidden>\n", 0, 0)]
+
+
+def test_streaming_binds_the_stream_and_flushes_on_exit():
+    chunks = []
+    clock = FakeClock()
+    stream = _stream(chunks, clock)
+
+    assert get_tool_output_stream() is None
+    with streaming_tool_output(stream):
+        current = get_tool_output_stream()
+        assert current is stream
+        current.write("one")
+        current.write("two")
+        assert chunks == [("one", 0, 0)]
+    assert get_tool_output_stream() is None
+    assert chunks == [("one", 0, 0), ("two", 1, 0)]
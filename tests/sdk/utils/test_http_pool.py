@@ -0,0 +1,107 @@
+"""Tests for the shared HTTP connection pool registry."""
+
+import httpx
+import pytest
+
+from openhands.sdk.utils.http_pool import HTTPPoolConfig, HTTPPoolRegistry
+
+
+class RecordingTransport(httpx.MockTransport):
+    def __init__(self, config: HTTPPoolConfig):
+        super().__init__(lambda request: httpx.Response(200, json={"ok": True}))
+        self.config = config
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class AsyncRecordingTransport(httpx.MockTransport):
+    def __init__(self, config: HTTPPoolConfig):
+        super().__init__(lambda request: httpx.Response(200, json={"ok": True}))
+        self.config = config
+
+
+@pytest.fixture
+def created():
+    return []
+
+
+@pytest.fixture
+def registry(created):
+    def factory(config):
+        transport = RecordingTransport(config)
+        created.append(transport)
+        return transport
+
+    return HTTPPoolRegistry(
+        transport_factory=factory, async_transport_factory=AsyncRecordingTransport
+    )
+
+
+def test_clients_share_pools_per_origin_and_credentials(registry, created):
+    first = registry.client(headers={"Authorization": "Bearer a"})
+    second = registry.client(headers={"Authorization": "Bearer a"})
+    other_key = registry.client(headers={"Authorization": "Bearer b"})
+
+    first.get("https://api.example.com/v1/models")
+    second.post("https://api.example.com/v1/chat")
+    other_key.get("https://api.example.com/v1/models")
+    first.get("https://other.example.com:8443/")
+
+    assert len(created) == 3
+    stats = registry.stats()
+    requests = {(s.origin, s.credentials): s.requests for s in stats}
+    key_a = next(
+        s.credentials for s in stats if s.origin == "https://other.example.com:8443"
+    )
+    assert requests[("https://api.example.com", key_a)] == 2
+    assert requests[("https://other.example.com:8443", key_a)] == 1
+    assert len(requests) == 3
+
+
+def test_credentials_are_hashed_not_stored(registry):
+    registry.client(headers={"x-api-key": "secret-value"}).get("https://a.test/")
+
+    (stats,) = registry.stats()
+    assert "secret-value" not in stats.model_dump_json()
+    assert len(stats.credentials) == 12
+
+
+def test_closing_a_client_keeps_the_pool_open(registry, created):
+    client = registry.client()
+    client.get("https://a.test/")
+    client.close()
+
+    registry.client().get("https://a.test/")
+
+    assert len(created) == 1
+    assert not created[0].closed
+
+
+def test_configure_applies_to_new_pools_and_close_releases(registry, created):
+    registry.client().get("https://a.test/")
+    registry.configure(HTTPPoolConfig(max_connections=5, http2=True))
+    registry.client().get("https://b.test/")
+
+    assert created[0].config.max_connections == 100
+    assert created[1].config.max_connections == 5
+    assert created[1].config.http2
+
+    registry.close()
+    assert all(t.closed for t in created)
+    assert registry.stats() == []
+
+
+@pytest.mark.asyncio
+async def test_async_clients_share_pools(registry):
+    async with registry.async_client() as client:
+        await client.get("https://a.test/")
+    async with registry.async_client() as client:
+        response = await client.get("https://a.test/")
+
+    assert response.json() == {"ok": True}
+    (stats,) = registry.stats()
+    assert stats.origin == "https://a.test"
+    assert stats.credentials == ""
+    assert stats.requests == 2
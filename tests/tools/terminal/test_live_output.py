@@ -0,0 +1,48 @@
+"""Tests for live terminal output published while a command runs."""
+
+from openhands.sdk.tool import ToolOutputStream, streaming_tool_output
+from openhands.tools.terminal.constants import CMD_OUTPUT_PS1_BEGIN, CMD_OUTPUT_PS1_END
+from openhands.tools.terminal.definition import TerminalAction
+from openhands.tools.terminal.terminal import create_terminal_session
+from openhands.tools.terminal.terminal.terminal_session import _split_live_output
+
+
+PROMPT = f'{CMD_OUTPUT_PS1_BEGIN}{{"exit_code": "0"}}{CMD_OUTPUT_PS1_END}\n'
+
+
+def test_split_live_output_hides_prompts():
+    assert _split_live_output(f"out\n{PROMPT}more\n") == ("out\n\n\nmore\n", "")
+
+    # An incomplete prompt is held back until the rest arrives
+    partial = PROMPT[:20]
+    visible, held = _split_live_output(f"out\n{partial}")
+    assert (visible, held) == ("out\n\n", partial.lstrip("\n"))
+    visible, held = _split_live_output(held + PROMPT[20:] + "next")
+    assert (visible, held) == ("\nnext", "")
+
+    # So is what may be the start of the begin marker
+    assert _split_live_output("out\n###PS") == ("out\n", "###PS")
+
+
+def test_session_streams_command_output(tmp_path):
+    session = create_terminal_session(
+        work_dir=str(tmp_path), terminal_type="subprocess"
+    )
+    session.initialize()
+    chunks = []
+    stream = ToolOutputStream(
+        lambda output, sequence, dropped: chunks.append(output), min_interval=0
+    )
+    try:
+        with streaming_tool_output(stream):
+            obs = session.execute(
+                TerminalAction(command="for i in 1 2 3; do echo line-$i; done")
+            )
+    finally:
+        session.close()
+
+    assert obs.metadata.exit_code == 0
+    streamed = "".join(chunks)
+    for i in (1, 2, 3):
+        assert f"line-{i}" in streamed
+    assert "###PS1JSON###" not in streamed
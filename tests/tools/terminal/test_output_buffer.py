@@ -0,0 +1,77 @@
+"""Tests for the offset-addressed terminal output buffer."""
+
+import time
+
+from openhands.tools.terminal.terminal import SubprocessTerminal
+from openhands.tools.terminal.terminal.output_buffer import TerminalOutputBuffer
+
+
+def test_read_since_returns_only_new_output():
+    buffer = TerminalOutputBuffer()
+    buffer.append("first line\npart")
+    text, offset = buffer.read_since(0)
+    assert text == "first line\npart"
+
+    buffer.append("ial\nsecond line\n")
+    text, offset = buffer.read_since(offset)
+    assert text == "ial\nsecond line\n"
+
+    assert buffer.read_since(offset) == ("", offset)
+
+
+def test_every_offset_reads_the_matching_suffix():
+    buffer = TerminalOutputBuffer(max_line_chars=4)
+    stream = "ab\ncdefghij\n\nxyz"
+    for chunk in ("ab", "\ncd", "efghij\n", "\nxyz"):
+        buffer.append(chunk)
+
+    for offset in range(len(stream) + 1):
+        assert buffer.read_since(offset) == (stream[offset:], len(stream))
+
+
+def test_memory_is_bounded_and_offsets_stay_absolute():
+    buffer = TerminalOutputBuffer(max_lines=10, max_chars=50, max_line_chars=8)
+    for i in range(1000):
+        buffer.append(f"line {i}\n")
+    # A single huge line without newlines is stored in capped pieces
+    buffer.append("x" * 10_000)
+
+    assert len(buffer) <= 50
+    assert buffer.end == sum(len(f"line {i}\n") for i in range(1000)) + 10_000
+    # An evicted offset reads from the oldest retained output
+    text, end = buffer.read_since(0)
+    assert end == buffer.end
+    assert text == "x" * len(buffer)
+
+
+def test_discard_before_keeps_offsets_of_remaining_output():
+    buffer = TerminalOutputBuffer()
+    buffer.append("old output\nPROMPT\n")
+    prompt_offset = buffer.text().index("PROMPT")
+    buffer.discard_before(prompt_offset)
+
+    assert buffer.text() == "PROMPT\n"
+    assert buffer.start == prompt_offset
+    buffer.append("new\n")
+    assert buffer.read_since(prompt_offset + len("PROMPT\n")) == ("new\n", buffer.end)
+
+
+def test_subprocess_terminal_reads_deltas(tmp_path):
+    terminal = SubprocessTerminal(work_dir=str(tmp_path))
+    terminal.initialize()
+    try:
+        assert terminal.supports_read_since
+        start = offset = terminal.output_offset
+        terminal.send_keys("echo delta-$((20 + 22))")
+
+        seen = ""
+        deadline = time.monotonic() + 5
+        while "delta-42" not in seen and time.monotonic() < deadline:
+            text, offset = terminal.read_since(offset)
+            seen += text
+            time.sleep(0.05)
+
+        assert "delta-42" in seen
+        assert offset > start
+    finally:
+        terminal.close()
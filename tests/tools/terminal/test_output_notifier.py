@@ -0,0 +1,75 @@
+"""Tests for the terminal output notifier used for event-driven completion."""
+
+import threading
+import time
+
+from openhands.tools.terminal.constants import CMD_OUTPUT_PS1_END, POLL_INTERVAL
+from openhands.tools.terminal.definition import TerminalAction
+from openhands.tools.terminal.terminal import create_terminal_session
+from openhands.tools.terminal.terminal.output_notifier import OutputNotifier
+
+
+MARKER = CMD_OUTPUT_PS1_END.strip()
+
+
+def test_new_output_is_tracked_relative_to_last_read():
+    notifier = OutputNotifier()
+    # Nothing fed yet: the feed is not known to work, so callers keep reading
+    assert notifier.has_new_output()
+
+    notifier.feed("hello\n")
+    notifier.mark_read()
+    assert not notifier.has_new_output()
+
+    notifier.feed("world\n")
+    assert notifier.has_new_output()
+
+
+def test_wait_for_prompt_times_out_without_marker():
+    notifier = OutputNotifier()
+    notifier.feed("building...\n")
+
+    assert notifier.wait_for_prompt(0.05) is False
+
+
+def test_wait_for_prompt_wakes_on_marker_split_across_chunks():
+    notifier = OutputNotifier()
+    notifier.mark_read()
+
+    def print_prompt():
+        time.sleep(0.05)
+        notifier.feed(f"done\n{MARKER[:5]}")
+        notifier.feed(f"{MARKER[5:]}\n$ ")
+
+    threading.Thread(target=print_prompt).start()
+    start = time.monotonic()
+    assert notifier.wait_for_prompt(5) is True
+    assert time.monotonic() - start < 1
+
+
+def test_prompt_printed_before_wait_is_not_missed():
+    notifier = OutputNotifier()
+    notifier.mark_read()
+    notifier.feed(f"{MARKER}\n")
+
+    assert notifier.wait_for_prompt(0) is True
+    notifier.mark_read()
+    assert notifier.wait_for_prompt(0) is False
+
+
+def test_short_command_completes_without_poll_delay(tmp_path):
+    session = create_terminal_session(
+        work_dir=str(tmp_path), terminal_type="subprocess"
+    )
+    session.initialize()
+    try:
+        session.execute(TerminalAction(command="true"))
+
+        start = time.monotonic()
+        obs = session.execute(TerminalAction(command="echo hi"))
+        elapsed = time.monotonic() - start
+
+        assert "hi" in obs.text
+        assert elapsed < POLL_INTERVAL
+    finally:
+        session.close()
@@ -0,0 +1,68 @@
+"""Tests for the pool of pre-warmed terminal sessions."""
+
+import os
+import re
+
+import pytest
+
+from openhands.tools.terminal.definition import TerminalAction
+from openhands.tools.terminal.terminal import TerminalSessionPool
+
+
+@pytest.fixture
+def pool():
+    pool = TerminalSessionPool(size=1)
+    yield pool
+    pool.close()
+
+
+def test_disabled_pool_hands_out_nothing(tmp_path):
+    pool = TerminalSessionPool(size=0)
+
+    assert not pool.prewarm(terminal_type="subprocess", timeout=1)
+    assert pool.checkout(str(tmp_path), terminal_type="subprocess") is None
+
+
+def test_checkout_resets_cwd_env_and_output(pool, tmp_path, monkeypatch):
+    monkeypatch.setenv("POOL_TEST_REMOVED", "old")
+    assert pool.prewarm(terminal_type="subprocess", timeout=30)
+    monkeypatch.delenv("POOL_TEST_REMOVED")
+    monkeypatch.setenv("POOL_TEST_ADDED", "it's new")
+
+    session = pool.checkout(
+        str(tmp_path), no_change_timeout_seconds=7, terminal_type="subprocess"
+    )
+    assert session is not None
+    try:
+        assert session.work_dir == str(tmp_path)
+        assert session.no_change_timeout_seconds == 7
+        # Nothing from warming up or resetting the shell is left on screen
+        assert "history -c" not in session.terminal.read_screen()
+
+        obs = session.execute(
+            TerminalAction(
+                command='pwd; echo "added=$POOL_TEST_ADDED removed=$POOL_TEST_REMOVED"'
+            )
+        )
+        assert obs.metadata.exit_code == 0
+        assert os.path.realpath(str(tmp_path)) in {
+            os.path.realpath(line.strip()) for line in obs.text.splitlines()
+        }
+        assert re.search(r"^added=it's new removed=$", obs.text, re.MULTILINE)
+    finally:
+        session.close()
+
+    # The checked-out session is replaced, not returned
+    assert pool.prewarm(terminal_type="subprocess", timeout=30)
+    assert pool.idle_count(terminal_type="subprocess") == 1
+    assert (pool.hits, pool.misses) == (1, 0)
+
+
+def test_shrinking_the_pool_closes_idle_sessions(pool):
+    assert pool.prewarm(terminal_type="subprocess", timeout=30)
+    (pooled,) = pool._idle[("subprocess", None, None)]
+
+    pool.configure(0)
+
+    assert pool.idle_count(terminal_type="subprocess") == 0
+    assert pooled.session._closed
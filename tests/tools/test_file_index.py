@@ -0,0 +1,128 @@
+"""Tests for the in-memory workspace file index behind glob and grep."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from openhands.tools.grep import GrepAction
+from openhands.tools.grep.impl import GrepExecutor
+from openhands.tools.utils.file_index import (
+    FileIndex,
+    FileIndexTooLargeError,
+    compile_glob,
+    get_file_index,
+)
+
+
+def _write(root: Path, files: dict[str, str]) -> None:
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+def _listed(index: FileIndex, subdir: str = "", pattern: str | None = None):
+    matcher = compile_glob(pattern) if pattern else None
+    return sorted(
+        os.path.relpath(path, index.root)
+        for path in index.iter_files(subdir, matcher)
+    )
+
+
+@pytest.mark.parametrize(
+    "pattern,path,expected",
+    [
+        ("*.py", "a/b/c.py", True),
+        ("src/*.py", "src/c.py", True),
+        ("src/*.py", "lib/src/c.py", False),
+        ("**/test_*.py", "test_a.py", True),
+        ("src/**", "src/a/b.txt", True),
+        ("*.{js,ts}", "web/app.ts", True),
+        ("[!a]*.py", "abc.py", False),
+    ],
+)
+def test_compile_glob_follows_ripgrep_semantics(pattern, path, expected):
+    assert bool(compile_glob(pattern).fullmatch(path)) is expected
+
+
+def test_index_skips_hidden_and_ignored_files(tmp_path):
+    _write(
+        tmp_path,
+        {
+            ".gitignore": "build/\n*.log\n!keep.log\n",
+            "app.py": "",
+            "debug.log": "",
+            "keep.log": "",
+            "build/out.py": "",
+            ".env": "",
+            ".cache/c.py": "",
+            "src/.gitignore": "/generated\n",
+            "src/lib.py": "",
+            "src/generated/api.py": "",
+        },
+    )
+    index = FileIndex(tmp_path)
+    index.refresh()
+
+    assert _listed(index) == ["app.py", "keep.log", "src/lib.py"]
+    assert _listed(index, "src", "*.py") == ["src/lib.py"]
+
+
+def test_refresh_only_rescans_changed_directories(tmp_path):
+    _write(tmp_path, {"a/one.py": "", "b/two.py": "", "c/three.py": ""})
+    index = FileIndex(tmp_path)
+    index.refresh()
+    assert index.dirs_scanned == 4
+
+    index.refresh()
+    assert index.dirs_scanned == 4
+
+    # Bump the directory mtime explicitly; its resolution may be coarse
+    (tmp_path / "b" / "new.py").write_text("")
+    stat = os.stat(tmp_path / "b")
+    os.utime(tmp_path / "b", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    index.refresh()
+    assert index.dirs_scanned == 5
+    assert "b/new.py" in _listed(index)
+
+    # A changed .gitignore re-evaluates the directories below it
+    (tmp_path / ".gitignore").write_text("a/\n")
+    index.refresh()
+    assert _listed(index) == ["b/new.py", "b/two.py", "c/three.py"]
+
+
+def test_index_refuses_directories_over_the_limit(tmp_path):
+    _write(tmp_path, {f"f{i}.txt": "" for i in range(3)})
+
+    with pytest.raises(FileIndexTooLargeError):
+        FileIndex(tmp_path, max_files=2).refresh()
+
+
+def test_subdirectories_reuse_the_workspace_index(tmp_path):
+    _write(tmp_path, {"src/a.py": "", "docs/b.md": ""})
+    root = tmp_path.resolve()
+
+    index, subdir = get_file_index(root)
+    sub_index, sub_subdir = get_file_index(root / "src")
+
+    assert (sub_index, subdir, sub_subdir) == (index, "", "src")
+
+
+def test_grep_searches_newest_files_first_and_stops_at_the_limit(tmp_path):
+    now = time.time()
+    for i in range(300):
+        path = tmp_path / f"file{i:03d}.py"
+        path.write_text("needle" if i % 2 else "hay")
+        os.utime(path, (now - i, now - i))
+
+    executor = GrepExecutor(working_dir=str(tmp_path))
+    executor._ripgrep_available = False
+    observation = executor(GrepAction(pattern="NEEDLE", include="*.py"))
+
+    assert observation.is_error is False
+    assert observation.truncated is True
+    assert [Path(m).name for m in observation.matches] == [
+        f"file{i:03d}.py" for i in range(1, 200, 2)
+    ]